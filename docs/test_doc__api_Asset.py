@@ -0,0 +1,229 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+Asset
+=====
+
+Base class: :doc:`Fragment`
+
+"""
+def test_base():
+    # language=rst
+    """
+Class that describes an asset in iommi. Assets are meant to be the elements that you refer
+to in the HEAD of your document such as links to scripts, style sheets as well as
+inline scripts or css. But if necessary you can specify an arbitrary django template.
+
+Every :doc:`Part` can include the assets it needs. Similarly :doc:`Style` can include assets.
+When a part is rendered all assets are included in the head of the document.
+
+Because assets have names (:doc:`Everything has a name <philosophy>`), assets with the same name will overwrite
+each other, resulting in only one asset with a given name being rendered.
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+`after`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `int | str`
+
+    See :ref:`after <after>`
+
+
+`assets`
+^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`assets <assets>`
+
+
+`attrs`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Attrs`
+
+    See :ref:`attributes <attributes>`
+
+
+`cache`
+^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`children`
+^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`custom-assets`
+
+
+`conditional_get`
+^^^^^^^^^^^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`endpoints`
+^^^^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`endpoints <endpoints>`
+
+
+`extra`
+^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_evaluated`
+^^^^^^^^^^^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_params`
+^^^^^^^^^^^^^^
+
+    See :ref:`extra_params <extra_params>`
+
+
+`in_body`
+^^^^^^^^^
+
+Type: `bool`
+
+
+Cookbook:
+    :ref:`custom-assets`
+
+
+`include`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+    See :ref:`include <include>`
+
+
+`iommi_style`
+^^^^^^^^^^^^^
+
+Type: `str | Style | None`
+
+    See :ref:`iommi_style <iommi_style>`
+
+
+`tag`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+    See :ref:`tag <tag>`
+
+
+`template`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str | Template`
+
+    See :ref:`template <template>`
+
+
+Shortcuts
+---------
+
+`Asset.css`
+^^^^^^^^^^^
+
+To use this shortcut, pass `attrs__href='/my_url_to_the.css'`
+
+Examples:
+
+    """
+
+    Asset.css(
+        attrs__href='https://stackpath.bootstrapcdn.com/bootstrap/4.4.1/css/bootstrap.min.css',
+        attrs__integrity='sha384-Vkoo8x4CGsO3+Hhxv8T/Q5PaXtkKtu6ug5TOeNV6gBiFeWPGFN9MuhOf23Q9Ifjh',
+        attrs__crossorigin='anonymous',
+    )
+
+    Asset.css('p { font-size: 18pt; }')
+    # language=rst
+    """
+
+
+
+Defaults
+++++++++
+
+* `tag`
+    * `link`
+* `attrs__rel`
+    * `stylesheet`
+
+`Asset.js`
+^^^^^^^^^^
+
+To use this shortcut, pass `attrs__src='/my_url_to_the.js'`
+
+Examples:
+
+    """
+
+    Asset.js(
+        attrs__src='https://cdn.jsdelivr.net/npm/select2@4.0.12/dist/js/select2.min.js',
+    )
+
+    Asset.js('window.foo = bar')
+    # language=rst
+    """
+
+
+
+Defaults
+++++++++
+
+* `tag`
+    * `script`
+
+    """
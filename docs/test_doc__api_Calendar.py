@@ -0,0 +1,440 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+Calendar
+========
+
+Base class: :doc:`Part`
+
+"""
+def test_base():
+    # language=rst
+    """
+A calendar component that renders a month-grid calendar.
+
+.. note::
+
+    This component is experimental. The API may change in future versions.
+
+Example:
+
+    """
+
+    # @test
+    from django.utils.html import format_html
+    from conftest import really_big_discography
+    really_big_discography.__pytest_wrapped__.obj()
+    # @end
+
+    calendar = Calendar(
+        auto__model=Album,
+        event__attr='published_date',
+        event__display_name=lambda event, **_: format_html(
+            '<img src="/_static/album_art/{}/{}.jpg" width="30" height="30" title="{}">',
+            event.artist,
+             event.name,
+             event.name
+        ),
+        event__tag=None,
+        year=1983,
+        month=8,
+    )
+
+    # @test
+    show_output(calendar)
+    # @end
+    # language=rst
+    """
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+`actions`
+^^^^^^^^^
+
+Type: `dict[str, Action]`
+
+
+Cookbook:
+    :ref:`calendar-navigation`
+
+
+`after`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `int | str`
+
+    See :ref:`after <after>`
+
+
+`assets`
+^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`assets <assets>`
+
+
+`attrs`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Attrs`
+
+    See :ref:`attributes <attributes>`
+
+
+`auto`
+^^^^^^
+
+Type: `CalendarAutoConfig`
+
+    See :ref:`auto <auto>`
+
+
+`cache`
+^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`conditional_get`
+^^^^^^^^^^^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`day`
+^^^^^
+
+Type: `CalendarCellConfig`
+
+
+Cookbook:
+    :ref:`calendar-cell-styling`
+
+
+`day_number`
+^^^^^^^^^^^^
+
+Type: `CalendarCellConfig`
+
+
+Cookbook:
+    :ref:`calendar-cell-styling`
+
+
+`endpoints`
+^^^^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`endpoints <endpoints>`
+
+
+`event`
+^^^^^^^
+
+Type: `CalendarCellConfig`
+
+
+Cookbook:
+    :ref:`calendar-from-model`
+
+    :ref:`calendar-performance`
+
+
+`extra`
+^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_evaluated`
+^^^^^^^^^^^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_params`
+^^^^^^^^^^^^^^
+
+    See :ref:`extra_params <extra_params>`
+
+
+`h_tag`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `Fragment | str`
+
+    See :ref:`title <title>`
+
+
+`include`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+    See :ref:`include <include>`
+
+
+`iommi_style`
+^^^^^^^^^^^^^
+
+Type: `str | Style | None`
+
+    See :ref:`iommi_style <iommi_style>`
+
+
+`model`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `type[Model]`
+
+
+Cookbook:
+    :ref:`calendar-from-model`
+
+
+`month`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `int`
+
+
+Cookbook:
+    :ref:`calendar-from-model`
+
+
+`navigation`
+^^^^^^^^^^^^
+
+Type: `Namespace`
+
+
+Cookbook:
+    :ref:`calendar-navigation`
+
+
+`other_month`
+^^^^^^^^^^^^^
+
+Type: `CalendarCellConfig`
+
+
+Cookbook:
+    :ref:`calendar-cell-styling`
+
+
+`rows`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`calendar-from-model`
+
+
+`tag`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+Default: `table`
+    See :ref:`tag <tag>`
+
+
+`template`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str | Template`
+
+Default: `iommi/calendar/calendar.html`
+    See :ref:`template <template>`
+
+
+`title`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str | None`
+
+    See :ref:`title <title>`
+
+
+`today`
+^^^^^^^
+
+Type: `CalendarCellConfig`
+
+
+Cookbook:
+    :ref:`calendar-cell-styling`
+
+
+`weekday`
+^^^^^^^^^
+
+Type: `CalendarCellConfig`
+
+
+Cookbook:
+    :ref:`calendar-cell-styling`
+
+
+`weekend`
+^^^^^^^^^
+
+Type: `CalendarCellConfig`
+
+
+Cookbook:
+    :ref:`calendar-cell-styling`
+
+
+`year`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `int`
+
+
+Cookbook:
+    :ref:`calendar-from-model`
+
+
+Methods
+-------
+
+`as_view`
+^^^^^^^^^
+
+`days_for_month`
+^^^^^^^^^^^^^^^^
+
+
+Generate CalendarDay instances for each day in the calendar grid.
+
+
+`get_data_bounds`
+^^^^^^^^^^^^^^^^^
+
+
+
+Return a `Struct` with the dates of the `first` and `last` event, the
+`prev` event before the current month and the `next` event after it.
+Each is `None` if there is no such event. For a `QuerySet` this is one
+aggregate query, done at most once per bind.
+
+
+
+`get_first_month_with_data`
+^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+
+Return (year, month) of the earliest month that has data, or None.
+
+
+`get_first_with_data_url`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`get_last_month_with_data`
+^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+
+Return (year, month) of the latest month that has data, or None.
+
+
+`get_last_with_data_url`
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+`get_month_name`
+^^^^^^^^^^^^^^^^
+
+`get_next_month`
+^^^^^^^^^^^^^^^^
+
+`get_next_month_with_data`
+^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+
+Return (year, month) of the closest later month that has data, or None.
+
+
+`get_next_url`
+^^^^^^^^^^^^^^
+
+`get_next_with_data_url`
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+`get_prev_month`
+^^^^^^^^^^^^^^^^
+
+`get_prev_month_with_data`
+^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+
+Return (year, month) of the closest earlier month that has data, or None.
+
+
+`get_prev_url`
+^^^^^^^^^^^^^^
+
+`get_prev_with_data_url`
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+`get_today_url`
+^^^^^^^^^^^^^^^
+
+`get_weekday_names`
+^^^^^^^^^^^^^^^^^^^
+
+`on_bind`
+^^^^^^^^^
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`weeks_for_month`
+^^^^^^^^^^^^^^^^^
+
+
+Generate weeks (lists of 7 CalendarDay instances) for the calendar grid.
+
+
+    """
@@ -0,0 +1,72 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+Cell
+====
+
+Base class: `CellConfig`
+
+"""
+def test_base():
+    # language=rst
+    """
+    """
+
+    # language=rst
+    """
+
+Constructor arguments
++++++++++++++++++++++
+
+* `cells`
+* `column`
+* `kwargs`
+
+Methods
+-------
+
+`get_context`
+^^^^^^^^^^^^^
+
+`get_request`
+^^^^^^^^^^^^^
+
+`iommi_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`render_cell_contents`
+^^^^^^^^^^^^^^^^^^^^^^
+
+`render_formatted`
+^^^^^^^^^^^^^^^^^^
+
+`write_html`
+^^^^^^^^^^^^
+
+    """
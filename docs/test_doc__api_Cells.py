@@ -0,0 +1,162 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+Cells
+=====
+
+Base class: :doc:`Traversable`
+
+"""
+def test_base():
+    # language=rst
+    """
+Internal class used in row rendering.
+
+You can access the current row via `.row` and the current row index via `.row_index`.
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+`attrs`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Attrs`
+
+    See :ref:`attributes <attributes>`
+
+
+`cache`
+^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`cell_class`
+^^^^^^^^^^^^
+
+Type: `type[Cell]`
+
+
+Cookbook:
+    :ref:`table-internal-classes`
+
+
+`extra`
+^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_evaluated`
+^^^^^^^^^^^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_params`
+^^^^^^^^^^^^^^
+
+    See :ref:`extra_params <extra_params>`
+
+
+`iommi_style`
+^^^^^^^^^^^^^
+
+Type: `str | Style | None`
+
+    See :ref:`iommi_style <iommi_style>`
+
+
+`layout`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `Panel | None`
+
+
+Cookbook:
+    :ref:`complex-layouts-tables`
+
+
+`tag`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+    See :ref:`tag <tag>`
+
+
+`template`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str | Template`
+
+    See :ref:`template <template>`
+
+
+Methods
+-------
+
+`bind_row`
+^^^^^^^^^^
+
+
+
+Bind a copy of these refine done `Cells` for one row. This is a
+cheaper `bind` for the rows of a table: the `Cells` is refine done
+once for all rows, and only the members that are callables are
+evaluated.
+
+
+
+`column_count`
+^^^^^^^^^^^^^^
+
+`get_table`
+^^^^^^^^^^^
+
+`on_bind`
+^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`render`
+^^^^^^^^
+
+    """
@@ -0,0 +1,1117 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+Field
+=====
+
+Base class: :doc:`Part`
+
+"""
+def test_base():
+    # language=rst
+    """
+Class that describes a field, i.e. what input controls to render, the label, etc.
+
+See :doc:`Form` for more complete examples.
+
+The life cycle of the data is:
+
+    1. `raw_data`: will be set if the corresponding key is present in the HTTP request
+    2. `parsed_data`: set if parsing is successful, which only happens if the previous step succeeded
+    3. `value`: set if validation is successful, which only happens if the previous step succeeded
+
+    """
+
+    # language=rst
+    """
+
+Note that, in addition to the parameters with the defined behavior below, you can pass in any keyword argument you need yourself, including callables that conform to the protocol, and they will be added and evaluated as members.
+
+All these parameters can be callables, and if they are, will be evaluated with the keyword arguments form and field. The only exceptions are `is_valid` (which gets `form`, `field` and `parsed_data`), `render_value` (which takes `form`, `field` and `value`) and `parse` (which gets `form`, `field`, `string_value`). Example of using a lambda to specify a value:
+
+.. code-block:: python
+
+        Field(attrs__id=lambda form, field: 'my_id_%s' % field._name)
+
+Refinable members
+-----------------
+
+
+`after`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Set the order of fields, see the `howto <https://docs.iommi.rocks/cookbook_forms.html#how-do-i-change-the-order-of-the-fields>`_ for an example.
+
+Type: `int | str`
+
+    See :ref:`after <after>`
+
+
+Cookbook:
+    :ref:`field-order`
+
+
+`assets`
+^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`assets <assets>`
+
+
+`attr`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+The attribute path to apply or get the data from. For example using `foo__bar__baz` will result in `your_instance.foo.bar.baz` being set by the `apply()` function. Setting this to `None` will mean no attribute is read or written by `apply()`. Defaults to same as `name`.
+
+Type: `str`
+
+    See :ref:`attr <attr>`
+
+
+`attrs`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+A dict containing any custom html attributes to be sent to the `input__template`.
+
+Type: :doc:`Attrs`
+
+    See :ref:`attributes <attributes>`
+
+
+Cookbook:
+    :ref:`freetext-column`
+
+
+`cache`
+^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`choice_display_name_formatter`
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Callback given the keyword argument `choice` in addition to standard parameters, to obtain the display name representing a given choice to the end user. Default implementation will use `str(choice)`
+
+Type: `Callable[..., str]`
+
+Default: `lambda choice, **_: '%s' % choice`
+
+Cookbook:
+    :ref:`customize-choices-display`
+
+
+`choice_id_formatter`
+^^^^^^^^^^^^^^^^^^^^^
+
+Callback given the keyword argument `choice` in addition to standard parameters, to obtain the string value to represent the identity of a given `choice`. Default implementation will use `str(choice)`
+
+Type: `Callable[..., str]`
+
+Default: `lambda choice, **_: '%s' % choice`
+
+Cookbook:
+    :ref:`customize-choices-display`
+
+
+`choice_to_optgroup`
+^^^^^^^^^^^^^^^^^^^^
+
+Callback to generate the optgroup for the given choice. It will get the keyword argument `choice`. It should return None if the choice should not be grouped.
+
+Type: `Callable[..., str | None] | None`
+
+
+Cookbook:
+    :ref:`customize-choices-display`
+
+
+`choices`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `Callable[..., list[Any]]`
+
+
+Cookbook:
+    :ref:`dependent-fields2`
+
+    :ref:`dependent-fields`
+
+
+`conditional_get`
+^^^^^^^^^^^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`config_from_model`
+^^^^^^^^^^^^^^^^^^^
+
+Type: `Namespace`
+
+
+`display_name`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+The text in the HTML label tag. Default: `capitalize(name).replace('_', ' ')`
+
+Type: `str | None`
+
+    See :ref:`name <name>`
+
+
+`editable`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Is this field editable.
+
+Type: `bool`
+
+Default: `True`
+
+Cookbook:
+    :ref:`non-rendered-field`
+
+    :ref:`create-or-edit-forms`
+
+    :ref:`field-non-editable`
+
+
+`empty_label`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+Default: `---`
+
+Cookbook:
+    :ref:`customize-choices-display`
+
+
+`endpoints`
+^^^^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`endpoints <endpoints>`
+
+
+`errors`
+^^^^^^^^
+
+Type: `Errors`
+
+
+Cookbook:
+    :ref:`field-hidden`
+
+
+`extra`
+^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_evaluated`
+^^^^^^^^^^^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_params`
+^^^^^^^^^^^^^^
+
+    See :ref:`extra_params <extra_params>`
+
+
+`group`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+
+Cookbook:
+    :ref:`group-fields`
+
+
+`help`
+^^^^^^
+
+Type: `Fragment | str`
+
+
+Cookbook:
+    :ref:`field-label-help`
+
+
+`help_text`
+^^^^^^^^^^^
+
+The help text will be grabbed from the django model if specified and available.
+
+
+Cookbook:
+    :ref:`field-label-help`
+
+
+`include`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+    See :ref:`include <include>`
+
+
+Cookbook:
+    :ref:`include-exclude-fields`
+
+    :ref:`field-reverse-m2m`
+
+    :ref:`show-fields`
+
+
+`initial`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Initial value of the field
+
+Type: `Any`
+
+
+Cookbook:
+    :ref:`non-rendered-field`
+
+    :ref:`field-initial-value`
+
+
+`input`
+^^^^^^^
+
+Type: :doc:`Fragment`
+
+
+Cookbook:
+    :ref:`field-input-template`
+
+
+`iommi_style`
+^^^^^^^^^^^^^
+
+Type: `str | Style | None`
+
+    See :ref:`iommi_style <iommi_style>`
+
+
+`is_boolean`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+Default: `False`
+
+Cookbook:
+    :ref:`customize-choices-display`
+
+
+`is_list`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Interpret request data as a list (can NOT be a callable). Default: `False`
+
+Type: `bool`
+
+Default: `False`
+
+Cookbook:
+    :ref:`customize-choices-display`
+
+
+`is_valid`
+^^^^^^^^^^
+
+
+Validation function. Should return a tuple of `(bool, reason_for_failure_if_bool_is_false)` or raise `ValidationError`.
+
+    """
+
+    form = Form.create(
+        auto__model=Artist,
+        fields__name__is_valid=lambda parsed_data, **_: (parsed_data.startswith('H'), 'Must start with H!'),
+    )
+
+    # @test
+    show_output(form.bind(request=req('post', **{'-submit': '', 'name': 'blizzard of ozz'})))
+    # @end
+
+    # language=rst
+    """
+
+
+
+Cookbook:
+    :ref:`custom-validator`
+
+    :ref:`validate-multiple-fields-together`
+
+
+`label`
+^^^^^^^
+
+Type: `Fragment | None`
+
+
+Cookbook:
+    :ref:`field-label-help`
+
+
+`model`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `type[Model] | None`
+
+
+Cookbook:
+    :ref:`form-model-introspection`
+
+
+`model_field`
+^^^^^^^^^^^^^
+
+Type: `Field | None`
+
+
+Cookbook:
+    :ref:`form-model-introspection`
+
+
+`model_field_name`
+^^^^^^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`form-model-introspection`
+
+
+`non_editable_input`
+^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Fragment`
+
+Default: `{'call_target': <class 'iommi.fragment.Fragment'>, 'children__text': <function Field.<lambda> at 0x7fc327321da0>, 'attrs__value': <function Field.<lambda> at 0x7fc327321e40>}`
+
+Cookbook:
+    :ref:`field-raw-data`
+
+
+`parse`
+^^^^^^^
+
+
+Parse function. Default just returns the string input unchanged. This function can raise `ValueError` or `ValidationError` to produce a field error message.
+
+
+
+
+Cookbook:
+    :ref:`supply-custom-parser-field`
+
+
+`parse_empty_string_as_none`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+Default: `True`
+
+Cookbook:
+    :ref:`field-raw-data`
+
+
+`parsed_data`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `Any`
+
+
+Cookbook:
+    :ref:`field-non-editable`
+
+
+`post_validation`
+^^^^^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`validate-multiple-fields-together`
+
+
+`raw_data`
+^^^^^^^^^^
+
+Type: `str`
+
+
+Cookbook:
+    :ref:`field-raw-data`
+
+
+`read_from_instance`
+^^^^^^^^^^^^^^^^^^^^
+
+Callback to retrieve value from edited instance. Invoked with parameters field and instance.
+
+
+Cookbook:
+    :ref:`field-read-from-instance`
+
+
+`render_value`
+^^^^^^^^^^^^^^
+
+
+Render the parsed and validated value into a string. Default just converts to `str`.
+
+    """
+
+    sentinel = '!!custom!!'
+    form = Form(
+        fields__foo=Field(
+            initial='not sentinel value',
+            render_value=lambda form, field, value, **_: sentinel,
+        )
+    )
+
+    # @test
+    show_output(form)
+    assert sentinel in form.bind(request=req('get')).__html__()
+    # @end
+
+    # language=rst
+    """
+
+
+
+Cookbook:
+    :ref:`field-raw-data`
+
+
+`render_value_on_error`
+^^^^^^^^^^^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`field-raw-data`
+
+
+`required`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+If the field is a required field. Default: `True`
+
+Type: `bool`
+
+Default: `True`
+
+Cookbook:
+    :ref:`field-required`
+
+
+`search_fields`
+^^^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`field-search-fields`
+
+
+`strip_input`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Runs the input data through standard python .strip() before passing it to the parse function (can NOT be callable). Default: `True`
+
+Type: `bool`
+
+Default: `True`
+
+Cookbook:
+    :ref:`field-raw-data`
+
+
+`tag`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+Default: `div`
+    See :ref:`tag <tag>`
+
+
+`template`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Django template filename or `Template` instance for the entire row. Normally you shouldn't need to override on this level. Prefer overriding `input__template`, `label__template` or `error__template` as needed.
+
+Type: `str | Template`
+
+    See :ref:`template <template>`
+
+
+Cookbook:
+    :ref:`field-template`
+
+
+`write_to_instance`
+^^^^^^^^^^^^^^^^^^^
+
+Callback to write value to instance. Invoked with parameters field, instance and value.
+
+
+Cookbook:
+    :ref:`field-write-to-instance`
+
+
+Shortcuts
+---------
+
+`Field.boolean`
+^^^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `parse`
+    * `iommi.form.bool_parse`
+* `required`
+    * `False`
+* `is_boolean`
+    * `True`
+
+`Field.boolean_tristate`
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+Parent: Field.choice_
+
+Defaults
+++++++++
+
+* `choices`
+    * `[True, False]`
+* `choice_id_formatter`
+    * `lambda choice, **_: 'true' if choice else 'false'`
+* `choice_display_name_formatter`
+    * `lambda choice, **_: gettext_lazy('Yes') if choice else gettext_lazy('No')`
+* `parse`
+    * `iommi.form.boolean_tristate__parse`
+* `required`
+    * `False`
+
+`Field.checkboxes`
+^^^^^^^^^^^^^^^^^^
+
+Parent: Field.multi_choice_
+
+Defaults
+++++++++
+
+* `input__attrs__id`
+    * `None`
+* `extra_evaluated__id`
+    * `iommi.form.default_input_id`
+
+`Field.choice`
+^^^^^^^^^^^^^^
+
+Shortcut for single choice field. If required is false it will automatically add an option first with the value '' and the title '---'. To override that text pass in the parameter empty_label.
+
+
+
+Defaults
+++++++++
+
+* `required`
+    * `True`
+* `is_list`
+    * `False`
+* `is_valid`
+    * `iommi.form.choice_is_valid`
+* `input__attrs__multiple`
+    * `lambda field, **_: True if field.is_list else None`
+* `parse`
+    * `iommi.form.choice_parse`
+
+`Field.choice_queryset`
+^^^^^^^^^^^^^^^^^^^^^^^
+
+Parent: Field.choice_
+
+Defaults
+++++++++
+
+* `parse`
+    * `iommi.form.choice_queryset__parse`
+* `choice_id_formatter`
+    * `lambda choice, **_: choice.pk`
+* `endpoints__choices__func`
+    * `iommi.form.choice_queryset__endpoint_handler`
+* `is_valid`
+    * `iommi.form.choice_queryset__is_valid`
+* `extra__filter_and_sort`
+    * `iommi.form.choice_queryset__extra__filter_and_sort`
+* `extra__model_from_choices`
+    * `iommi.form.choice_queryset__extra__model_from_choices`
+
+`Field.choice_searchable`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Shortcut for single choice field, but with select2.
+
+
+
+Parent: Field.choice_
+
+`Field.date`
+^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `parse`
+    * `iommi.form.date_parse`
+* `render_value`
+    * `iommi.form.date_render_value`
+
+`Field.datetime`
+^^^^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `parse`
+    * `iommi.form.datetime_parse`
+* `render_value`
+    * `iommi.form.datetime_render_value`
+* `extra_evaluated__is_tz_aware`
+    * `lambda **_: settings.USE_TZ`
+
+`Field.decimal`
+^^^^^^^^^^^^^^^
+
+Parent: Field.number_
+
+Defaults
+++++++++
+
+* `parse`
+    * `iommi.form.decimal_parse`
+
+`Field.dropfile`
+^^^^^^^^^^^^^^^^
+
+Parent: Field.file_
+
+`Field.dropimage`
+^^^^^^^^^^^^^^^^^
+
+Parent: Field.dropfile_
+
+`Field.duration`
+^^^^^^^^^^^^^^^^
+
+Parent: Field.text_
+
+Defaults
+++++++++
+
+* `parse`
+    * `iommi.form.duration_parse`
+* `render_value`
+    * `iommi.form.duration_render_value`
+
+`Field.email`
+^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `input__attrs__type`
+    * `email`
+* `parse`
+    * `iommi.form.email_parse`
+
+`Field.file`
+^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `input__attrs__type`
+    * `file`
+* `input__attrs__multiple`
+    * `lambda field, **_: True if field.is_list else None`
+* `raw_data`
+    * `iommi.form.file__raw_data`
+* `write_to_instance`
+    * `iommi.form.file_write_to_instance`
+* `extra__django_related_field`
+    * `True`
+* `extra_evaluated__show_thumbs`
+    * `True`
+* `attrs__data-iommi-extended-file-field`
+    * `True`
+* `attrs__data-iommi-extended-file-with-thumbs`
+    * `lambda field, **_: field.extra_evaluated.show_thumbs`
+* `attrs__data-iommi-extended-file-thumb-width`
+    * `100`
+* `attrs__data-iommi-extended-file-thumb-height`
+    * `100`
+* `attrs__data-iommi-extended-file-loading-icon`
+    * `lambda **_: static('images/iommi-icons/spinner.svg')`
+
+`Field.float`
+^^^^^^^^^^^^^
+
+Parent: Field.number_
+
+Defaults
+++++++++
+
+* `parse`
+    * `iommi.form.float_parse`
+
+`Field.foreign_key`
+^^^^^^^^^^^^^^^^^^^
+
+`Field.foreign_key_reverse`
+^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Parent: Field.related_multiple_
+
+Defaults
+++++++++
+
+* `editable`
+    * `False`
+* `display_name`
+    * `lambda field, **_: capitalize(field.model_field.related_model._meta.verbose_name_plural)`
+* `choices`
+    * `iommi.form.related__choices`
+* `extra__django_related_field`
+    * `True`
+
+`Field.hardcoded`
+^^^^^^^^^^^^^^^^^
+
+`Field.heading`
+^^^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `editable`
+    * `False`
+* `attr`
+    * `None`
+
+`Field.hidden`
+^^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `input__attrs__type`
+    * `hidden`
+* `attrs__style__display`
+    * `none`
+
+
+Cookbook:
+    :ref:`field-hidden`
+
+`Field.image`
+^^^^^^^^^^^^^
+
+Parent: Field.file_
+
+`Field.info`
+^^^^^^^^^^^^
+
+Shortcut to create an info entry.
+
+
+
+Defaults
+++++++++
+
+* `editable`
+    * `False`
+* `attr`
+    * `None`
+
+`Field.integer`
+^^^^^^^^^^^^^^^
+
+Parent: Field.number_
+
+Defaults
+++++++++
+
+* `parse`
+    * `iommi.form.int_parse`
+
+`Field.many_to_many`
+^^^^^^^^^^^^^^^^^^^^
+
+Parent: Field.related_multiple_
+
+`Field.many_to_many_reverse`
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Parent: Field.related_multiple_
+
+`Field.multi_choice`
+^^^^^^^^^^^^^^^^^^^^
+
+Parent: Field.choice_
+
+Defaults
+++++++++
+
+* `is_list`
+    * `True`
+
+`Field.multi_choice_queryset`
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Parent: Field.choice_queryset_
+
+Defaults
+++++++++
+
+* `is_list`
+    * `True`
+
+
+Cookbook:
+    :ref:`field-related-multi-select`
+
+`Field.non_rendered`
+^^^^^^^^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `template`
+    * `<iommi._web_compat.Template object at 0x7fc3273ae900>`
+* `editable`
+    * `False`
+
+
+Cookbook:
+    :ref:`non-rendered-field`
+
+`Field.number`
+^^^^^^^^^^^^^^
+
+`Field.password`
+^^^^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `input__attrs__type`
+    * `password`
+* `render_value`
+    * `lambda **_: ''`
+* `render_value_on_error`
+    * `lambda **_: ''`
+
+`Field.phone_number`
+^^^^^^^^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `is_valid`
+    * `iommi.form.phone_number_is_valid`
+
+`Field.radio`
+^^^^^^^^^^^^^
+
+Parent: Field.choice_
+
+Defaults
+++++++++
+
+* `input__attrs__id`
+    * `None`
+* `extra_evaluated__id`
+    * `iommi.form.default_input_id`
+
+`Field.related`
+^^^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `choices`
+    * `iommi.form.related__choices`
+
+
+Cookbook:
+    :ref:`field-related-multi-select`
+
+`Field.related_multiple`
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+Parent: Field.multi_choice_queryset_
+
+Defaults
+++++++++
+
+* `display_name`
+    * `lambda field, **_: capitalize(field.model_field.remote_field.model._meta.verbose_name_plural)`
+* `choices`
+    * `iommi.form.related__choices`
+* `read_from_instance`
+    * `iommi.form.related_multiple__read_from_instance`
+* `write_to_instance`
+    * `iommi.form.related_multiple__write_to_instance`
+* `extra__django_related_field`
+    * `True`
+
+`Field.text`
+^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `input__attrs__type`
+    * `text`
+
+`Field.textarea`
+^^^^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `input__tag`
+    * `textarea`
+* `input__attrs__type`
+    * `None`
+* `input__attrs__value`
+    * `None`
+* `input__children__text`
+    * `lambda field, **_: field.rendered_value`
+
+`Field.time`
+^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `parse`
+    * `iommi.form.time_parse`
+* `render_value`
+    * `iommi.form.time_render_value`
+
+`Field.url`
+^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `input__attrs__type`
+    * `url`
+* `parse`
+    * `iommi.form.url_parse`
+
+Methods
+-------
+
+`add_error`
+^^^^^^^^^^^
+
+`bind_from_instance`
+^^^^^^^^^^^^^^^^^^^^
+
+`get_errors`
+^^^^^^^^^^^^
+
+`on_bind`
+^^^^^^^^^
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Class methods
+-------------
+
+`from_model`
+^^^^^^^^^^^^
+
+
+
+Create a `Field` from a Django model field.
+
+When used declaratively inside a `Form`, you normally don't need to pass anything:
+the model is taken from the containing form and the model field name from the field's
+own name. This works because resolution is deferred until the form is bound, by which
+point both are known.
+
+    """
+
+    class AlbumForm(Form):
+        name = Field.from_model()
+
+    # language=rst
+    """
+    Pass `attr` (using `__` to drill down) to read a field from a related model:
+
+    """
+
+    class AlbumForm(Form):
+        artist_name = Field.from_model(attr='artist__name')
+
+    # language=rst
+    """
+    The explicit `model`, `model_field_name` and `model_field` parameters are still
+accepted for the rare cases where the field can't be inferred from context (e.g. when
+not declared on a form), but are no longer required.
+
+
+
+    """
@@ -0,0 +1,213 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+Fragment
+========
+
+Base class: :doc:`Part`
+
+"""
+def test_base():
+    # language=rst
+    """
+.. _Fragment:
+
+`Fragment` is a class used to build small HTML fragments that plug into iommi's structure.
+
+    """
+
+    # @test
+    from iommi.fragment import Fragment
+    # @end
+
+    h1 = Fragment(children__text='Tony', tag='h1')
+
+    # There is also a shorthand version that is identical to the above:
+    h1 = Fragment('Tony', tag='h1')
+
+    # language=rst
+    """
+    It's easiest to use via the html builder:
+
+    """
+
+    h1 = html.h1('Tony')
+
+    # language=rst
+    """
+    Fragments are useful because attrs, template and tag are evaluated, so if
+you have a `Page` with a fragment in it you can configure it later:
+
+    """
+
+    class MyPage(Page):
+        header = html.h1(
+            'Hi!',
+            attrs__class__staff=
+                lambda request, **_: request.user.is_staff,
+        )
+
+    # language=rst
+    """
+    Rendering a `MyPage` will result in a `<h1>`, but if you do
+`MyPage(parts__header__tag='h2')` it will be rendered with a `<h2>`.
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+`after`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `int | str`
+
+    See :ref:`after <after>`
+
+
+`assets`
+^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`assets <assets>`
+
+
+`attrs`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Attrs`
+
+    See :ref:`attributes <attributes>`
+
+
+`cache`
+^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`children`
+^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`override-part-of-page`
+
+
+`conditional_get`
+^^^^^^^^^^^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`endpoints`
+^^^^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`endpoints <endpoints>`
+
+
+`extra`
+^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_evaluated`
+^^^^^^^^^^^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_params`
+^^^^^^^^^^^^^^
+
+    See :ref:`extra_params <extra_params>`
+
+
+`include`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+    See :ref:`include <include>`
+
+
+`iommi_style`
+^^^^^^^^^^^^^
+
+Type: `str | Style | None`
+
+    See :ref:`iommi_style <iommi_style>`
+
+
+`tag`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+    See :ref:`tag <tag>`
+
+
+`template`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str | Template`
+
+    See :ref:`template <template>`
+
+
+Cookbook:
+    :ref:`field-input-template`
+
+
+Methods
+-------
+
+`on_bind`
+^^^^^^^^^
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`render_text_or_children`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+    """
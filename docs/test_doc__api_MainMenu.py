@@ -0,0 +1,64 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+MainMenu
+========
+
+
+"""
+def test_base():
+    # language=rst
+    """
+See the :ref:`MainMenu <mainmenu>` docs and the :ref:`MainMenu cookbook <cookbook-main-menu>`.
+
+    """
+
+    # language=rst
+    """
+
+Constructor arguments
++++++++++++++++++++++
+
+* `items`
+* `attrs`
+* `template`
+* `paths`
+* `extra`
+* `extra_evaluated`
+
+Methods
+-------
+
+`bind`
+^^^^^^
+
+`urlpatterns`
+^^^^^^^^^^^^^
+
+    """
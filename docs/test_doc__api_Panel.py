@@ -0,0 +1,402 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+Panel
+=====
+
+Base class: :doc:`Fragment`
+
+"""
+def test_base():
+    # language=rst
+    """
+Class used to define form and table row layouts. See :ref:`the forms cookbook <complex-layouts-forms>` and :ref:`the table cookbook <complex-layouts-tables>`.
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+`_parent_form`
+^^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`field-write-to-instance`
+
+
+`_parent_table`
+^^^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`complex-layouts-tables`
+
+
+`_parent_table_cells`
+^^^^^^^^^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`complex-layouts-tables`
+
+
+`after`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `int | str`
+
+    See :ref:`after <after>`
+
+
+`assets`
+^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`assets <assets>`
+
+
+`attrs`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Attrs`
+
+    See :ref:`attributes <attributes>`
+
+
+`cache`
+^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`children`
+^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`field-write-to-instance`
+
+
+`col`
+^^^^^
+
+
+Cookbook:
+    :ref:`field-write-to-instance`
+
+
+`col_class`
+^^^^^^^^^^^
+
+Type: `type[PanelCol]`
+
+
+Cookbook:
+    :ref:`field-write-to-instance`
+
+
+`conditional_get`
+^^^^^^^^^^^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`endpoints`
+^^^^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`endpoints <endpoints>`
+
+
+`extra`
+^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_evaluated`
+^^^^^^^^^^^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_params`
+^^^^^^^^^^^^^^
+
+    See :ref:`extra_params <extra_params>`
+
+
+`fieldset_legend`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+
+Cookbook:
+    :ref:`field-write-to-instance`
+
+
+`include`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+    See :ref:`include <include>`
+
+
+`iommi_style`
+^^^^^^^^^^^^^
+
+Type: `str | Style | None`
+
+    See :ref:`iommi_style <iommi_style>`
+
+
+`nested_path`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+
+Cookbook:
+    :ref:`field-write-to-instance`
+
+
+`tag`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+    See :ref:`tag <tag>`
+
+
+`template`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str | Template`
+
+    See :ref:`template <template>`
+
+
+Shortcuts
+---------
+
+`Panel.alert`
+^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `tag`
+    * `div`
+* `attrs__role`
+    * `alert`
+* `attrs__class__alert`
+    * `True`
+
+`Panel.card`
+^^^^^^^^^^^^
+
+eg. for bootstrap div.card
+
+
+
+Defaults
+++++++++
+
+* `tag`
+    * `div`
+* `attrs__class__card`
+    * `True`
+* `template`
+    * `iommi/form/panel_card.html`
+
+`Panel.card_footer`
+^^^^^^^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `tag`
+    * `div`
+* `attrs__class__card-footer`
+    * `True`
+
+`Panel.card_header`
+^^^^^^^^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `tag`
+    * `div`
+* `attrs__class__card-header`
+    * `True`
+
+`Panel.cell`
+^^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `tag`
+    * `None`
+
+`Panel.div`
+^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `tag`
+    * `div`
+
+`Panel.field`
+^^^^^^^^^^^^^
+
+generates form field
+
+
+
+Defaults
+++++++++
+
+* `tag`
+    * `None`
+
+`Panel.fieldset`
+^^^^^^^^^^^^^^^^
+
+generates <fieldset><legend>{legend}</legend>{subfields/subpanels}</fieldset>
+
+
+
+Defaults
+++++++++
+
+* `tag`
+    * `fieldset`
+* `template`
+    * `iommi/form/panel_fieldset.html`
+
+`Panel.nested_form`
+^^^^^^^^^^^^^^^^^^^
+
+generates nested form
+
+
+
+Defaults
+++++++++
+
+* `tag`
+    * `None`
+
+`Panel.part`
+^^^^^^^^^^^^
+
+for non-field parts/fragments
+you don't need to call this by hand, non-field children of rows/fieldsets get wrapped automatically
+
+
+
+Defaults
+++++++++
+
+* `tag`
+    * `None`
+
+`Panel.reorder_handle`
+^^^^^^^^^^^^^^^^^^^^^^
+
+Parent: Panel.cell_
+
+Defaults
+++++++++
+
+* `tag`
+    * `span`
+* `attrs__title`
+    * `Drag and drop to reorder`
+* `attrs__class__reordering-handle-cell`
+    * `True`
+* `attrs__data-iommi-reordering-handle`
+    * `True`
+
+`Panel.row`
+^^^^^^^^^^^
+
+generates div.row
+
+
+
+Defaults
+++++++++
+
+* `tag`
+    * `div`
+* `attrs__class__row`
+    * `True`
+
+Methods
+-------
+
+`as_dict`
+^^^^^^^^^
+
+`get_cell_panels`
+^^^^^^^^^^^^^^^^^
+
+
+recursively gets all cells from the panel
+
+
+`get_fields`
+^^^^^^^^^^^^
+
+
+recursively gets all fields from the panel
+
+
+`on_bind`
+^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+    """
@@ -0,0 +1,191 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+Part
+====
+
+Base class: :doc:`Traversable`
+
+"""
+def test_base():
+    # language=rst
+    """
+`Part` is the base class for parts of a page that can be rendered as html, and can respond to ajax and post.
+
+See the `howto <https://docs.iommi.rocks//cookbook_parts_pages.html#parts-pages>`_ for example usages.
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+`after`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `int | str`
+
+    See :ref:`after <after>`
+
+
+`assets`
+^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`assets <assets>`
+
+
+`cache`
+^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+Cookbook:
+    :ref:`part-cache`
+
+
+`conditional_get`
+^^^^^^^^^^^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+Cookbook:
+    :ref:`table-conditional-get`
+
+
+`endpoints`
+^^^^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`endpoints <endpoints>`
+
+
+`extra`
+^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_evaluated`
+^^^^^^^^^^^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_params`
+^^^^^^^^^^^^^^
+
+    See :ref:`extra_params <extra_params>`
+
+
+`include`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+Default: `True`
+    See :ref:`include <include>`
+
+
+`iommi_style`
+^^^^^^^^^^^^^
+
+Type: `str | Style | None`
+
+    See :ref:`iommi_style <iommi_style>`
+
+
+Methods
+-------
+
+`add_conditional_get_validators`
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`arender_to_response`
+^^^^^^^^^^^^^^^^^^^^^
+
+
+
+Async version of `render_to_response`. The data of the tables and the
+choices of the forms are fetched with the async ORM in the event
+loop, and then the page is rendered in a thread, so the rendering can
+use the sync ORM (like a query in a `cell__format`). Endpoints with an
+async `func` are awaited.
+
+
+
+`bind`
+^^^^^^
+
+`iommi_async_prefetches`
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+
+
+Async functions without arguments that fetch the data this part needs
+for rendering with the async ORM. They are awaited together by
+`arender_to_response` before the part is rendered.
+
+
+
+`iommi_collected_assets`
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+`iommi_prefetches`
+^^^^^^^^^^^^^^^^^^
+
+
+
+Functions without arguments that fetch the data this part needs for
+rendering. They are run concurrently by a `Page` with `concurrent`
+configured.
+
+
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`perform_dispatch`
+^^^^^^^^^^^^^^^^^^
+
+`render_to_response`
+^^^^^^^^^^^^^^^^^^^^
+
+    """
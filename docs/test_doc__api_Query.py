@@ -0,0 +1,313 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+Query
+=====
+
+Base class: :doc:`Part`
+
+"""
+def test_base():
+    # language=rst
+    """
+Declare a query language. Example:
+
+    """
+
+    class AlbumQuery(Query):
+        year = Filter.integer()
+        name = Filter()
+
+    query_set = Album.objects.filter(
+        AlbumQuery().bind(request=request).get_q()
+    )
+    # language=rst
+    """
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+`advanced`
+^^^^^^^^^^
+
+Type: `Namespace`
+
+
+Cookbook:
+    :ref:`advanced-query`
+
+
+`after`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `int | str`
+
+    See :ref:`after <after>`
+
+
+`assets`
+^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`assets <assets>`
+
+
+`attrs`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Attrs`
+
+    See :ref:`attributes <attributes>`
+
+
+Cookbook:
+    :ref:`control-q`
+
+
+`auto`
+^^^^^^
+
+Type: :doc:`QueryAutoConfig`
+
+    See :ref:`auto <auto>`
+
+
+`cache`
+^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`conditional_get`
+^^^^^^^^^^^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`endpoints`
+^^^^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`endpoints <endpoints>`
+
+
+`extra`
+^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_evaluated`
+^^^^^^^^^^^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_params`
+^^^^^^^^^^^^^^
+
+    See :ref:`extra_params <extra_params>`
+
+
+`filter`
+^^^^^^^^
+
+
+Cookbook:
+    :ref:`query-filter-rows`
+
+
+`filters`
+^^^^^^^^^
+
+Type: `Namespace`
+
+
+Cookbook:
+    :ref:`query-filter-rows`
+
+
+`form`
+^^^^^^
+
+Type: `Namespace`
+
+
+Cookbook:
+    :ref:`initial-filter`
+
+
+`form_class`
+^^^^^^^^^^^^
+
+Type: `type[Form]`
+
+
+Cookbook:
+    :ref:`custom-member-class`
+
+
+`form_container`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Fragment`
+
+
+Cookbook:
+    :ref:`control-q`
+
+
+`include`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+    See :ref:`include <include>`
+
+
+`iommi_style`
+^^^^^^^^^^^^^
+
+Type: `str | Style | None`
+
+    See :ref:`iommi_style <iommi_style>`
+
+
+`member_class`
+^^^^^^^^^^^^^^
+
+Type: `type[Filter]`
+
+
+Cookbook:
+    :ref:`custom-member-class`
+
+
+`model`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `type[Model] | None`
+
+
+Cookbook:
+    :ref:`query-filter-rows`
+
+
+`postprocess`
+^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`query-filter-rows`
+
+
+`rows`
+^^^^^^
+
+
+Cookbook:
+    :ref:`query-filter-rows`
+
+
+`tag`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+Default: `div`
+    See :ref:`tag <tag>`
+
+
+Cookbook:
+    :ref:`control-q`
+
+
+`template`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str | Template`
+
+    See :ref:`template <template>`
+
+
+Methods
+-------
+
+`get_advanced_query_param`
+^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`get_q`
+^^^^^^^
+
+
+
+Create a query set based on the data in the request.
+
+
+
+`get_query_string`
+^^^^^^^^^^^^^^^^^^
+
+
+
+Based on the data in the request, return the equivalent query string that you can use with parse_query_string() to create a query set.
+
+
+
+`on_bind`
+^^^^^^^^^
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`parse_query_string`
+^^^^^^^^^^^^^^^^^^^^
+
+Class methods
+-------------
+
+`filters_from_model`
+^^^^^^^^^^^^^^^^^^^^
+
+    """
@@ -0,0 +1,102 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+QueryAutoConfig
+===============
+
+Base class: `AutoConfig`
+
+"""
+def test_base():
+    # language=rst
+    """
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+`default_included`
+^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+
+Cookbook:
+    :ref:`query-auto-config`
+
+
+`exclude`
+^^^^^^^^^
+
+A list of attribute names to exclude, use `__` to drill down to nested attributes. Example: `['album', 'album__year']`
+
+Type: `list[str] | None`
+
+
+Cookbook:
+    :ref:`query-auto-config`
+
+
+`include`
+^^^^^^^^^
+
+A list of attribute names to include, use `__` to drill down to nested attributes. Example: `['album', 'album__year']`. A list item may also be a dict carrying the attribute path under its `attr` key, with the remaining keys passed as additional configuration to that entry. Example: `['album', dict(attr='album__year', display_name='Year')]`
+
+Type: `list[str | dict] | None`
+
+    See :ref:`include <include>`
+
+
+`model`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+A Django model class
+
+Type: `type[Model] | None`
+
+
+Cookbook:
+    :ref:`query-auto-config`
+
+
+`rows`
+^^^^^^
+
+A `QuerySet` object. If this field is specified, the `model` attribute will be automatically derived. This cannot be a callable, in that case set `model` and use `rows=lambda...` instead of `auto__rows`.
+
+
+Cookbook:
+    :ref:`query-auto-config`
+
+
+    """
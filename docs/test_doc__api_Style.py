@@ -0,0 +1,69 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+Style
+=====
+
+
+"""
+def test_base():
+    # language=rst
+    """
+    """
+
+    # language=rst
+    """
+
+Constructor arguments
++++++++++++++++++++++
+
+* `bases`
+* `base_template`
+* `content_block`
+* `root`
+* `internal`
+* `sub_styles`
+* `icon_formatter`
+* `kwargs`
+
+Methods
+-------
+
+`resolve`
+^^^^^^^^^
+
+
+
+Calculate the namespaces of additional argument that should be applied
+to the given object. If is_root is set to True, assets might also be
+added to the namespace.
+
+
+
+    """
@@ -0,0 +1,706 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+Table
+=====
+
+Base class: :doc:`Part`
+
+"""
+def test_base():
+    # language=rst
+    """
+Describe a table. Example:
+
+    """
+
+    class AlbumTable(Table):
+        name = Column()
+        artist = Column()
+
+        class Meta:
+            sortable = False
+
+    # @test
+    artist = Artist.objects.create(name='Black Sabbath')
+    Album.objects.create(name='Heaven & Hell', artist=artist, year=1980),
+    Album.objects.create(name='Mob Rules', artist=artist, year=1981),
+
+    show_output(AlbumTable(rows=Album.objects.all()))
+    # @end
+    # language=rst
+    """
+
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+`action_class`
+^^^^^^^^^^^^^^
+
+Type: `type[Action]`
+
+
+Cookbook:
+    :ref:`table-internal-classes`
+
+
+`actions`
+^^^^^^^^^
+
+Type: `dict[str, Action]`
+
+
+Cookbook:
+    :ref:`custom-actions`
+
+
+`actions_below`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+Default: `False`
+
+Cookbook:
+    :ref:`actions-below-table`
+
+
+`actions_template`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str | Template`
+
+Default: `iommi/form/actions.html`
+
+Cookbook:
+    :ref:`actions-below-table`
+
+
+`after`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `int | str`
+
+    See :ref:`after <after>`
+
+
+`assets`
+^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`assets <assets>`
+
+
+`attrs`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+dict of strings to string/callable of HTML attributes to apply to the table
+
+Type: :doc:`Attrs`
+
+    See :ref:`attributes <attributes>`
+
+
+Cookbook:
+    :ref:`freetext-column`
+
+
+`auto`
+^^^^^^
+
+Type: :doc:`TableAutoConfig`
+
+    See :ref:`auto <auto>`
+
+
+Cookbook:
+    :ref:`fk-related-data-access`
+
+    :ref:`nested-fk`
+
+
+`bulk`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `Form | None`
+
+
+Cookbook:
+    :ref:`bulk-delete`
+
+    :ref:`custom-bulk-action`
+
+
+`bulk_container`
+^^^^^^^^^^^^^^^^
+
+Type: :doc:`Fragment`
+
+
+Cookbook:
+    :ref:`post-bulk-edit`
+
+
+`bulk_exclude`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+exclude filters to apply to the `QuerySet` before performing the bulk operation
+
+Type: `Namespace`
+
+Default: `{}`
+
+Cookbook:
+    :ref:`post-bulk-edit`
+
+
+`bulk_filter`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+filters to apply to the `QuerySet` before performing the bulk operation
+
+Type: `Namespace`
+
+Default: `{}`
+
+Cookbook:
+    :ref:`post-bulk-edit`
+
+
+`cache`
+^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`cell`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `CellConfig`
+
+
+Cookbook:
+    :ref:`table-as-div`
+
+
+`cells_class`
+^^^^^^^^^^^^^
+
+Type: `type[Cells]`
+
+
+Cookbook:
+    :ref:`table-internal-classes`
+
+
+`columns`
+^^^^^^^^^
+
+(use this only when not using the declarative style) a list of Column objects
+
+Type: `dict[str, Column]`
+
+
+Cookbook:
+    :ref:`cell-link`
+
+    :ref:`reorder-columns`
+
+    :ref:`column-computed-data`
+
+
+`conditional_get`
+^^^^^^^^^^^^^^^^^
+
+Type: `Namespace | bool | None`
+
+
+`container`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Fragment`
+
+
+Cookbook:
+    :ref:`arbitrary-html`
+
+
+`default_sort_order`
+^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+
+Cookbook:
+    :ref:`default-sort-order`
+
+
+`empty_message`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+
+Cookbook:
+    :ref:`table-as-div`
+
+
+`endpoints`
+^^^^^^^^^^^
+
+Type: `Namespace`
+
+    See :ref:`endpoints <endpoints>`
+
+
+`extra`
+^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_evaluated`
+^^^^^^^^^^^^^^^^^
+
+Type: `dict[str, Any]`
+
+    See :ref:`extra <extra>`
+
+
+`extra_params`
+^^^^^^^^^^^^^^
+
+    See :ref:`extra_params <extra_params>`
+
+
+`form_class`
+^^^^^^^^^^^^
+
+Type: `type[Form]`
+
+
+Cookbook:
+    :ref:`custom-member-class`
+
+
+`h_tag`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `Fragment | str`
+
+    See :ref:`title <title>`
+
+
+`header`
+^^^^^^^^
+
+Default: `Namespace()`
+
+Cookbook:
+    :ref:`stop-header-render`
+
+    :ref:`turn-off-header`
+
+    :ref:`table-as-div`
+
+
+`include`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+    See :ref:`include <include>`
+
+
+`invalid_form_message`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+
+Cookbook:
+    :ref:`table-invalid-form-message`
+
+
+`iommi_style`
+^^^^^^^^^^^^^
+
+Type: `str | Style | None`
+
+    See :ref:`iommi_style <iommi_style>`
+
+
+`member_class`
+^^^^^^^^^^^^^^
+
+Type: `type[Column]`
+
+
+Cookbook:
+    :ref:`custom-member-class`
+
+
+`model`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `type[Model] | None`
+
+
+Cookbook:
+    :ref:`table-model-introspection`
+
+
+`outer`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Fragment`
+
+
+Cookbook:
+    :ref:`arbitrary-html`
+
+
+`page_class`
+^^^^^^^^^^^^
+
+Type: `type[Page]`
+
+
+Cookbook:
+    :ref:`table-internal-classes`
+
+
+`page_size`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `int`
+
+Default: `16`
+
+Cookbook:
+    :ref:`turn-off-pagination`
+
+
+`parts`
+^^^^^^^
+
+Type: `Namespace`
+
+
+Cookbook:
+    :ref:`turn-off-pagination`
+
+
+`post_bulk_edit`
+^^^^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`post-bulk-edit`
+
+
+`preprocess_row`
+^^^^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`table-as-div`
+
+
+`preprocess_rows`
+^^^^^^^^^^^^^^^^^
+
+
+Cookbook:
+    :ref:`table-as-div`
+
+
+`query`
+^^^^^^^
+
+Type: `Query | None`
+
+
+Cookbook:
+    :ref:`initial-filter`
+
+
+`query_class`
+^^^^^^^^^^^^^
+
+Type: `type[Query]`
+
+
+Cookbook:
+    :ref:`custom-member-class`
+
+
+`query_from_indexes`
+^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+
+Cookbook:
+    :ref:`query-from-indexes`
+
+
+`row`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `RowConfig`
+
+
+Cookbook:
+    :ref:`customize-rendering-row`
+
+
+`row_group_class`
+^^^^^^^^^^^^^^^^^
+
+Type: `type[RowGroup]`
+
+
+Cookbook:
+    :ref:`table-internal-classes`
+
+
+`rows`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+a list or QuerySet of objects
+
+
+Cookbook:
+    :ref:`additional-rows`
+
+
+`sortable`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+set this to `False` to turn off sorting for all columns
+
+Type: `bool`
+
+Default: `True`
+
+Cookbook:
+    :ref:`table-sorting`
+
+
+`sorter`
+^^^^^^^^
+
+
+Cookbook:
+    :ref:`custom-sort-key`
+
+
+`stream`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+Default: `False`
+
+Cookbook:
+    :ref:`table-stream`
+
+
+`superheader`
+^^^^^^^^^^^^^
+
+Type: `Namespace`
+
+
+Cookbook:
+    :ref:`superheader`
+
+
+`table_tag_wrapper`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Fragment`
+
+
+Cookbook:
+    :ref:`table-tag-wrapper`
+
+
+`tag`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str`
+
+Default: `table`
+    See :ref:`tag <tag>`
+
+
+Cookbook:
+    :ref:`table-as-div`
+
+
+`tbody`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: :doc:`Fragment`
+
+
+Cookbook:
+    :ref:`table-as-div`
+
+
+`template`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str | Template`
+
+Default: `iommi/table/table.html`
+    See :ref:`template <template>`
+
+
+`title`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+Type: `str | None`
+
+    See :ref:`title <title>`
+
+
+Shortcuts
+---------
+
+`Table.div`
+^^^^^^^^^^^
+
+Defaults
+++++++++
+
+* `tag`
+    * `div`
+* `tbody__tag`
+    * `div`
+* `cell__tag`
+    * `None`
+* `row__tag`
+    * `div`
+* `header__template`
+    * `None`
+
+Methods
+-------
+
+`add_conditional_get_validators`
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`as_async_view`
+^^^^^^^^^^^^^^^
+
+`as_view`
+^^^^^^^^^
+
+`bulk_queryset`
+^^^^^^^^^^^^^^^
+
+
+Return the queryset that contains only the selected rows with
+bulk_filter and bulk_exclude applied.
+
+For use in post_handlers. Only valid when rows was a queryset.
+
+
+
+`cells_for_rows`
+^^^^^^^^^^^^^^^^
+
+
+Yield a Cells instance for each visible row on the screen.
+
+
+`get_visible_rows`
+^^^^^^^^^^^^^^^^^^
+
+`iommi_async_prefetches`
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+`iommi_prefetches`
+^^^^^^^^^^^^^^^^^^
+
+`on_bind`
+^^^^^^^^^
+
+`on_refine_done`
+^^^^^^^^^^^^^^^^
+
+`own_evaluate_parameters`
+^^^^^^^^^^^^^^^^^^^^^^^^^
+
+`selection`
+^^^^^^^^^^^
+
+
+Return the selected rows.
+
+For use in post_handlers. It's a queryset if rows is a queryset and a list otherwise.
+Unlike bulk_queryset neither bulk_filter nor bulk_exclude are applied.
+
+
+
+`should_render_form_tag`
+^^^^^^^^^^^^^^^^^^^^^^^^
+
+`stream_cells_for_rows`
+^^^^^^^^^^^^^^^^^^^^^^^
+
+
+
+Yield a Cells instance for each row, without pagination. Unlike
+`cells_for_rows(paginate=False)` the rows are not all kept in memory.
+Pass `rows` to use some other rows than the sorted and filtered rows
+of the table, and `start_index` for the `row_index` of the first of
+them.
+
+
+
+Class methods
+-------------
+
+`columns_from_model`
+^^^^^^^^^^^^^^^^^^^^
+
+    """
@@ -0,0 +1,122 @@
+
+# NOTE: this file is automatically generated
+
+from iommi import *
+from iommi.experimental.calendar import Calendar
+from iommi.admin import Admin
+from iommi.struct import Struct
+from django.urls import (
+    include,
+    path,
+)
+import pytest
+from django.db import models
+from tests.helpers import req, user_req, staff_req
+from iommi.docs import *
+from docs.models import *
+
+pytestmark = pytest.mark.django_db
+
+@pytest.fixture(autouse=True)
+def auto_use(big_discography):
+    pass
+
+request = req('get')
+
+
+# language=rst
+"""
+
+TableAutoConfig
+===============
+
+Base class: `AutoConfig`
+
+"""
+def test_base():
+    # language=rst
+    """
+    """
+
+    # language=rst
+    """
+
+Refinable members
+-----------------
+
+
+`default_included`
+^^^^^^^^^^^^^^^^^^
+
+Type: `bool`
+
+
+Cookbook:
+    :ref:`show-columns`
+
+
+`exclude`
+^^^^^^^^^
+
+A list of attribute names to exclude, use `__` to drill down to nested attributes. Example: `['album', 'album__year']`
+
+Type: `list[str] | None`
+
+
+Cookbook:
+    :ref:`show-columns`
+
+
+`include`
+^^^^^^^^^
+
+A list of attribute names to include, use `__` to drill down to nested attributes. Example: `['album', 'album__year']`. A list item may also be a dict carrying the attribute path under its `attr` key, with the remaining keys passed as additional configuration to that entry. Example: `['album', dict(attr='album__year', display_name='Year')]`
+
+Type: `list[str | dict] | None`
+
+    See :ref:`include <include>`
+
+
+Cookbook:
+    :ref:`show-columns`
+
+    :ref:`nested-fk`
+
+
+`model`       (:ref:`evaluated <evaluate>`)
+^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^^
+
+A Django model class
+
+Type: `type[Model] | None`
+
+
+Cookbook:
+    :ref:`cell-link`
+
+    :ref:`group-columns`
+
+    :ref:`turn-off-pagination`
+
+    :ref:`freetext-column`
+
+    :ref:`column-computed-data`
+
+    :ref:`reorder-columns`
+
+    :ref:`filter-column`
+
+    :ref:`show-columns`
+
+
+`rows`
+^^^^^^
+
+A `QuerySet` object. If this field is specified, the `model` attribute will be automatically derived. This cannot be a callable, in that case set `model` and use `rows=lambda...` instead of `auto__rows`.
+
+
+Cookbook:
+    :ref:`group-rows`
+
+
+    """
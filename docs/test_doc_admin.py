@@ -189,6 +189,17 @@ def has_permission(request, operation, model=None, instance=None):
     `model` parameter will be given for create/edit/delete/list, and instance will
     be supplied in edit/delete.
 
+    The list of models on the admin start page is checked with the `view`
+    operation for every model, on every request. If you have many models you
+    can set `settings.IOMMI_ADMIN_CACHE_PERMISSIONS = True` to cache the result
+    in the session of the user. The cache is invalidated when the staff or
+    superuser status of the user changes, or when the permissions or groups of
+    any user or group change. If you change permissions in some other way, call
+    `iommi.admin.invalidate_permissions()`. Until then the start page can show
+    models the user can no longer view, or hide ones they now can. The views
+    themselves still check `has_permission` on every request. Don't turn the
+    cache on if your `has_permission` depends on anything else.
+
     """
 
 
@@ -122,3 +122,59 @@ def test_how_do_i_customize_calendar_navigation_and_actions(really_big_discograp
     # @test
     show_output(calendar)
     # @end
+
+
+def test_how_do_i_make_a_calendar_over_a_big_table_faster(really_big_discography):
+    # language=rst
+    """
+    .. _calendar-performance:
+
+    How do I make a calendar over a big table faster?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    .. uses Calendar.event
+
+    The calendar only fetches the events in the displayed weeks, and finds the
+    months for the "First", "Prev with data", "Next with data" and "Last" links
+    with a single aggregate query. An index on the date field helps both. If
+    your events have many columns you don't show, pass the fields your
+    `event__display_name` and `event__url` need with `event__only` to fetch
+    only those (and the date field):
+    """
+
+    calendar = Calendar(
+        auto__model=Album,
+        event__attr='published_date',
+        event__display_name=lambda event, **_: event.name,
+        event__only=['name'],
+        year=1983,
+        month=11,
+    )
+
+    # @test
+    show_output(calendar)
+    # @end
+
+    # language=rst
+    """
+    If formatting the events one at a time is slow, for example because each
+    display name needs a lookup, you can format all the events of the month in
+    one go with `event__display_names`. It gets the list of `events` and
+    returns a list with one display name per event:
+    """
+
+    def display_names(events, **_):
+        artist_names = dict(Artist.objects.filter(albums__in=events).values_list('albums__pk', 'name'))
+        return [f'{event.name} by {artist_names[event.pk]}' for event in events]
+
+    calendar = Calendar(
+        auto__model=Album,
+        event__attr='published_date',
+        event__display_names=display_names,
+        year=1983,
+        month=11,
+    )
+
+    # @test
+    show_output(calendar)
+    # @end
@@ -1,3 +1,4 @@
+from docs.models import *
 from iommi import *
 from iommi.docs import (
     show_output,
@@ -349,3 +350,95 @@ def test_how_do_i_group_actions_together():
     # @test
     show_output(form)
     # @end
+
+
+def test_how_do_i_cache_a_part(big_discography):
+    # language=rst
+    """
+    .. _part-cache:
+
+    How do I cache the rendering of a part?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    .. uses Part.cache
+
+    Set `cache` on a part to keep its rendered html in the Django cache. On a
+    cache hit the part is neither bound nor rendered, but its assets and
+    endpoints are still registered. `cache=True` uses the defaults, or you can
+    configure it with:
+
+    - `timeout`: in seconds, defaults to the default timeout of the cache
+    - `alias`: which cache in `settings.CACHES` to use, defaults to `'default'`
+    - `vary_on_user`: defaults to `True`. Set it to `False` for parts that look the same for all users.
+    - `vary_on_get`: `True` (the default) for the entire query string, or a list of the GET parameters that the part depends on
+    - `vary_on_params`: `True` (the default) for all the view parameters, or a list of their names
+    - `key`: an extra value, or a callable, to add to the cache key
+    - `models`: a list of models. Saving or deleting any instance of these models invalidates the cache.
+
+    The url path and the language are always part of the cache key. The cache
+    isn't used for POST requests, or for ajax requests to endpoints.
+    """
+
+    page = Page(
+        parts__genres=Table(
+            auto__model=Genre,
+            cache__vary_on_user=False,
+            cache__models=[Genre],
+            cache__timeout=60 * 60,
+        ),
+    )
+
+    # @test
+    show_output(page)
+    # @end
+
+    # language=rst
+    """
+    A part that renders a CSRF token, like a `Form`, is never stored in the
+    cache, since the token is different for each visitor.
+
+    .. warning::
+
+        The model invalidation uses signals, so changes made by other
+        processes that haven't set up the same part (like a worker process)
+        or with `QuerySet.update()` don't invalidate the cache.
+    """
+
+
+def test_how_do_i_run_the_queries_of_a_page_concurrently(small_discography):
+    # language=rst
+    """
+    .. _concurrent-page:
+
+    How do I run the queries of the parts of a page concurrently?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    .. uses Page.concurrent
+
+    By default the parts of a page are rendered one after the other, so a
+    dashboard with four tables waits for four counts and four pages of rows
+    in a row. Set `concurrent` on the `Page` to fetch the rows of all tables,
+    and the choices of all forms, in a thread pool before rendering.
+    `concurrent=True` uses 4 threads, or you can set `concurrent__max_workers`.
+    The rendering is still done in order, in the thread of the request.
+    """
+
+    page = Page(
+        parts__albums=Table(auto__model=Album, page_size=5),
+        parts__artists=Table(auto__model=Artist),
+        parts__genres=Table(auto__model=Genre),
+        concurrent__max_workers=3,
+    )
+
+    # @test
+    show_output(page)
+    # @end
+
+    # language=rst
+    """
+    Each thread uses its own database connections. That also means the
+    threads can't see an open transaction, so inside `transaction.atomic()`
+    (or with `ATOMIC_REQUESTS`) the queries are run one after the other as
+    usual. With `as_async_view()` the thread pool is used instead of the
+    async ORM, which runs all queries in the same thread.
+    """
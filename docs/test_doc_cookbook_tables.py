@@ -2001,3 +2001,164 @@ def test_how_do_i_wrap_the_table_tag(small_discography):
     # @test
     show_output(table)
     # @end
+
+
+def test_how_do_i_cache_the_rendering_of_rows():
+    # language=rst
+    """
+    .. _table-row-cache:
+
+    How do I cache the rendering of rows?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    .. uses RowConfig.cache
+
+    For big tables where most rows don't change between requests, you can
+    cache the html of each row with `row__cache`. A row is cached on its `pk`
+    and the `version` attribute, so a model with a timestamp that is updated
+    on every save is a good fit:
+
+    .. code-block:: python
+
+        table = Table(
+            auto__model=Track,
+            row__cache__version='updated_at',
+        )
+
+    The cache is read with one `get_many` for all the rows on the page, and
+    only the rows that weren't in the cache are rendered. `version` can be a
+    path like `'album__updated_at'`. Rows without a `pk`, or with `None` for
+    the version, are always rendered. You can also configure:
+
+    - `timeout`: in seconds, defaults to the default timeout of the cache
+    - `alias`: which cache in `settings.CACHES` to use, defaults to `'default'`
+    - `vary_on_user`: defaults to `True`. Set it to `False` to share the cached rows between users.
+    - `key`: an extra value, or a callable, to add to the cache key
+
+    The style, the language and which columns are rendered are always part of
+    the cache key. The cache isn't used for POST requests, or for tables with
+    `auto_rowspan` columns since those depend on the rows around them.
+
+    .. warning::
+
+        Cells that depend on something other than the row (like the
+        selection checkboxes of a bulk form, or the request) need `key` or
+        `vary_on_user` to not show the wrong thing.
+    """
+
+
+def test_how_do_i_answer_with_304_not_modified(small_discography, settings):
+    # language=rst
+    """
+    .. _table-conditional-get:
+
+    How do I answer polling and repeated downloads with `304 Not Modified`?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    .. uses Part.conditional_get
+
+    Set `conditional_get` on a `Table` (or a `Page` with tables) to send an
+    `ETag` header, and answer a `GET` with `If-None-Match` or
+    `If-Modified-Since` with `304 Not Modified` before any row is fetched or
+    rendered. This also works for the endpoints of the table, like the CSV
+    export.
+
+    For a table on a `QuerySet` the ETag is built from the SQL of the sorted
+    and filtered rows, the url (so the page number and the endpoint), the
+    user, the language, the count of the rows and the max of
+    `last_modified_field`, with a single aggregate query. The max is also
+    sent as the `Last-Modified` header. The field must change whenever a row
+    is edited (like a field with `auto_now=True`), otherwise an edited row
+    would look the same. A table without `last_modified_field` or `etag`
+    gets no validators, and is never answered with a 304:
+    """
+
+    table = Table(
+        auto__model=Album,
+        conditional_get__last_modified_field='published_date',
+    )
+
+    # @test
+    response = table.bind(request=req('get')).render_to_response()
+    assert 'ETag' in response
+    # @end
+
+    # language=rst
+    """
+    You can also give `etag` and `last_modified` on any part, as values or
+    callables, for example the version of your deployment if the html changes
+    when you deploy. On a `Page` each of the parts must give validators too,
+    otherwise the page is never answered with a 304:
+    """
+
+    page = Page(
+        conditional_get__etag=lambda request, **_: settings.RELEASE_VERSION,
+        parts__albums=Table(
+            auto__model=Album,
+            conditional_get__last_modified_field='published_date',
+        ),
+    )
+
+    # @test
+    settings.RELEASE_VERSION = '1.0'
+    response = page.bind(request=req('get')).render_to_response()
+    assert 'ETag' in response
+    # @end
+
+    # language=rst
+    """
+    .. warning::
+
+        Only the values you configure, and the rows of tables with
+        `last_modified_field` or `etag`, are part of the ETag. The children
+        of a part other than a `Page` are not asked for validators. If such a
+        part shows something that can change, add it with `etag`.
+    """
+
+
+def test_how_do_i_stream_a_big_table(big_discography):
+    # language=rst
+    """
+    .. _table-stream:
+
+    How do I stream a big table?
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    .. uses Table.stream
+
+    For reports that show all the rows of a big table (with `page_size=None`),
+    set `stream=True`. The response is then a `StreamingHttpResponse`: the page
+    up to the rows (the header, the query form and the table head) is sent
+    first, then the rows in chunks as they are rendered, and then the rest of
+    the page. The browser can start showing the page right away, and for
+    unpaginated tables the rows aren't all kept in memory.
+    """
+
+    table = Table(
+        auto__model=Album,
+        page_size=None,
+        stream=True,
+    )
+
+    # @test
+    response = table.bind(request=req('get')).render_to_response()
+    assert response.streaming
+    # @end
+
+    # language=rst
+    """
+    The endpoints of the table, like the `tbody` used by the query form, are
+    not streamed. Neither is a table that is inside a part with `cache`.
+
+    The rows are rendered after the view has returned, so the table isn't
+    streamed when the request is in a transaction (like with
+    `ATOMIC_REQUESTS`), or when the SQL trace or the part timing is on, since
+    they would miss the queries of the rows.
+
+    .. note::
+
+        Middleware that reads `response.content` doesn't work with
+        streaming responses. Errors that happen while rendering the rows
+        can't be turned into an error page, since the start of the page has
+        already been sent.
+    """
@@ -161,6 +161,7 @@ def test_profile():
 
     - If you have gprof2dot installed you can also do `?_iommi_prof=graph` to get a graph output.
     - If you have snakeviz installed you can also do `?_iommi_prof=snake` to get snakeviz output.
+    - `?_iommi_prof=mem` measures memory allocations with `tracemalloc` instead. You get the memory allocated during the request that is still alive at the end, by file and line and by iommi part, and the peak memory use. Each memory profile gets a number, and you can compare a later memory profile with an earlier one with `?_iommi_prof=mem&_iommi_prof_compare=<number>`. The last 10 memory profiles are kept.
 
     .. note::
 
@@ -172,6 +173,36 @@ def test_profile():
     """
 
 
+def test_profile_aggregated():
+    # language=rst
+    """
+    Aggregated profiling in production
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    A single request is often too noisy to find the real hot spots. The
+    profiling middleware can also profile a random sample of normal traffic
+    with cProfile, and add up the stats per view. This is configured with
+    these settings:
+
+    - `IOMMI_PROFILE_SAMPLE_RATE`: the fraction of requests to profile, e.g. `0.01` for one in a hundred. Defaults to `0`, which turns this off.
+    - `IOMMI_PROFILE_FLUSH_INTERVAL`: how often, in seconds, each process writes its stats to disk. Defaults to 60.
+    - `IOMMI_PROFILE_DIR`: where the stats files are written. Defaults to `iommi_profiles` in the temp directory.
+
+    Each process writes one file per view, and the files of all processes
+    are merged when you look at them. The merged stats and a flamegraph per
+    view are shown by a staff only view that you add to your urls:
+
+    .. code-block:: python
+
+        from iommi.profiling import aggregated_profile_view
+
+        urlpatterns = [
+            # ...
+            path('_iommi_profiles/', aggregated_profile_view),
+        ]
+    """
+
+
 def test_profile_post():
     # language=rst
     """
@@ -223,9 +254,78 @@ def test_sql_trace():
         ... and 1 more unique statements
 
 
+    Queries are grouped by a fingerprint where literals, parameters and `IN`
+    lists are normalized, so `WHERE id = 1` and `WHERE id = 2` count as the
+    same query even if other queries run in between. A fingerprint that is
+    executed more than `settings.SQL_DEBUG_WORST_SUSPICIOUS_CUTOFF` times (3 by
+    default) is listed as a possible N+1 problem in the SQL trace page and in
+    the console. iommi also tells you which part (column, field, filter) was
+    being evaluated when the queries were issued, and suggests the
+    `select_related`/`prefetch_related` that would remove them when it can
+    figure that out from the model:
+
+    .. code-block::
+
+        From iommi part: columns__artist_name
+        Suggestion: select_related('artist')
+
     If you want more detailed information in your console to debug a problem you can set
     `settings.SQL_DEBUG` to `'all'` (which prints all SQL statements), `'stacks'` (all SQL statements with tracebacks). You can also set it to `None` to turn it off.
 
 
     You can use this middleware on non-iommi views too. Just add `?_iommi_sql_trace` to your url.
     """
+
+
+def test_sql_trace_sampling():
+    # language=rst
+    """
+    Sampled SQL trace in production
+    ~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~
+
+    Tracing every request is too expensive to leave on under production load,
+    but the SQL trace middleware can sample requests instead. Sampling is only
+    used when `settings.SQL_DEBUG` is `None`, and is configured with these settings:
+
+    - `SQL_DEBUG_SAMPLE_EVERY`: trace one request in N
+    - `SQL_DEBUG_SAMPLE_SLOW_THRESHOLD`: only keep traced requests that took at least this many seconds. If this is set but `SQL_DEBUG_SAMPLE_EVERY` is not, all requests are traced. The stacks of the queries are only captured once a request has run for this long, so the queries before that have no stack.
+    - `SQL_DEBUG_SAMPLE_KEEP`: how many requests to keep in memory, per process. Defaults to 50.
+
+    For sampled requests the stack for each query is captured without reading
+    any source code, and is only formatted when you look at it. Nothing is
+    printed to the console.
+
+    The kept requests are shown by a staff only view that you add to your urls:
+
+    .. code-block:: python
+
+        from iommi.sql_trace import sampled_requests_view
+
+        urlpatterns = [
+            # ...
+            path('_iommi_sql_samples/', sampled_requests_view),
+        ]
+    """
+
+
+def test_timing():
+    # language=rst
+    """
+    Timing
+    ------
+
+    Press this tool (or add `?_iommi_timing` to your url) to see where the time
+    of the current page goes, per part. For each part iommi measures the wall
+    time, the number of SQL queries and the SQL time spent on binding and
+    rendering it, on producing the rows of a table and on validating a form.
+    The numbers are aggregated per path and shown as a tree at the bottom of
+    the debug panel. The "Tree" tool also gets timing columns when you open it
+    from a timed page.
+
+    The numbers include the children, so the bind time of a table includes
+    binding its columns. The bind of the rows of a table is under `row`.
+
+    Timing is available to all users in debug mode, and to staff users in
+    production. When it's not turned on the cost is a single attribute check
+    per bind and render.
+    """
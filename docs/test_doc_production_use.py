@@ -110,3 +110,82 @@ class Admin(iommi.admin.Admin):
         class Meta:
             table_class = EditTable
             form_class = Form
+
+
+def test_async_views(small_discography):
+    # language=rst
+    """
+    Async views
+    ~~~~~~~~~~~
+
+    When you run under ASGI you can use `as_async_view()` instead of
+    `as_view()`. The part is rendered with `arender_to_response()`, which
+    fetches the rows of all tables and the `QuerySet` choices of all forms
+    on the page with the async ORM before rendering. The
+    iommi middleware does the same for parts returned from async views.
+
+    The binding and the rendering are synchronous, and are done in a thread
+    with `sync_to_async`, so they can use the sync ORM, like a lazy relation
+    in a cell. Note that the async ORM of Django runs its queries in one
+    thread too, so the prefetches are not run in parallel in the database.
+    Requests with `ATOMIC_REQUESTS` and requests with part timing turned on
+    use the sync path.
+    """
+    from django.urls import path
+    from iommi import Table
+    from docs.models import Album
+
+    urlpatterns = [
+        path('albums/', Table(auto__model=Album).as_async_view()),
+    ]
+
+    # language=rst
+    """
+    The `func` of an endpoint can be an `async def`. It's awaited in the event
+    loop on the async path, and run to completion on the sync path.
+    """
+
+    async def album_count(**_):
+        return await Album.objects.acount()
+
+    table = Table(
+        auto__model=Album,
+        endpoints__count__func=album_count,
+    )
+
+    # @test
+    import json
+    from asgiref.sync import async_to_sync
+
+    assert urlpatterns
+    response = async_to_sync(table.as_async_view())(req('get', **{'/count': ''}))
+    assert json.loads(response.content) == Album.objects.count()
+    response = table.bind(request=req('get', **{'/count': ''})).render_to_response()
+    assert json.loads(response.content) == Album.objects.count()
+    # @end
+
+
+def test_native_templates(settings):
+    # language=rst
+    """
+    Built-in templates
+    ~~~~~~~~~~~~~~~~~~
+
+    The most used built-in templates of iommi, like the ones for tables,
+    headers, paginators, forms and menus, are rendered by plain python
+    functions that produce the same html as the templates, since that is a
+    lot faster than the template engine. If you override one of these
+    templates in your project, or the template engine is configured with
+    non-default options like `string_if_invalid`, your template is used as
+    usual.
+
+    To always use the template engine, set `IOMMI_NATIVE_TEMPLATES` to `False`
+    in your settings:
+    """
+    settings.IOMMI_NATIVE_TEMPLATES = False
+
+    # @test
+    from iommi.native_templates import get_native_renderer
+
+    assert get_native_renderer(req('get'), 'iommi/table/header.html') is None
+    # @end
@@ -1,4 +1,5 @@
 import pytest
+from django.core.files.storage import FileSystemStorage
 from django.db import models
 from docs.models import *
 from iommi import *
@@ -205,8 +206,142 @@ class Meta:
     `extra__report_columns_all=True` on the table to include all columns, using each
     column's name as its header. An explicit `extra_evaluated__report_name` on a column
     still takes precedence over the column name.
+
+    Formatting a very large export is CPU bound. With `extra__report_processes`
+    the rows are split in ranges of primary keys, and each range is formatted
+    in a worker process with its own database connection. The ranges are
+    streamed in order, so the result is the same file. This is used for the
+    `csv` and `ndjson` endpoints when the rows are a `QuerySet` in primary key
+    order (or without an order), on platforms that can fork, outside of
+    transactions, and in a process with a single thread, since forking a
+    process with more threads can deadlock. So this needs a single threaded
+    worker, like a sync worker of gunicorn. Otherwise the rows are formatted
+    in this process as usual.
+    Note that `preprocess_rows` is called for each range.
     """
 
+    class AlbumTable(Table):
+        class Meta:
+            extra_evaluated__report_name = 'Albums'
+            extra__report_processes = 4
+            rows = Album.objects.all()
+
+        name = Column(extra_evaluated__report_name='Name')
+
+    # language=rst
+    """
+    The same columns can be exported with their types, instead of as text, by
+    the `xlsx` endpoint as an Excel file and by the `parquet` endpoint as a
+    Parquet file. These need `openpyxl` and `pyarrow` respectively. The XLSX
+    file is written with a write-only workbook, so only one row is in memory
+    at a time. If the rows are a `QuerySet` and all the columns are plain
+    model fields (no `cell__value`, no `extra_evaluated__report_value` and no
+    `preprocess_rows`), the Parquet file is built directly from
+    `values_list`, without creating the objects and cells of the rows. The
+    Parquet file is written in batches of rows, with the types of the first
+    batch. A column that has no values in the first batch is written as
+    text. Both endpoints answer 404 for a table without
+    `extra_evaluated__report_name` and report columns.
+    """
+
+    # language=rst
+    """
+    An export that takes longer than a request should can be run in the
+    background instead. POST to the `csv_job` endpoint to start a job. It
+    writes the CSV with the filters, sort order and columns of that request to
+    a file in the storage in `extra__report_storage` (Django's default storage
+    if not set), and returns the id of the job. Pass the id to the
+    `job_progress` endpoint to get the number of rows written so far and the
+    total, and to the `job_download` endpoint to get the file when it's done.
+    Only the user that started a job can see it.
+
+    The jobs run in threads in the process that got the request, with the
+    language and time zone of the request. Their state is kept in the
+    default cache, so with more than one process you need a cache that is
+    shared between them. With the default local memory cache the
+    `job_progress` and `job_download` endpoints only work in the process
+    that started the job.
+
+    Each user can have one job running at a time, and each process runs or
+    queues at most `iommi.export_jobs.MAX_QUEUED_JOBS` jobs. Beyond that
+    `csv_job` answers with a 429 or a 503.
+
+    The state is kept for a day. After that the file can't be downloaded
+    anymore, and it's deleted when a job is started, at most every
+    `iommi.export_jobs.CLEANUP_INTERVAL` seconds. If jobs are started rarely
+    you can also call `iommi.export_jobs.delete_expired_export_files(storage)`
+    from a periodic task.
+    """
+
+    class AlbumTable(Table):
+        class Meta:
+            extra_evaluated__report_name = 'Albums'
+            extra__report_storage = FileSystemStorage(location='/tmp/exports')
+            rows = Album.objects.all()
+
+        name = Column(extra_evaluated__report_name='Name')
+
+
+def test_table_json(small_discography):
+    # language=rst
+    """
+    Table as JSON
+    -------------
+
+    Tables can have a `json` endpoint that returns the values of the cells
+    of the current page, with the same sorting, filtering and pagination as
+    the html. It skips the formatting, attrs and templates entirely, so it's
+    much cheaper than scraping the `tbody` endpoint. It's turned on with
+    `endpoints__json__include=True`. Ask for the columns you want as a comma
+    separated list, or leave it empty to get all the rendered columns with an
+    `attr`:
+    """
+
+    albums = Table(
+        auto__model=Album,
+        page_size=2,
+        endpoints__json__include=True,
+    ).as_view()
+
+    # @test
+    response = albums(request=req('get', **{'/json': 'name,year'}))
+    show_output(b'<pre>' + response.content + b'</pre>')
+    # @end
+
+    # language=rst
+    """
+    Model instances are returned as their `pk`, and many-to-many columns as a
+    list of `pk`. Use `extra__json_value` on a column to change how a value
+    is serialized:
+    """
+
+    albums = Table(
+        auto__model=Album,
+        columns__artist__extra__json_value=lambda value, **_: value.name,
+        endpoints__json__include=True,
+        endpoints__ndjson__include=True,
+    ).as_view()
+
+    # @test
+    response = albums(request=req('get', **{'/json': 'name,artist'}))
+    show_output(b'<pre>' + response.content + b'</pre>')
+    # @end
+
+    # language=rst
+    """
+    For big exports there is also an `ndjson` endpoint, turned on with
+    `endpoints__ndjson__include=True`. It streams one JSON object per line,
+    without keeping all the rows in memory. It gives the rows of the current
+    page, which is all the rows for a table with `page_size=None`. Set
+    `extra__ndjson_max_rows` to give at most that many rows instead,
+    ignoring the pagination:
+    """
+
+    # @test
+    response = albums(request=req('get', **{'/ndjson': 'name,year'}))
+    show_output(b'<pre>' + b''.join(response.streaming_content) + b'</pre>')
+    # @end
+
 
 def test_table_of_plain_python_objects():
     # language=rst
@@ -1,3 +1,4 @@
+from contextlib import nullcontext
 from functools import wraps
 
 import django
@@ -50,6 +51,11 @@
 )
 from iommi.panel import Panel, PanelCol
 from iommi.part import Part
+from iommi.part_timing import (
+    PartTimings,
+    part_timings_for_request,
+    should_time_parts,
+)
 from iommi.query import (
     Filter,
     Query,
@@ -84,22 +90,43 @@ def render_if_needed(request, response):
         return response
 
 
+def declaration_exception(part: Part):
+    """
+    A synthetic exception pointing at where `part` was declared, to chain
+    exceptions from rendering it to. `None` if that isn't known.
+    """
+    filename, lineno = part._instantiated_at_info
+    if filename is None:
+        return None
+
+    from iommi.synthetic_traceback import SyntheticException
+
+    return SyntheticException(
+        tb=[dict(filename=filename, f_lineno=lineno, function='<iommi declaration>', f_globals={}, f_locals={})]
+    )
+
+
 def render_part(request: HttpRequest, part: Part):
     try:
         if not part._is_bound:
             part = part.bind(request=request)
         return part.render_to_response()
     except Exception as e:
-        filename, lineno = part._instantiated_at_info
-        if filename is None:
+        fake = declaration_exception(part)
+        if fake is None:
             raise
+        raise e from fake
 
-        from iommi.synthetic_traceback import SyntheticException
-
-        fake = SyntheticException(
-            tb=[dict(filename=filename, f_lineno=lineno, function='<iommi declaration>', f_globals={}, f_locals={})]
-        )
 
+async def arender_part(request: HttpRequest, part: Part):
+    try:
+        if not part._is_bound:
+            part = await sync_to_async(part.bind)(request=request)
+        return await part.arender_to_response()
+    except Exception as e:
+        fake = declaration_exception(part)
+        if fake is None:
+            raise
         raise e from fake
 
 
@@ -130,6 +157,9 @@ def _setup_request(self, request):
 
         request.iommi_fallback_debug_panel = lambda: iommi_debug_panel_for_view_function(request)
 
+        if should_time_parts(request):
+            request.iommi_part_timings = PartTimings()
+
     def _render_part(self, request, response):
         from django.db import transaction
 
@@ -143,18 +173,36 @@ def __call__(self, request):
         if iscoroutinefunction(self):
             return self.__acall__(request)
         self._setup_request(request)
-        response = self.get_response(request)
-        if isinstance(response, Part):
-            return self._render_part(request, response)
+        with self._sql_timed(request):
+            response = self.get_response(request)
+            if isinstance(response, Part):
+                return self._render_part(request, response)
         return response
 
     async def __acall__(self, request):
         self._setup_request(request)
         response = await self.get_response(request)
         if isinstance(response, Part):
-            return await sync_to_async(self._render_part)(request, response)
+            if self._needs_sync_render(request):
+                # Database connections are per thread, so only the SQL of the render is timed here
+                return await sync_to_async(self._render_part_sql_timed)(request, response)
+            return await arender_part(request, response)
         return response
 
+    def _needs_sync_render(self, request):
+        # Transactions and the SQL timing are per thread, so they need the whole render in one thread
+        not_atomic_for = getattr(request, 'iommi_not_atomic_for', set())
+        atomic = any(alias not in not_atomic_for for alias in self.atomic_db_aliases)
+        return atomic or part_timings_for_request(request) is not None
+
+    def _sql_timed(self, request):
+        timings = part_timings_for_request(request)
+        return timings.sql_wrapped() if timings is not None else nullcontext()
+
+    def _render_part_sql_timed(self, request, response):
+        with self._sql_timed(request):
+            return self._render_part(request, response)
+
 
 def iommi_render(view):
     @wraps(view)
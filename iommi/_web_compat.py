@@ -2,11 +2,12 @@
 from django.core.exceptions import ImproperlyConfigured
 from django.template import RequestContext
 from django.template.backends.django import Template as DjangoLoadedTemplate
-from django.template.loader import render_to_string
 from django.utils.html import format_html as django_format_html
 from django.utils.http import url_has_allowed_host_and_scheme
 from django.utils.safestring import mark_safe
 
+from iommi.native_templates import render_native_or_template
+
 DjangoTemplate = None
 JinjaTemplate = None
 
@@ -90,7 +91,8 @@ def render_template(request, template, context):
     if template is None:
         return ''
     elif isinstance(template, str):
-        return mark_safe(render_to_string(template_name=template, context=context, request=request))
+        # Built-in templates are rendered in python, unless they are overridden
+        return mark_safe(render_native_or_template(request=request, template_name=template, context=context))
     elif isinstance(template, DjangoLoadedTemplate):
         return mark_safe(template.render(context=context, request=request))
     elif isinstance(template, get_template_types()):
@@ -1,12 +1,19 @@
 import functools
+import zlib
 from urllib.parse import urlencode
+from uuid import uuid4
 
 from django.apps import apps as django_apps
 from django.conf import settings
 from django.contrib import (
     messages,
 )
+from django.core.cache import cache
 from django.db.models import Model
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+)
 from django.http import (
     Http404,
     HttpResponseRedirect,
@@ -113,7 +120,87 @@ def read_config_wrapper(self, *args, **kwargs):
     return read_config_wrapper
 
 
+model_index_fingerprint = zlib.crc32(' '.join(sorted(joined_app_name_and_model)).encode())
+
+PERMISSIONS_VERSION_CACHE_KEY = 'iommi_admin_permissions_version'
+PERMISSIONS_SESSION_KEY = 'iommi_admin_visible_models'
+
+
+def permissions_version():
+    return cache.get_or_set(PERMISSIONS_VERSION_CACHE_KEY, lambda: uuid4().hex, timeout=None)
+
+
+def invalidate_permissions(**_):
+    """
+    Invalidate the permissions cached in the sessions of all users. This is
+    connected to the signals for changes of users, groups and permissions, but
+    you need to call it yourself if you change permissions some other way.
+    """
+    cache.set(PERMISSIONS_VERSION_CACHE_KEY, uuid4().hex, timeout=None)
+
+
+def connect_permission_signals():
+    from django.contrib.auth import get_user_model
+    from django.contrib.auth.models import (
+        Group,
+        Permission,
+    )
+
+    user_model = get_user_model()
+    senders = [Group.permissions.through]
+    for name in ['groups', 'user_permissions']:
+        field = getattr(user_model, name, None)
+        if field is not None:
+            senders.append(field.through)
+    for sender in senders:
+        m2m_changed.connect(invalidate_permissions, sender=sender, dispatch_uid=f'iommi_admin_{sender._meta.label}')
+    for sender in [Group, Permission]:
+        post_delete.connect(invalidate_permissions, sender=sender, dispatch_uid=f'iommi_admin_{sender._meta.label}')
+
+
+def format_model_row(row, **_):
+    return row.name
+
+
+def build_model_index(apps):
+    by_app = []
+    for app_name, models in items(django_apps.all_models):
+        for model_name, model in sorted(items(models), key=lambda x: x[1]._meta.verbose_name_plural):
+            key = f'{app_name}_{model_name}'
+            conf = apps.get(key, {})
+            by_app.append(
+                Struct(
+                    name=conf.get('name', model._meta.verbose_name_plural.capitalize()),
+                    group=conf.get('group', app_verbose_name_by_label.get(app_name, app_name)),
+                    app_name=app_name,
+                    model_name=model_name,
+                    model=model,
+                    url='{}/{}/'.format(app_name, model_name),
+                    format=format_model_row,
+                    key=key,
+                    included=conf.get('include', False),
+                )
+            )
+    return Struct(
+        by_app=by_app,
+        by_group=sorted(by_app, key=lambda row: (row.group, row.name)),
+    )
+
+
+def get_model(app_name, model_name):
+    return django_apps.all_models[app_name][model_name] if app_name and model_name else None
+
+
+def get_instance(model, pk):
+    try:
+        return model.objects.get(pk=pk)
+    except model.DoesNotExist:
+        raise Http404()
+
+
 class Admin(Page):
+    _model_index = None
+
     class Meta:
         table_class = EditTable
         form_class = Form
@@ -197,30 +284,47 @@ def __init__(self, apps, parts, **kwargs):
         super(Admin, self).__init__(parts=parts, apps=apps, **kwargs)
 
     def refine_with_params(self, app_name: str | None = None, model_name: str | None = None, pk: str | None = None):
+        refined_admin = self._refine_with_model(app_name=app_name, model_name=model_name, has_instance=pk is not None)
+        if pk is not None:
+            refined_admin = refined_admin.refine(instance=get_instance(get_model(app_name, model_name), pk))
+        return refined_admin
+
+    def _refine_with_model(self, *, app_name, model_name, has_instance):
         refined_admin = self.refine(app_name=app_name, model_name=model_name)
 
-        model = django_apps.all_models[app_name][model_name] if app_name and model_name else None
-        try:
-            instance = model.objects.get(pk=pk) if pk is not None else None
-        except model.DoesNotExist:
-            raise Http404()
+        model = get_model(app_name, model_name)
 
-        if model is not None and instance is None:
+        if model is not None and not has_instance:
             refined_admin = refined_admin.refine(
                 model=model,
                 parts__list__auto__model=model,
                 parts__create__auto__model=model,
             )
 
-        if instance is not None:
+        if has_instance:
+            # The instance is read from the admin when the page is bound, so
+            # the refined page doesn't depend on which instance it shows
             refined_admin = refined_admin.refine(
-                parts__edit__auto__instance=instance,
-                parts__delete__auto__instance=instance,
+                parts__edit__auto__model=model,
+                parts__edit__instance=lambda admin, **_: admin.instance,
+                parts__delete__auto__model=model,
+                parts__delete__instance=lambda admin, **_: admin.instance,
             )
 
         return refined_admin
 
     def as_view(self):
+        # The refined pages only depend on the app and model, so they are
+        # cached and the instance of edit and delete pages is passed when
+        # the page is bound.
+        @functools.lru_cache(maxsize=getattr(settings, 'IOMMI_ADMIN_PAGE_CACHE_SIZE', 128))
+        def cached_page(app_name, model_name, has_instance):
+            return self._refine_with_model(
+                app_name=app_name,
+                model_name=model_name,
+                has_instance=has_instance,
+            ).refine_done()
+
         def admin_view(request, *args, **kwargs):
             app_name = kwargs.pop('app_name', None)
 
@@ -229,23 +333,40 @@ def admin_view(request, *args, **kwargs):
                     f'{reverse(login, current_app=app_name)}?{urlencode(dict(next=request.path))}'
                 )
 
-            final_page = self.refine_with_params(
-                app_name=app_name,
-                model_name=kwargs.pop('model_name', None),
-                pk=kwargs.pop('pk', None),
-            ).refine_done()
+            model_name = kwargs.pop('model_name', None)
+            pk = kwargs.pop('pk', None)
+
+            if getattr(settings, 'IOMMI_REFINE_DONE_OPTIMIZATION', True):
+                final_page = cached_page(app_name, model_name, pk is not None)
+            else:
+                final_page = self._refine_with_model(
+                    app_name=app_name,
+                    model_name=model_name,
+                    has_instance=pk is not None,
+                ).refine_done()
+
+            instance = get_instance(get_model(app_name, model_name), pk) if pk is not None else None
 
             if not self.has_permission(
-                request, instance=final_page.instance, model=final_page.model, operation=final_page.operation
+                request, instance=instance, model=final_page.model, operation=final_page.operation
             ):
                 raise Http404()
 
             view = build_as_view_wrapper(final_page)
 
+            if instance is not None:
+                kwargs['instance'] = instance
+
             return view(request, *args, **kwargs)
 
+        admin_view.cache_info = cached_page.cache_info
         return admin_view
 
+    def on_bind(self) -> None:
+        if self.instance is None:
+            self.instance = self.iommi_evaluate_parameters()['params'].get('instance')
+        super(Admin, self).on_bind()
+
     def on_refine_done(self):
         part_name = ''
         assert self.operation
@@ -323,41 +444,66 @@ def has_permission(request, operation, model=None, instance=None):
     def own_evaluate_parameters(self):
         return dict(admin=self, **super(Admin, self).own_evaluate_parameters())
 
+    def model_index(self):
+        """
+        The rows for all models, in app order and in group order. This only
+        depends on the `apps` config, so it is built once per admin.
+        """
+        if self._model_index is None:
+            self._model_index = build_model_index(self.apps)
+        return self._model_index
+
+    def visible_model_keys(self, request):
+        """
+        The keys of the models the user can view. With
+        `settings.IOMMI_ADMIN_CACHE_PERMISSIONS = True` this is cached in the
+        session until the permissions of the user change.
+        """
+        session = getattr(request, 'session', None)
+        if not getattr(settings, 'IOMMI_ADMIN_CACHE_PERMISSIONS', False):
+            session = None
+
+        user = request.user
+        user_pk = getattr(user, 'pk', None)
+        cache_key = dict(
+            version=permissions_version(),
+            models=model_index_fingerprint,
+            # The session must be serializable as json, so a UUID pk must be a string
+            user=str(user_pk) if user_pk is not None else None,
+            is_staff=user.is_staff,
+            is_superuser=user.is_superuser,
+        )
+        if session is not None:
+            cached = session.get(PERMISSIONS_SESSION_KEY)
+            if cached is not None and cached['key'] == cache_key:
+                return frozenset(cached['keys'])
+
+        keys = [
+            row.key
+            for row in self.model_index().by_app
+            if self.has_permission(request, instance=None, model=row.model, operation='view')
+        ]
+        if session is not None:
+            session[PERMISSIONS_SESSION_KEY] = dict(key=cache_key, keys=keys)
+        return frozenset(keys)
+
     @classmethod
     @with_defaults(
         operation='all_models',
     )
     def all_models(cls, table=None, **kwargs):
         def rows_raw(admin, request, included_filter=False, **_):
-            for app_name, models in items(django_apps.all_models):
-                for model_name, model in sorted(items(models), key=lambda x: x[1]._meta.verbose_name_plural):
-                    key = f'{app_name}_{model_name}'
-                    conf = admin.apps.get(key, {})
-                    included = conf.get('include', False)
-                    if included == included_filter:
-                        continue
-
-                    if not cls.has_permission(request, instance=None, model=model, operation='view'):
-                        continue
+            visible_keys = admin.visible_model_keys(request)
+            for row in admin.model_index().by_app:
+                if row.included != included_filter and row.key in visible_keys:
+                    yield row
 
-                    group = conf.get('group', app_verbose_name_by_label[app_name])
-
-                    yield Struct(
-                        name=conf.get('name', model._meta.verbose_name_plural.capitalize()),
-                        group=group,
-                        app_name=app_name,
-                        model_name=model_name,
-                        url='{}/{}/'.format(app_name, model_name),
-                        format=lambda row, **_: row.name,
-                        key=key,
-                    )
-
-        def rows(admin, request, included_filter=False, **_):
+        def rows(admin, request, **_):
+            visible_keys = admin.visible_model_keys(request)
             last_group = None
-            for row in sorted(
-                rows_raw(admin=admin, request=request, included_filter=included_filter),
-                key=lambda row: (row.group, row.name),
-            ):
+            for row in admin.model_index().by_group:
+                if not row.included or row.key not in visible_keys:
+                    continue
                 if last_group != row.group:
                     yield Struct(
                         name=row.group,
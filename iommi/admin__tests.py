@@ -1,8 +1,12 @@
+import json
 from unittest import mock
 from uuid import uuid4
 
 import pytest
-from django.contrib.auth.models import User
+from django.contrib.auth.models import (
+    Permission,
+    User,
+)
 from django.http import (
     Http404,
     HttpResponseRedirect,
@@ -210,6 +214,35 @@ def test_404_for_non_include(settings, success, admin, kwargs):
             view(request=request, **kwargs)
 
 
+@pytest.mark.django_db
+def test_edit_page_is_cached_per_model(settings):
+    settings.ROOT_URLCONF = __name__
+    first = Foo.objects.create(foo=7)
+    second = Foo.objects.create(foo=11)
+
+    view = Admin.edit(apps__tests_foo__include=True).as_view()
+
+    def edit(instance):
+        return view(request=staff_req('get'), app_name='tests', model_name='foo', pk=instance.pk).content.decode()
+
+    assert 'value="7"' in edit(first)
+    assert 'value="11"' in edit(second)
+    assert view.cache_info().misses == 1
+    assert view.cache_info().hits == 1
+
+
+@pytest.mark.django_db
+def test_edit_page_post_through_cached_page(settings):
+    settings.ROOT_URLCONF = __name__
+    Foo.objects.create(foo=7)
+    f = Foo.objects.create(foo=8)
+
+    view = Admin.edit(apps__tests_foo__include=True).as_view()
+    request = staff_req('post', foo=12, **{'-submit': ''})
+    view(request=request, app_name='tests', model_name='foo', pk=f.pk)
+
+    assert sorted(Foo.objects.values_list('foo', flat=True)) == [7, 12]
+
 
 def test_messages():
     request = req('get')
@@ -224,6 +257,47 @@ def test_all_models(settings):
     assert 'Authentication' in Admin.all_models().bind(request=request).render_to_response().content.decode()
 
 
+@pytest.mark.django_db
+def test_all_models_permissions_are_not_cached_by_default(settings):
+    settings.ROOT_URLCONF = __name__
+    request = staff_req('get')
+    request.session = {}
+    with mock.patch.object(Admin, 'has_permission', return_value=True) as has_permission:
+        Admin.all_models().bind(request=request).render_to_response()
+    assert has_permission.called
+    assert request.session == {}
+
+
+@pytest.mark.django_db
+def test_all_models_permissions_are_cached_in_session(settings):
+    settings.ROOT_URLCONF = __name__
+    settings.IOMMI_ADMIN_CACHE_PERMISSIONS = True
+    user = User.objects.create(username='staff', is_staff=True)
+    session = {}
+    admin = Admin.all_models(apps__auth_user__include=True, apps__auth_group__include=True).refine_done()
+
+    def all_models():
+        request = req('get')
+        request.user = User.objects.get(pk=user.pk)
+        request.session = session
+        return admin.bind(request=request).render_to_response().content.decode()
+
+    assert 'Users' not in all_models()
+    assert session['iommi_admin_visible_models']['keys'] == []
+
+    with mock.patch.object(Admin, 'has_permission') as has_permission:
+        all_models()
+    assert not has_permission.called
+
+    user.user_permissions.add(Permission.objects.get(codename='view_user'))
+    content = all_models()
+    assert 'Users' in content
+    assert 'Groups' not in content
+    assert session['iommi_admin_visible_models']['keys'] == ['auth_user']
+    assert session['iommi_admin_visible_models']['key']['user'] == str(user.pk)
+    assert json.loads(json.dumps(session)) == session
+
+
 @pytest.mark.django_db
 def test_login_to_admin(settings, client):
     settings.ROOT_URLCONF = __name__
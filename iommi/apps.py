@@ -19,6 +19,10 @@ def ready(self):
         register_search_fields(model=User, search_fields=['username'])
         register_search_fields(model=Permission, search_fields=['codename'])
 
+        from iommi.admin import connect_permission_signals
+
+        connect_permission_signals()
+
         from iommi import Style, register_style
         from iommi.style_base import base
         from iommi.style_bootstrap import bootstrap
@@ -0,0 +1,33 @@
+import asyncio
+
+from django.core.exceptions import SynchronousOnlyOperation
+
+
+async def awaited(awaitable):
+    return await awaitable
+
+
+async def afetch(queryset):
+    """
+    Evaluate a `QuerySet` with the async ORM. The result is cached on the
+    `QuerySet`, so iterating it later doesn't hit the database.
+    """
+    async for _ in queryset:
+        pass
+
+
+async def aprefetch(part):
+    """
+    Fetch the data of a bound part and its children with the async ORM
+    before the part is rendered.
+    """
+    try:
+        prefetches = list(part.iommi_async_prefetches())
+    except SynchronousOnlyOperation:
+        # Binding the children needed the sync ORM, so they are fetched by the render
+        return
+
+    results = await asyncio.gather(*[prefetch() for prefetch in prefetches], return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException) and not isinstance(result, SynchronousOnlyOperation):
+            raise result
@@ -0,0 +1,137 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import connection
+
+from docs.models import (
+    Album,
+    Artist,
+    Genre,
+)
+from iommi import (
+    Field,
+    Form,
+    Page,
+    Table,
+    middleware,
+)
+from iommi.part import Part
+from tests.helpers import req
+
+
+@pytest.fixture
+def render_queries():
+    # The number of queries of each render, after the async prefetch
+    counts = []
+    render_root_response = Part._render_root_response
+
+    def spy(self, **kwargs):
+        queries = []
+
+        def count(execute, *args):
+            queries.append(args)
+            return execute(*args)
+
+        with connection.execute_wrapper(count):
+            result = render_root_response(self, **kwargs)
+        counts.append(len(queries))
+        return result
+
+    with mock.patch.object(Part, '_render_root_response', spy):
+        yield counts
+
+
+@pytest.fixture
+def albums():
+    artist = Artist.objects.create(name='Black Sabbath')
+    genre = Genre.objects.create(name='Heavy Metal')
+    for i in range(5):
+        album = Album.objects.create(name=f'Album {i}', artist=artist, year=1980 + i)
+        album.genres.add(genre)
+
+
+@pytest.mark.django_db
+def test_async_view(albums, render_queries, django_assert_num_queries):
+    def table():
+        return Table(auto__model=Album, page_size=2)
+
+    expected = table().as_view()(req('get', page='2')).content
+
+    # The count, the page of rows and the prefetched genres
+    with django_assert_num_queries(3):
+        response = async_to_sync(table().as_async_view())(req('get', page='2'))
+    assert response.content == expected
+    assert 'Album 3' in response.content.decode()
+    # The sync render does the queries itself, the async one has them prefetched
+    assert render_queries == [3, 0]
+
+
+@pytest.mark.django_db
+def test_async_view_prefetches_concurrently(albums, render_queries):
+    page = Page(
+        parts__albums=Table(auto__model=Album),
+        parts__artists=Table(auto__model=Artist),
+        parts__form=Form(fields__genre=Field.choice(choices=Genre.objects.all())),
+    )
+
+    content = async_to_sync(page.as_async_view())(req('get')).content.decode()
+    assert 'Album 4' in content
+    assert 'Black Sabbath' in content
+    assert 'Heavy Metal' in content
+    assert render_queries == [0]
+
+
+@pytest.mark.django_db
+def test_async_view_renders_with_the_sync_orm_once(albums, render_queries):
+    calls = []
+
+    def name_format(row, **_):
+        calls.append(row.pk)
+        return row.name
+
+    table = Table(
+        auto__model=Album,
+        columns__name__cell__format=name_format,
+        columns__year__cell__format=lambda row, **_: f'{row.year} ({Album.objects.filter(year__lt=row.year).count()})',
+    )
+
+    content = async_to_sync(table.as_async_view())(req('get')).content.decode()
+    assert '1984 (4)' in content
+    # The callbacks before the first query are not run again
+    assert len(calls) == 5
+    assert render_queries == [5]
+
+
+@pytest.mark.django_db
+def test_async_view_post_runs_in_a_thread():
+    form = Form.create(auto__model=Artist)
+    response = async_to_sync(form.as_async_view())(req('post', name='Dio', **{'-submit': ''}))
+    assert response.status_code == 302
+    assert Artist.objects.get().name == 'Dio'
+
+
+def test_async_endpoint():
+    async def echo(value, **_):
+        await asyncio.sleep(0)
+        return dict(value=value)
+
+    page = Page(endpoints__echo__func=echo)
+
+    response = async_to_sync(page.as_async_view())(req('get', **{'/echo': 'async'}))
+    assert response.content == b'{"value": "async"}'
+
+    # Async endpoints also work in the sync path
+    response = page.bind(request=req('get', **{'/echo': 'sync'})).render_to_response()
+    assert response.content == b'{"value": "sync"}'
+
+
+@pytest.mark.django_db
+def test_middleware_async(albums, render_queries):
+    async def get_response(request):
+        return Table(auto__model=Album)
+
+    response = async_to_sync(middleware(get_response))(req('get'))
+    assert 'Album 4' in response.content.decode()
+    assert render_queries == [0]
@@ -1,3 +1,5 @@
+from copy import deepcopy
+
 from django.utils.safestring import mark_safe
 
 from iommi.base import items
@@ -9,6 +11,7 @@
 from iommi.evaluate import (
     evaluate_as_needed_recursively,
     evaluate_strict,
+    is_callable,
 )
 
 
@@ -19,6 +22,14 @@ def evaluate_attrs(obj, **kwargs):
     if not attrs and not iommi_debug_on():  # pragma: no mutate
         return ''
 
+    compiled = getattr(attrs, '_iommi_compiled_attrs', None)
+    if compiled is not None and compiled.is_unchanged(attrs):
+        return compiled.evaluate(obj, kwargs)
+
+    return _evaluate_attrs(obj, attrs, kwargs)
+
+
+def _evaluate_attrs(obj, attrs, kwargs):
     classes = evaluate_strict(attrs.get('class', {}), **kwargs)
 
     assert not isinstance(
@@ -53,6 +64,119 @@ def evaluate_attrs(obj, **kwargs):
     )
 
 
+def _snapshot(d):
+    return {k: _snapshot(v) if isinstance(v, dict) else v for k, v in items(d)}
+
+
+def _has_path_keys(d):
+    return any('__' in k or (isinstance(v, dict) and _has_path_keys(v)) for k, v in items(d))
+
+
+def _copy(d, type_of_namespace=Namespace):
+    result = type_of_namespace.__new__(type_of_namespace)
+    dict.update(result, {k: _copy_value(v) for k, v in items(d)})
+    return result
+
+
+def _copy_value(v):
+    if isinstance(v, Namespace):
+        return _copy(v)
+    if isinstance(v, dict | list):
+        return deepcopy(v)
+    return v
+
+
+class CompiledAttrs:
+    """
+    An attrs namespace split in the values that are the same for every bind
+    and the callables that need to be evaluated. If there are no callables
+    the html is rendered once, and reused as long as the evaluated attrs are
+    not changed.
+
+    The compiled attrs belong to the namespace object they were compiled from,
+    or the `source` they were made from, and `matches` is an identity check.
+    The attrs of a part are often changed in place in `on_bind`, so on bind
+    `is_unchanged` also compares them to a snapshot. The cells of a column
+    only check the identity, so code that changes the cell attrs of a bound
+    column in place needs to reset its compiled cell attrs.
+    """
+
+    def __init__(self, attrs, source=None):
+        self.source = attrs if source is None else source
+        self.snapshot = _snapshot(attrs)
+        self.is_empty = not attrs
+        self.dynamic = []
+        self.html = None
+        self.static = None
+
+        classes = attrs.get('class', {})
+        styles = attrs.get('style', {})
+        if is_callable(classes) or is_callable(styles) or not isinstance(classes, dict) or not isinstance(styles, dict):
+            return
+        if _has_path_keys(attrs):
+            # Keys like this are split when evaluated
+            return
+
+        static = Namespace()
+        dict.update(static, {
+            'class': self._split(classes, ('class',)),
+            'style': self._split(styles, ('style',)),
+            **self._split(attrs, (), ignore=('class', 'style')),
+        })
+        self.static = static
+        if not self.dynamic:
+            self.html = render_attrs(static)
+
+    def _split(self, d, path, ignore=()):
+        result = Namespace()
+        for k, v in items(d):
+            if k in ignore:
+                continue
+            if isinstance(v, Namespace):
+                v = self._split(v, (*path, k), ignore)
+            elif callable(v):
+                self.dynamic.append(((*path, k), v))
+            dict.__setitem__(result, k, v)
+        return result
+
+    def matches(self, source):
+        return source is self.source
+
+    def is_unchanged(self, attrs):
+        return attrs is self.source and attrs == self.snapshot
+
+    def evaluate(self, obj, kwargs):
+        if self.static is None:
+            return _evaluate_attrs(obj, obj.attrs, kwargs)
+
+        debug = iommi_debug_on()
+        if self.is_empty and not debug:
+            return ''
+
+        result = _copy(self.static, Attrs)
+        for path, value in self.dynamic:
+            target = result
+            for key in path[:-1]:
+                target = dict.__getitem__(target, key)
+            dict.__setitem__(target, path[-1], evaluate_strict(value, **kwargs))
+
+        if debug and getattr(obj, '_name', None) is not None:
+            result['data-iommi-path'] = obj.iommi_dunder_path
+            result['data-iommi-type'] = type(obj).__name__
+
+        object.__setattr__(result, '_iommi_compiled_attrs', self)
+        return result
+
+
+def compile_attrs(attrs):
+    """
+    Compile a declared attrs namespace, so `evaluate_attrs` only needs to
+    evaluate the callables in it on bind.
+    """
+    if isinstance(attrs, Namespace):
+        object.__setattr__(attrs, '_iommi_compiled_attrs', CompiledAttrs(attrs))
+
+
 def _render_attrs_parts(attrs):
     for key, value in sorted(attrs.items()):
         if value is None:
@@ -94,6 +218,10 @@ def render_attrs(attrs):
     if not attrs:
         return ''
 
+    compiled = getattr(attrs, '_iommi_compiled_attrs', None)
+    if compiled is not None and compiled.html is not None and attrs == compiled.static:
+        return compiled.html
+
     r = mark_safe(f" {' '.join(_render_attrs_parts(attrs))}")
     return '' if r == ' ' else r
 
@@ -153,6 +281,8 @@ class Attrs(Namespace):
         )
     """
 
+    _iommi_compiled_attrs = None
+
     def __init__(self, _parent, **attrs):
         if iommi_debug_on() and getattr(_parent, '_name', None) is not None:
             attrs['data-iommi-path'] = _parent.iommi_dunder_path
@@ -6,6 +6,7 @@
 
 from iommi import Fragment
 from iommi.attrs import (
+    CompiledAttrs,
     evaluate_attrs,
     render_attrs,
 )
@@ -351,8 +352,9 @@ def test_error_message_for_str_in_class():
     assert str(e.value).startswith('CSS classes')
 
 
+@mock.patch('iommi.attrs.evaluate_strict')
 @mock.patch('iommi.evaluate.evaluate_strict')
-def test_only_evaluate_callbacks(mock_evaluate_strict):
+def test_only_evaluate_callbacks(mock_evaluate_strict, mock_attrs_evaluate_strict):
     counter = itertools.count()
 
     def side_effect(func_or_value, __signature=None, __match_empty=True, **kwargs):
@@ -366,6 +368,7 @@ def side_effect(func_or_value, __signature=None, __match_empty=True, **kwargs):
         )
 
     mock_evaluate_strict.side_effect = side_effect
+    mock_attrs_evaluate_strict.side_effect = side_effect
     assert (
         render_attrs_test(
             {
@@ -382,3 +385,84 @@ def side_effect(func_or_value, __signature=None, __match_empty=True, **kwargs):
 
 def test_render_attrs_escapes_ampersand():
     assert render_attrs(Namespace(foo='a&b')) == ' foo="a&amp;b"'
+
+
+def test_compiled_attrs_static():
+    fragment = Fragment(attrs__foo='bar', attrs__class__baz=True).refine_done()
+    compiled = fragment.attrs._iommi_compiled_attrs
+    assert compiled.dynamic == []
+    assert compiled.html == ' class="baz" foo="bar"'
+
+    attrs = fragment.bind().attrs
+    assert str(attrs) == ' class="baz" foo="bar"'
+    assert attrs._iommi_compiled_attrs is compiled
+
+    # Each bind gets its own attrs, and the html follows changes to them
+    attrs['class']['quux'] = True
+    assert str(attrs) == ' class="baz quux" foo="bar"'
+    assert str(fragment.bind().attrs) == ' class="baz" foo="bar"'
+
+
+def test_compiled_attrs_only_evaluates_callables():
+    fragment = Fragment(
+        attrs__foo='bar',
+        attrs__class__baz=lambda fragment, **_: fragment._name == 'root',
+        attrs__style__color=lambda **_: 'red',
+    ).refine_done()
+    compiled = fragment.attrs._iommi_compiled_attrs
+    assert [path for path, _ in compiled.dynamic] == [('class', 'baz'), ('style', 'color')]
+    assert compiled.html is None
+
+    assert str(fragment.bind().attrs) == ' class="baz" foo="bar" style="color: red"'
+
+
+def test_compiled_attrs_changed_after_refine_done():
+    fragment = Fragment(attrs__foo='bar').refine_done()
+    fragment.attrs['foo'] = 'baz'
+    assert str(fragment.bind().attrs) == ' foo="baz"'
+
+
+def test_compiled_attrs_static_values_are_copied():
+    fragment = Fragment(attrs__foo=lambda **_: 'bar', attrs__data=dict(a=[1])).refine_done()
+    attrs = fragment.bind().attrs
+    assert attrs._iommi_compiled_attrs is fragment.attrs._iommi_compiled_attrs
+    attrs['data']['a'].append(2)
+    attrs['data']['b'] = 3
+    assert fragment.bind().attrs['data'] == dict(a=[1])
+
+
+def test_compiled_attrs_matches_source_by_identity():
+    attrs = Namespace(foo='bar')
+    compiled = CompiledAttrs(attrs)
+    assert compiled.matches(attrs)
+    assert not compiled.matches(Namespace(foo='bar'))
+    assert compiled.is_unchanged(attrs)
+    attrs['foo'] = 'baz'
+    assert compiled.matches(attrs)
+    assert not compiled.is_unchanged(attrs)
+
+    source = Namespace(foo='bar')
+    assert CompiledAttrs(Namespace(source), source=source).matches(source)
+
+
+@pytest.mark.parametrize(
+    'attrs',
+    [
+        dict(foo='bar'),
+        dict(foo=lambda **_: 'bar', class__a=True),
+        Namespace({'class': lambda **_: {'a': True}}),
+        Namespace(style__a='b', data=None),
+        dict(),
+    ],
+)
+def test_compiled_attrs_same_as_evaluate(attrs):
+    obj = Struct(attrs=Namespace(attrs))
+    expected = evaluate_attrs(obj)
+    assert CompiledAttrs(obj.attrs).evaluate(obj, {}) == expected
+    assert str(CompiledAttrs(obj.attrs).evaluate(obj, {})) == str(expected)
+
+
+@override_settings(IOMMI_DEBUG=True)
+def test_compiled_attrs_debug():
+    fragment = Fragment(attrs__foo='bar').refine_done()
+    assert str(fragment.bind().attrs) == ' data-iommi-path="" data-iommi-type="Fragment" foo="bar"'
@@ -1,3 +1,4 @@
+from asgiref.sync import sync_to_async
 from django.conf import settings
 from django.db.models import QuerySet
 from django.utils.encoding import force_str
@@ -60,6 +61,36 @@ def view_wrapper(request, **view_params):
     return view_wrapper
 
 
+def build_async_as_view_wrapper(target):
+    """
+    Like `build_as_view_wrapper`, but for an async view that renders with
+    `arender_to_response`.
+    """
+    from iommi.path import decode_path_components  # avoid circular import
+
+    optimize = getattr(settings, 'IOMMI_REFINE_DONE_OPTIMIZATION', True)
+
+    def bind(request, **view_params):
+        decode_path_components(request, **view_params)
+        return view_wrapper.__iommi_target__.bind(request=request)
+
+    async def view_wrapper(request, **view_params):
+        if not view_wrapper.__iommi_target__.is_refine_done and optimize:
+            view_wrapper.__iommi_target__ = view_wrapper.__iommi_target__.refine_done()
+
+        part = await sync_to_async(bind)(request, **view_params)
+        if part is None:
+            from django.http import Http404
+            raise Http404()
+        return await part.arender_to_response()
+
+    view_wrapper.__name__ = f'{target.__class__.__name__}.as_async_view'
+    view_wrapper.__doc__ = target.__class__.__doc__
+    view_wrapper.__iommi_target__ = target
+
+    return view_wrapper
+
+
 @keep_lazy_text
 def capitalize(s):
     if isinstance(s, SafeText):
@@ -1,7 +1,12 @@
 from datetime import date
 
+import pytest
 from django.test import RequestFactory
 
+from docs.models import (
+    Album,
+    Artist,
+)
 from iommi.experimental.calendar import (
     Calendar,
     CalendarDay,
@@ -986,3 +991,84 @@ def test_invalid_weekday_config_is_error():
 
 def test_invalid_day_number_config_is_error():
     _assert_invalid_config_is_error(day_number__foo=True)
+
+
+@pytest.mark.django_db
+def test_with_data_navigation_is_one_query(django_assert_num_queries):
+    artist = Artist.objects.create(name='Artist')
+    for name, published_date in [
+        ('First', date(2025, 11, 2)),
+        ('Prev', date(2026, 1, 20)),
+        ('Current', date(2026, 3, 5)),
+        ('Next', date(2026, 6, 1)),
+        ('Last', date(2026, 9, 30)),
+        ('No date', None),
+    ]:
+        Album.objects.create(name=name, artist=artist, published_date=published_date)
+
+    bound = Calendar(
+        auto__model=Album,
+        event__attr='published_date',
+        year=2026,
+        month=3,
+    ).bind(request=req('get'))
+
+    with django_assert_num_queries(1):
+        assert bound.get_first_month_with_data() == (2025, 11)
+        assert bound.get_prev_month_with_data() == (2026, 1)
+        assert bound.get_next_month_with_data() == (2026, 6)
+        assert bound.get_last_month_with_data() == (2026, 9)
+        bound.get_first_with_data_url()
+        bound.get_last_with_data_url()
+
+
+@pytest.mark.django_db
+def test_event_only():
+    artist = Artist.objects.create(name='Artist')
+    Album.objects.create(name='Current', artist=artist, year=2026, published_date=date(2026, 3, 5))
+
+    bound = Calendar(
+        auto__model=Album,
+        event__attr='published_date',
+        event__display_name=lambda event, **_: event.name,
+        event__only=['name'],
+        year=2026,
+        month=3,
+    ).bind(request=req('get'))
+
+    [event] = bound._events_by_date[date(2026, 3, 5)]
+    assert event.display_name == 'Current'
+    assert event.event_object.get_deferred_fields() == {'artist_id', 'year'}
+
+
+def test_event_display_names_batch():
+    calls = []
+
+    def display_names(events, calendar, **_):
+        calls.append(events)
+        return [f'{event.name} ({calendar.month})' for event in events]
+
+    bound = Calendar(
+        rows=make_events(),
+        event__attr='event_date',
+        event__display_names=display_names,
+        year=2026,
+        month=3,
+    ).bind(request=req('get'))
+
+    assert len(calls) == 1
+    assert [event.name for event in calls[0]] == ['Meeting', 'Lunch', 'Workshop', 'Conference']
+    assert [event.display_name for event in bound._events_by_date[date(2026, 3, 5)]] == ['Meeting (3)', 'Lunch (3)']
+    assert '<a href="/events/3/">Workshop (3)</a>' in bound.__html__()
+
+
+def test_event_display_name_bad_signature_is_error():
+    calendar = Calendar(
+        rows=make_events(),
+        event__attr='event_date',
+        event__display_name=lambda foo: foo,
+        year=2026,
+        month=3,
+    )
+    with pytest.raises(AssertionError, match="didn't resolve it into a value but strict mode was active"):
+        calendar.bind(request=req('get'))
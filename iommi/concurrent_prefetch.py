@@ -0,0 +1,54 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from django.db import connections
+
+DEFAULT_MAX_WORKERS = 4
+
+
+def fetch(queryset):
+    """
+    Evaluate a `QuerySet`. The result is cached on the `QuerySet`, so
+    iterating it later doesn't hit the database.
+    """
+    len(queryset)
+
+
+def get_concurrent_config(part):
+    config = part.concurrent
+    if config is True or not config:
+        return {}
+    return config
+
+
+def in_atomic_block():
+    return any(connection.in_atomic_block for connection in connections.all(initialized_only=True))
+
+
+def _run_in_worker(prefetch):
+    try:
+        prefetch()
+    finally:
+        # Each worker thread has its own connections, don't leave them open
+        connections.close_all()
+
+
+def prefetch_in_threads(part):
+    """
+    Run the prefetches of a bound part and its children in a thread pool, so
+    the queries of independent parts run at the same time. Each thread uses
+    its own database connections.
+
+    Inside a transaction the queries are run one after the other in this
+    thread instead, since other connections can't see the transaction.
+    """
+    prefetches = list(part.iommi_prefetches())
+    if len(prefetches) < 2 or in_atomic_block():
+        for prefetch in prefetches:
+            prefetch()
+        return
+
+    max_workers = get_concurrent_config(part).get('max_workers', DEFAULT_MAX_WORKERS)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(prefetches))) as executor:
+        futures = [executor.submit(_run_in_worker, prefetch) for prefetch in prefetches]
+    for future in futures:
+        future.result()
@@ -0,0 +1,117 @@
+import re
+import threading
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.db import transaction
+
+from docs.models import (
+    Album,
+    Artist,
+    Genre,
+)
+from iommi import (
+    Field,
+    Form,
+    Fragment,
+    Page,
+    Table,
+)
+from tests.helpers import req
+
+
+class PrefetchingFragment(Fragment):
+    def on_refine_done(self):
+        self.prefetch_threads = []
+        super().on_refine_done()
+
+    def iommi_prefetches(self):
+        return [self.record_thread]
+
+    def record_thread(self):
+        self.iommi_root().barrier.wait(timeout=5)
+        self.prefetch_threads.append(threading.get_ident())
+
+
+def prefetching_page(**kwargs):
+    page = Page(
+        parts__a=PrefetchingFragment('a'),
+        parts__b=PrefetchingFragment('b'),
+        **kwargs,
+    ).bind(request=req('get'))
+    page.barrier = threading.Barrier(2)
+    return page
+
+
+def test_concurrent_prefetch_runs_parts_at_the_same_time():
+    page = prefetching_page(concurrent=True)
+    assert page.__html__() == 'ab'
+
+    threads = page.parts.a.prefetch_threads + page.parts.b.prefetch_threads
+    assert len(set(threads)) == 2
+    assert threading.get_ident() not in threads
+
+
+def test_concurrent_prefetch_is_off_by_default():
+    page = prefetching_page()
+    assert page.__html__() == 'ab'
+    assert page.parts.a.prefetch_threads == []
+
+
+@pytest.mark.django_db
+def test_concurrent_prefetch_in_a_transaction_runs_in_this_thread():
+    page = prefetching_page(concurrent=True)
+    page.barrier = threading.Barrier(1)
+    with transaction.atomic():
+        page.__html__()
+
+    assert page.parts.a.prefetch_threads == page.parts.b.prefetch_threads == [threading.get_ident()]
+
+
+@pytest.fixture
+def albums():
+    artist = Artist.objects.create(name='Black Sabbath')
+    genre = Genre.objects.create(name='Heavy Metal')
+    for i in range(5):
+        Album.objects.create(name=f'Album {i}', artist=artist, year=1980 + i)
+    return genre
+
+
+def content(response):
+    return re.sub('name="csrfmiddlewaretoken" value="[^"]*"', '', response.content.decode())
+
+
+def dashboard(**kwargs):
+    return Page(
+        parts__albums=Table(auto__model=Album, page_size=2),
+        parts__artists=Table(auto__model=Artist),
+        parts__form=Form(fields__genre=Field.choice(choices=Genre.objects.all())),
+        **kwargs,
+    )
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_page(albums, django_assert_num_queries):
+    expected = content(dashboard().bind(request=req('get', page='2')).render_to_response())
+
+    page = dashboard(concurrent__max_workers=2).bind(request=req('get', page='2'))
+    # The queries are done before the render, in other threads
+    with django_assert_num_queries(0):
+        response = page.render_to_response()
+
+    assert content(response) == expected
+    assert 'Album 3' in expected
+    assert 'Black Sabbath' in expected
+    assert 'Heavy Metal' in expected
+    assert page.parts.albums.parts.page.count == 5
+
+
+@pytest.mark.django_db(transaction=True)
+def test_concurrent_page_async(albums, django_assert_num_queries):
+    expected = content(dashboard().bind(request=req('get')).render_to_response())
+
+    # None of the queries run in the thread of the async ORM
+    with django_assert_num_queries(0):
+        response = async_to_sync(dashboard(concurrent=True).as_async_view())(req('get'))
+
+    assert content(response) == expected
@@ -0,0 +1,186 @@
+import calendar
+import hashlib
+from datetime import (
+    UTC,
+    date,
+    datetime,
+    time,
+)
+
+from django.http import HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    quote_etag,
+)
+from django.utils.http import http_date
+from django.utils.timezone import (
+    is_naive,
+    make_aware,
+)
+from django.utils.translation import get_language
+
+from iommi.evaluate import evaluate_strict
+
+
+class Validators:
+    """
+    ETag parts and the latest Last-Modified, collected from parts.
+    """
+
+    def __init__(self):
+        self.etag_parts = []
+        self.last_modified = None
+        self.has_validators = False
+        # Set when a part can't tell what it looks like, then there are no validators
+        self.unknown = False
+
+    def add_etag(self, value):
+        self.etag_parts.append(str(value))
+        self.has_validators = True
+
+    def add_last_modified(self, value):
+        if value is None:
+            return
+        if not isinstance(value, datetime) and isinstance(value, date):
+            value = datetime.combine(value, time())
+        # Naive and aware datetimes can't be compared, naive ones are taken to be in UTC
+        if is_naive(value):
+            value = make_aware(value, UTC)
+        self.has_validators = True
+        if self.last_modified is None or value > self.last_modified:
+            self.last_modified = value
+
+    def add_validators(self, other):
+        for value in other.etag_parts:
+            self.add_etag(value)
+        self.add_last_modified(other.last_modified)
+        if other.unknown:
+            self.unknown = True
+
+    def as_dict(self):
+        return dict(etag_parts=self.etag_parts, last_modified=self.last_modified, unknown=self.unknown)
+
+    @classmethod
+    def from_dict(cls, d):
+        result = cls()
+        for value in d['etag_parts']:
+            result.add_etag(value)
+        result.add_last_modified(d['last_modified'])
+        result.unknown = d.get('unknown', False)
+        return result
+
+
+class ConditionalGetValidators(Validators):
+    """
+    The ETag and Last-Modified of a response, collected from the parts of a
+    page before anything is rendered.
+    """
+
+    def __init__(self, request):
+        super().__init__()
+        user = getattr(request, 'user', None)
+        self.etag_parts = [
+            request.get_full_path(),
+            str(get_language()),
+            str(getattr(user, 'pk', '')) if user is not None and user.is_authenticated else '',
+        ]
+
+    @property
+    def etag(self):
+        return quote_etag(hashlib.sha1('\n'.join(self.etag_parts).encode()).hexdigest())
+
+    @property
+    def last_modified_timestamp(self):
+        if self.last_modified is None:
+            return None
+        return calendar.timegm(self.last_modified.utctimetuple())
+
+    def set_headers(self, response):
+        if not 200 <= response.status_code < 300:
+            return
+        response['ETag'] = self.etag
+        if self.last_modified is not None:
+            response['Last-Modified'] = http_date(self.last_modified_timestamp)
+
+
+def get_conditional_get_config(part):
+    config = part.conditional_get
+    if config is True or not config:
+        return {}
+    return config
+
+
+def add_configured_validators(part, validators):
+    """
+    Add the `etag` and `last_modified` of the `conditional_get` config of a
+    part. Both can be a value or a callable.
+    """
+    config = get_conditional_get_config(part)
+    evaluate_parameters = part.iommi_evaluate_parameters()
+    if config.get('etag') is not None:
+        validators.add_etag(evaluate_strict(config['etag'], **evaluate_parameters))
+    if config.get('last_modified') is not None:
+        validators.add_last_modified(evaluate_strict(config['last_modified'], **evaluate_parameters))
+
+
+def add_part_validators(part, validators):
+    """
+    Add the validators of a part and its children. A part that gives no
+    validators could show anything, so then there are no validators for the
+    response at all. For a part with `cache` configured the validators are
+    stored with the cached html, since on a cache hit the part isn't bound
+    and can't compute them.
+    """
+    fragment_cache = part._iommi_fragment_cache
+    if fragment_cache is None:
+        part_validators = Validators()
+        part.add_conditional_get_validators(part_validators)
+    else:
+        if fragment_cache.validators is None:
+            if fragment_cache.html is not None:
+                # Cached without validators
+                validators.unknown = True
+                return
+            fragment_cache.validators = Validators()
+            part.add_conditional_get_validators(fragment_cache.validators)
+        part_validators = fragment_cache.validators
+
+    if not part_validators.has_validators:
+        validators.unknown = True
+    validators.add_validators(part_validators)
+
+
+def conditional_get_validators(part):
+    """
+    Returns the validators for a bound part with `conditional_get`
+    configured, or `None` if the request can't be answered with a 304.
+    """
+    if not part.conditional_get:
+        return None
+    request = part.get_request()
+    if request is None or request.method != 'GET':
+        return None
+
+    validators = ConditionalGetValidators(request)
+    add_part_validators(part, validators)
+    if validators.unknown or not validators.has_validators:
+        return None
+    return validators
+
+
+def not_modified_response(request, validators):
+    """
+    Returns a 304 (or 412) response if the request preconditions say the
+    client already has this version, otherwise `None`.
+    """
+    headers = HttpResponse()
+    validators.set_headers(headers)
+    response = get_conditional_response(
+        request,
+        etag=validators.etag,
+        last_modified=validators.last_modified_timestamp,
+        response=headers,
+    )
+    if response is headers:
+        return None
+    return response
@@ -0,0 +1,212 @@
+from datetime import (
+    UTC,
+    date,
+    datetime,
+)
+
+import pytest
+from django.core.cache import cache
+
+from docs.models import (
+    Album,
+    Artist,
+)
+from iommi import (
+    Column,
+    Fragment,
+    Page,
+    Table,
+)
+from iommi.conditional_get import conditional_get_validators
+from iommi.struct import Struct
+from tests.helpers import req
+from tests.models import TFoo
+
+
+def conditional_req(method='get', etag=None, last_modified=None, **data):
+    request = req(method, **data)
+    if etag is not None:
+        request.META['HTTP_IF_NONE_MATCH'] = etag
+    if last_modified is not None:
+        request.META['HTTP_IF_MODIFIED_SINCE'] = last_modified
+    return request
+
+
+def test_no_conditional_get_by_default():
+    response = Fragment('foo').bind(request=req('get')).render_to_response()
+    assert 'ETag' not in response
+
+
+def test_conditional_get_etag():
+    def fragment(version):
+        return Fragment('foo', conditional_get__etag=lambda **_: version)
+
+    response = fragment(1).bind(request=req('get')).render_to_response()
+    assert response.status_code == 200
+    etag = response['ETag']
+
+    response = fragment(1).bind(request=conditional_req(etag=etag)).render_to_response()
+    assert response.status_code == 304
+    assert response['ETag'] == etag
+    assert response.content == b''
+
+    response = fragment(2).bind(request=conditional_req(etag=etag)).render_to_response()
+    assert response.status_code == 200
+    assert response['ETag'] != etag
+
+
+def test_conditional_get_etag_varies_on_request():
+    etag = Fragment('foo', conditional_get__etag=1).bind(request=req('get')).render_to_response()['ETag']
+    response = Fragment('foo', conditional_get__etag=1).bind(request=conditional_req(etag=etag, x='1')).render_to_response()
+    assert response.status_code == 200
+
+
+def test_conditional_get_last_modified():
+    fragment = Fragment('foo', conditional_get__last_modified=date(2020, 1, 2))
+
+    response = fragment.bind(request=req('get')).render_to_response()
+    assert response['Last-Modified'] == 'Thu, 02 Jan 2020 00:00:00 GMT'
+
+    response = fragment.bind(request=conditional_req(last_modified='Thu, 02 Jan 2020 00:00:00 GMT')).render_to_response()
+    assert response.status_code == 304
+
+    response = fragment.bind(request=conditional_req(last_modified='Wed, 01 Jan 2020 00:00:00 GMT')).render_to_response()
+    assert response.status_code == 200
+
+
+def test_conditional_get_is_not_used_for_post():
+    fragment = Fragment('foo', conditional_get__etag=1)
+    assert conditional_get_validators(fragment.bind(request=req('get'))) is not None
+    assert conditional_get_validators(fragment.bind(request=req('post'))) is None
+
+
+def test_conditional_get_without_validators():
+    response = Table(columns__a=Column(), rows=[Struct(a=1)], conditional_get=True).bind(request=req('get')).render_to_response()
+    assert response.status_code == 200
+    assert 'ETag' not in response
+
+
+@pytest.mark.django_db
+def test_conditional_get_table(django_assert_num_queries):
+    artist = Artist.objects.create(name='Black Sabbath')
+    album = Album.objects.create(name='Heaven & Hell', artist=artist, published_date=date(1980, 4, 25))
+
+    def table():
+        return Table(auto__model=Album, conditional_get__last_modified_field='published_date')
+
+    response = table().bind(request=req('get')).render_to_response()
+    assert 'Heaven &amp; Hell' in response.content.decode()
+    assert response['Last-Modified'] == 'Fri, 25 Apr 1980 00:00:00 GMT'
+    etag = response['ETag']
+
+    with django_assert_num_queries(1):
+        response = table().bind(request=conditional_req(etag=etag)).render_to_response()
+    assert response.status_code == 304
+
+    # Sorting and paging are part of the ETag
+    assert table().bind(request=conditional_req(etag=etag, page='2')).render_to_response().status_code == 200
+
+    # ...and so are the count and the last modified
+    Album.objects.create(name='Mob Rules', artist=artist, published_date=date(1981, 11, 4))
+    assert table().bind(request=conditional_req(etag=etag)).render_to_response().status_code == 200
+
+    etag = table().bind(request=req('get')).render_to_response()['ETag']
+    album.published_date = date(1982, 1, 1)
+    album.save()
+    assert table().bind(request=conditional_req(etag=etag)).render_to_response().status_code == 200
+
+
+@pytest.mark.django_db
+def test_conditional_get_table_needs_validators():
+    foo = TFoo.objects.create(a=1, b='foo')
+
+    def table():
+        return Table(auto__model=TFoo, conditional_get=True)
+
+    def page():
+        return Page(conditional_get__etag='v1', parts__table=Table(auto__model=TFoo))
+
+    for part in [table, page]:
+        response = part().bind(request=req('get')).render_to_response()
+        assert 'ETag' not in response
+
+    # Editing a row changes neither the SQL nor the count, so there must be no 304
+    foo.b = 'bar'
+    foo.save()
+    for part in [table, page]:
+        response = part().bind(request=conditional_req(etag='*')).render_to_response()
+        assert response.status_code == 200
+        assert 'bar' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_conditional_get_table_filtering():
+    TFoo.objects.create(a=1, b='foo')
+    TFoo.objects.create(a=2, b='bar')
+
+    def table():
+        return Table(auto__model=TFoo, columns__b__filter__include=True, conditional_get__etag='v1')
+
+    etag = table().bind(request=req('get', b='foo')).render_to_response()['ETag']
+    assert table().bind(request=conditional_req(etag=etag, b='foo')).render_to_response().status_code == 304
+    assert table().bind(request=conditional_req(etag=etag, b='bar')).render_to_response().status_code == 200
+
+
+@pytest.mark.django_db
+def test_conditional_get_page_and_csv_endpoint():
+    TFoo.objects.create(a=1, b='foo')
+
+    def page():
+        return Page(
+            conditional_get__last_modified=datetime(2020, 1, 2, 3, 4, 5),
+            parts__table=Table(
+                auto__model=TFoo,
+                columns__b__extra_evaluated__report_name='b',
+                conditional_get__etag='v1',
+                extra_evaluated__report_name='foo',
+            ),
+        )
+
+    response = page().bind(request=req('get', **{'/table/csv': ''})).render_to_response()
+    assert response['Last-Modified'] == 'Thu, 02 Jan 2020 03:04:05 GMT'
+    etag = response['ETag']
+
+    response = page().bind(request=conditional_req(etag=etag, **{'/table/csv': ''})).render_to_response()
+    assert response.status_code == 304
+
+    TFoo.objects.create(a=2, b='bar')
+    response = page().bind(request=conditional_req(etag=etag, **{'/table/csv': ''})).render_to_response()
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_conditional_get_with_fragment_cache():
+    cache.clear()
+    artist = Artist.objects.create(name='Black Sabbath')
+    Album.objects.create(name='Heaven & Hell', artist=artist, published_date=date(1980, 4, 25))
+
+    def page():
+        return Page(
+            # An aware datetime is compared with the naive dates of the table
+            conditional_get__last_modified=datetime(1970, 1, 1, tzinfo=UTC),
+            parts__albums=Table(
+                auto__model=Album,
+                cache__models=[Album],
+                conditional_get__last_modified_field='published_date',
+            ),
+        )
+
+    first = page().bind(request=req('get')).render_to_response()
+    assert first['Last-Modified'] == 'Fri, 25 Apr 1980 00:00:00 GMT'
+
+    # The table is a cache hit, and has the validators from when it was rendered
+    second = page().bind(request=req('get')).render_to_response()
+    assert second['ETag'] == first['ETag']
+    assert second['Last-Modified'] == first['Last-Modified']
+    assert page().bind(request=conditional_req(etag=first['ETag'])).render_to_response().status_code == 304
+
+    Album.objects.create(name='Mob Rules', artist=artist, published_date=date(1981, 11, 4))
+    response = page().bind(request=conditional_req(etag=first['ETag'])).render_to_response()
+    assert response.status_code == 200
+    assert response['Last-Modified'] == 'Wed, 04 Nov 1981 00:00:00 GMT'
+    cache.clear()
@@ -35,10 +35,33 @@ def dunder_path__format(row, **_):
     )
 
 
+def _timing_value(kind, attr, format=str):
+    def value(row, **_):
+        stat = (row.timing or {}).get(kind)
+        return format(stat[attr]) if stat is not None else ''
+
+    return value
+
+
 def endpoint__debug_tree(endpoint, **_):
+    from iommi.part_timing import (
+        format_ms,
+        part_timings_for_request,
+    )
+
     root = endpoint.iommi_root()
     assert root._is_bound
 
+    timings = part_timings_for_request(root.get_request())
+    if timings is not None:
+        from iommi.part import render_root
+
+        # The tree is requested by a separate request, so render to get render timings too
+        render_root(part=root)
+        timing_by_path = timings.by_path()
+    else:
+        timing_by_path = {}
+
     def rows(node, name='', path=None):
         from iommi.member import (
             MemberBinder,
@@ -97,6 +120,7 @@ def rows(node, name='', path=None):
             path=p,
             dunder_path='__'.join(path),
             included=is_bound,
+            timing=timing_by_path.get('__'.join(path)),
         )
 
         for k, v in children:
@@ -158,6 +182,22 @@ def row__attrs__class__included(row, **_):
             ),
         )
         included = Column.boolean()
+        bind_ms = Column(
+            cell__value=_timing_value('bind', 'time', format_ms),
+            include=timings is not None,
+        )
+        bind_sql = Column(
+            cell__value=_timing_value('bind', 'sql_count'),
+            include=timings is not None,
+        )
+        render_ms = Column(
+            cell__value=_timing_value('render', 'time', format_ms),
+            include=timings is not None,
+        )
+        render_sql = Column(
+            cell__value=_timing_value('render', 'sql_count'),
+            include=timings is not None,
+        )
 
     request = HttpRequest()
     request.method = 'GET'
@@ -401,10 +441,22 @@ def _iommi_debug_panel(*, request, source_url, has_iommi_part=True):
     """
 
     from iommi.menu import get_debug_menu
+    from iommi.part_timing import (
+        part_timing_paused,
+        part_timings_for_request,
+        render_timings,
+    )
+
+    timings = part_timings_for_request(request)
+    timings_html = render_timings(timings) if timings is not None and has_iommi_part else ''
+
+    # The debug menu itself should not show up in the timings
+    with part_timing_paused(request):
+        menu_html = get_debug_menu(has_iommi_part=has_iommi_part, sub_menu__code__url=source_url).bind(
+            request=request
+        ).__html__()
 
-    return get_debug_menu(has_iommi_part=has_iommi_part, sub_menu__code__url=source_url).bind(
-        request=request
-    ).__html__() + mark_safe(
+    return menu_html + timings_html + mark_safe(
         f'<script>{script}</script>'
     )
 
@@ -15,7 +15,10 @@
     source_url_from_part,
     source_url_from_view_function,
 )
-from iommi.endpoint import find_target
+from iommi.endpoint import (
+    EndpointNotIncludedException,
+    find_target,
+)
 from iommi.struct import Struct
 from tests import debug_tests_stuff
 from tests.helpers import req
@@ -33,7 +36,7 @@ class MyPage(Page):
 
     root = MyPage().bind(request=req('get', **{'/debug_tree': '7'}))
 
-    with pytest.raises(AssertionError):
+    with pytest.raises(EndpointNotIncludedException):
         find_target(path='/debug_tree', root=root)
 
 
@@ -1,6 +1,9 @@
 from collections.abc import Callable
 
-from django.http import HttpResponseNotAllowed
+from django.http import (
+    HttpResponseNotAllowed,
+    HttpResponseNotFound,
+)
 
 from iommi.base import keys
 from iommi.refinable import (
@@ -22,6 +25,10 @@ class InvalidEndpointPathException(Exception):
     pass
 
 
+class EndpointNotIncludedException(InvalidEndpointPathException):
+    pass
+
+
 class Endpoint(Traversable):
     # language=rst
     """
@@ -100,7 +107,8 @@ def format_paths(paths):
         if part == '':
             continue
         next_node = node.iommi_bound_members().get(part)
-        assert next_node is not None, f"Failed to traverse long path '{long_path}' (No bound value for '{part}')"
+        if next_node is None:
+            raise EndpointNotIncludedException(f"Failed to traverse long path '{long_path}' (No bound value for '{part}')")
         node = next_node
 
     return node
@@ -109,7 +117,10 @@ def format_paths(paths):
 def perform_ajax_dispatch(*, root, path, value):
     assert root._is_bound
 
-    target = find_target(path=path, root=root)
+    try:
+        target = find_target(path=path, root=root)
+    except EndpointNotIncludedException:
+        return HttpResponseNotFound()
 
     func = getattr(target, 'func', None)
     if not isinstance(target, Endpoint) or func is None:
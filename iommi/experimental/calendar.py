@@ -3,7 +3,10 @@
 from datetime import date
 
 from django.db.models import (
+    Max,
+    Min,
     Model,
+    Q,
     QuerySet,
 )
 from django.utils.safestring import mark_safe
@@ -35,6 +38,10 @@
 from iommi.evaluate import (
     evaluate_member,
     evaluate_strict,
+    get_signature,
+    is_callable,
+    matches,
+    signature_from_kwargs,
 )
 from iommi.fragment import (
     Fragment,
@@ -55,13 +62,16 @@
     SpecialEvaluatedRefinable,
 )
 from iommi.shortcut import with_defaults
+from iommi.struct import Struct
 
 
 class CalendarCellConfig(RefinableObject):
     tag: str | None = Refinable()
     attr: str = Refinable()
     display_name: str = Refinable()
+    display_names = Refinable()
     url = Refinable()
+    only: list[str] = Refinable()
     attrs: Attrs = Refinable()
 
     @dispatch(
@@ -98,12 +108,14 @@ def __init__(self, **kwargs):
 class CalendarEvent(Tag):
     """Represents a single event inside a day cell."""
 
-    def __init__(self, event_object, display_name, url=None, tag='div', attrs=None):
+    def __init__(self, event_object, display_name, url=None, tag='div', attrs=None, rendered_attrs=None):
         self.event_object = event_object
         self.display_name = display_name
         self.url = url
         self.tag = tag
         self.attrs = attrs if attrs is not None else {}
+        # The attrs are the same for all events, so the calendar renders them once
+        self.rendered_attrs = rendered_attrs
 
     def __html__(self):
         if self.url:
@@ -111,7 +123,8 @@ def __html__(self):
         else:
             content = str(self.display_name)
         if self.tag:
-            return mark_safe(f'<{self.tag}{render_attrs(self.attrs)}>{content}</{self.tag}>')
+            rendered_attrs = self.rendered_attrs if self.rendered_attrs is not None else render_attrs(self.attrs)
+            return mark_safe(f'<{self.tag}{rendered_attrs}>{content}</{self.tag}>')
         return mark_safe(content)
 
 
@@ -307,6 +320,9 @@ def on_bind(self) -> None:
         self._grid_start = weeks[0][0]
         self._grid_end = weeks[-1][-1]
 
+        # Computed on first use, with one query for all the "with data" navigation
+        self._data_bounds = None
+
         # Filter rows to the displayed date range
         if self.rows is not None and self._date_field:
             if isinstance(self.rows, QuerySet):
@@ -314,21 +330,43 @@ def on_bind(self) -> None:
                     f'{self._date_field}__gte': self._grid_start,
                     f'{self._date_field}__lte': self._grid_end,
                 })
+                only = self.event.get('only')
+                if only is not None:
+                    self.rows = self.rows.only(self._date_field, *only)
             # For list data, filtering happens in _group_events_by_date
 
         self._events_by_date = self._group_events_by_date()
 
+    def _event_evaluator(self, value, evaluate_parameters):
+        """
+        Return a function from an event row to `value` evaluated with that
+        event. The signature of `value` is matched once, not once per event.
+        """
+        if not is_callable(value):
+            return lambda row: value
+
+        callee_parameters = get_signature(value)
+        signature = signature_from_kwargs(dict(evaluate_parameters, event=None))
+        if callee_parameters is not None and matches(signature, callee_parameters, True):
+            return lambda row: value(event=row, **evaluate_parameters)
+
+        # Let evaluate_strict give the usual error message
+        return lambda row: evaluate_strict(value, event=row, **evaluate_parameters)
+
     def _group_events_by_date(self):
         events_by_date = defaultdict(list)
-        if self.rows is None:
+        if self.rows is None or not self._date_field:
             return events_by_date
 
-        for row in self.rows:
-            if self._date_field:
-                event_date = getattr(row, self._date_field)
-            else:
-                continue
+        date_field = self._date_field
+        filter_to_grid = not isinstance(self.rows, QuerySet)
+        grid_start = self._grid_start
+        grid_end = self._grid_end
 
+        rows = []
+        dates = []
+        for row in self.rows:
+            event_date = getattr(row, date_field)
             if event_date is None:
                 continue
 
@@ -337,26 +375,45 @@ def _group_events_by_date(self):
                 event_date = event_date.date()
 
             # For list data, filter to the displayed date range
-            if not isinstance(self.rows, QuerySet):
-                if event_date < self._grid_start or event_date > self._grid_end:
-                    continue
+            if filter_to_grid and (event_date < grid_start or event_date > grid_end):
+                continue
 
-            display_name = evaluate_strict(self.event.get('display_name'), event=row, **self.iommi_evaluate_parameters())
+            rows.append(row)
+            dates.append(event_date)
 
-            url = None
-            event_url = self.event.get('url')
-            if event_url:
-                url = evaluate_strict(event_url, event=row, **self.iommi_evaluate_parameters())
-            elif hasattr(row, 'get_absolute_url'):
-                url = row.get_absolute_url()
+        if not rows:
+            return events_by_date
+
+        evaluate_parameters = self.iommi_evaluate_parameters()
+
+        display_names = self.event.get('display_names')
+        if display_names is not None:
+            display_names = evaluate_strict(display_names, events=rows, **evaluate_parameters)
+            assert len(display_names) == len(rows), 'event__display_names must return one display name per event'
+        else:
+            display_name = self._event_evaluator(self.event.get('display_name'), evaluate_parameters)
+            display_names = [display_name(row) for row in rows]
 
+        event_url = self.event.get('url')
+        if event_url:
+            url = self._event_evaluator(event_url, evaluate_parameters)
+        else:
+            def url(row):
+                return row.get_absolute_url() if hasattr(row, 'get_absolute_url') else None
+
+        tag = self.event.get('tag', 'div')
+        attrs = self._build_attrs('event')
+        rendered_attrs = render_attrs(attrs)
+
+        for row, event_date, name in zip(rows, dates, display_names):
             events_by_date[event_date].append(
                 CalendarEvent(
                     event_object=row,
-                    display_name=display_name,
-                    url=url,
-                    tag=self.event.get('tag', 'div'),
-                    attrs=self._build_attrs('event'),
+                    display_name=name,
+                    url=url(row),
+                    tag=tag,
+                    attrs=attrs,
+                    rendered_attrs=rendered_attrs,
                 )
             )
 
@@ -434,71 +491,81 @@ def _get_date_value(self, row):
             v = v.date()
         return v
 
+    def _month_start(self):
+        return date(self.year, self.month, 1)
+
+    def _next_month_start(self):
+        return date(*self.get_next_month(), 1)
+
+    def get_data_bounds(self):
+        """
+        Return a `Struct` with the dates of the `first` and `last` event, the
+        `prev` event before the current month and the `next` event after it.
+        Each is `None` if there is no such event. For a `QuerySet` this is one
+        aggregate query, done at most once per bind.
+        """
+        if self._data_bounds is None:
+            self._data_bounds = self._compute_data_bounds()
+        return self._data_bounds
+
+    def _compute_data_bounds(self):
+        bounds = Struct(first=None, last=None, prev=None, next=None)
+        if self._all_rows is None or not self._date_field:
+            return bounds
+
+        month_start = self._month_start()
+        next_month_start = self._next_month_start()
+
+        if isinstance(self._all_rows, QuerySet):
+            f = self._date_field
+            result = self._all_rows.order_by().aggregate(
+                first=Min(f),
+                last=Max(f),
+                prev=Max(f, filter=Q(**{f'{f}__lt': month_start})),
+                next=Min(f, filter=Q(**{f'{f}__gte': next_month_start})),
+            )
+            for k, v in result.items():
+                bounds[k] = v.date() if hasattr(v, 'date') else v
+            return bounds
+
+        for row in self._all_rows:
+            d = self._get_date_value(row)
+            if d is None:
+                continue
+            if bounds.first is None or d < bounds.first:
+                bounds.first = d
+            if bounds.last is None or d > bounds.last:
+                bounds.last = d
+            if d < month_start and (bounds.prev is None or d > bounds.prev):
+                bounds.prev = d
+            if d >= next_month_start and (bounds.next is None or d < bounds.next):
+                bounds.next = d
+        return bounds
+
+    def _ym_from_bound(self, name):
+        d = self.get_data_bounds()[name]
+        if d is None:
+            return None
+        return d.year, d.month
+
     def get_prev_month_with_data(self):
         """Return (year, month) of the closest earlier month that has data, or None."""
-        current = date(self.year, self.month, 1)
-        return self._ym_from_query(f'-{self._date_field}', **{f'{self._date_field}__lt': current})
+        return self._ym_from_bound('prev')
 
     def get_next_month_with_data(self):
         """Return (year, month) of the closest later month that has data, or None."""
-        if self.month == 12:
-            next_month_start = date(self.year + 1, 1, 1)
-        else:
-            next_month_start = date(self.year, self.month + 1, 1)
-        return self._ym_from_query(self._date_field, **{f'{self._date_field}__gte': next_month_start})
-
-    def _ym_from_query(self, order, **filter_kwargs):
-        """Helper: query _all_rows for a single date, return (year, month) or None."""
-        if self._all_rows is None or not self._date_field:
-            return None
-
-        if isinstance(self._all_rows, QuerySet):
-            qs = self._all_rows.exclude(**{f'{self._date_field}__isnull': True})
-            if filter_kwargs:
-                qs = qs.filter(**filter_kwargs)
-            row = qs.order_by(order).values_list(self._date_field, flat=True).first()
-            if row is None:
-                return None
-            d = row.date() if hasattr(row, 'date') else row
-            return d.year, d.month
-        else:
-            best = None
-            for row in self._all_rows:
-                d = self._get_date_value(row)
-                if d is None:
-                    continue
-                # Apply the same filter logic for lists
-                if filter_kwargs:
-                    threshold_key = next(iter(filter_kwargs))
-                    threshold_val = filter_kwargs[threshold_key]
-                    if '__lt' in threshold_key:
-                        if d >= threshold_val:
-                            continue
-                    elif '__gte' in threshold_key:
-                        if d < threshold_val:
-                            continue
-                if best is None:
-                    best = d
-                elif order.startswith('-'):
-                    if d > best:
-                        best = d
-                else:
-                    if d < best:
-                        best = d
-            if best is None:
-                return None
-            return best.year, best.month
+        return self._ym_from_bound('next')
 
     def get_first_month_with_data(self):
         """Return (year, month) of the earliest month that has data, or None."""
-        result = self._ym_from_query(self._date_field)
+        result = self._ym_from_bound('first')
         if result and result == (self.year, self.month):
             return None
         return result
 
     def get_last_month_with_data(self):
         """Return (year, month) of the latest month that has data, or None."""
-        result = self._ym_from_query(f'-{self._date_field}')
+        result = self._ym_from_bound('last')
         if result and result == (self.year, self.month):
             return None
         return result
@@ -0,0 +1,243 @@
+import logging
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from uuid import uuid4
+
+from django.core.cache import (
+    DEFAULT_CACHE_ALIAS,
+    caches,
+)
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.db import (
+    connections,
+    transaction,
+)
+from django.db.models import QuerySet
+from django.http import HttpResponse
+from django.utils import (
+    timezone,
+    translation,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 2
+
+# How long the state and the file of a job are kept, in seconds
+JOB_TIMEOUT = 60 * 60 * 24
+
+# The directory in the storage the files of the jobs are written to
+EXPORT_DIRECTORY = 'iommi-exports'
+
+# How often the progress of a job is written to the cache, in rows
+PROGRESS_INTERVAL = 1000
+
+# The most jobs that can be queued or running in a process
+MAX_QUEUED_JOBS = 10
+
+# How often a process looks for the files of expired jobs, in seconds
+CLEANUP_INTERVAL = 60 * 10
+
+_executor = None
+_lock = threading.Lock()
+_queued_jobs = 0
+_last_cleanup = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix='iommi-export')
+    return _executor
+
+
+def job_cache():
+    return caches[DEFAULT_CACHE_ALIAS]
+
+
+def job_key(job_id):
+    return f'iommi-export-job:{job_id}'
+
+
+def user_job_key(user):
+    return f'iommi-export-user-job:{user}'
+
+
+def get_storage(table):
+    return table.extra.get('report_storage') or default_storage
+
+
+def user_pk(table):
+    user = getattr(table.get_request(), 'user', None)
+    if user is None or not user.is_authenticated:
+        return None
+    return user.pk
+
+
+def estimated_total(table):
+    # The paginator has already counted the rows, unless the table isn't paginated
+    count = table.parts.page.count
+    if count is None:
+        rows = table.sorted_and_filtered_rows
+        if isinstance(rows, QuerySet):
+            count = rows.count()
+        elif hasattr(rows, '__len__'):
+            count = len(rows)
+    return count
+
+
+class ExportJob:
+    """
+    An export of the rows of a bound table, run in a background thread and
+    written to a file in a Django storage. The state of the job is kept in the
+    default cache. The progress and download endpoints can only be served by
+    the processes that share that cache, so with the default local memory
+    cache only by the process that started the job.
+    """
+
+    def __init__(self, *, table, filename, content_type, header, rows):
+        self.id = uuid4().hex
+        self.storage = get_storage(table)
+        self.state = dict(
+            user=user_pk(table),
+            filename=filename,
+            content_type=content_type,
+            rows_written=0,
+            total=estimated_total(table),
+            done=False,
+            error=None,
+            name=None,
+        )
+        self.header = header
+        self.rows = rows
+        # The rows are formatted in another thread, with the language and time zone of the request
+        self.language = translation.get_language()
+        self.timezone = timezone.get_current_timezone()
+
+    def save_state(self):
+        job_cache().set(job_key(self.id), self.state, timeout=JOB_TIMEOUT)
+
+    def run(self):
+        global _queued_jobs
+        try:
+            with translation.override(self.language), timezone.override(self.timezone), tempfile.TemporaryFile() as f:
+                f.write(self.header.encode())
+                for i, row in enumerate(self.rows, start=1):
+                    f.write(row.encode())
+                    if i % PROGRESS_INTERVAL == 0:
+                        self.state['rows_written'] = i
+                        self.save_state()
+                    self.state['rows_written'] = i
+                f.seek(0)
+                self.state['name'] = self.storage.save(
+                    f'{EXPORT_DIRECTORY}/{self.id}/{self.state["filename"]}',
+                    File(f),
+                )
+            self.state['done'] = True
+        except Exception as e:
+            logger.exception('Export job %s failed', self.id)
+            self.state['error'] = str(e)
+        finally:
+            self.save_state()
+            with _lock:
+                _queued_jobs -= 1
+            # The thread has its own connections, don't leave them open
+            connections.close_all()
+
+
+def delete_expired_export_files(storage=None, max_age=JOB_TIMEOUT):
+    """
+    Delete the files of the export jobs that are older than `max_age`
+    seconds, since their state is gone from the cache and they can't be
+    downloaded anymore. This is done in the background when a job is
+    started, at most every `CLEANUP_INTERVAL` seconds in each process, but
+    can also be called from a periodic task.
+    """
+    storage = storage or default_storage
+    expires = timezone.now() - timedelta(seconds=max_age)
+    try:
+        job_directories, _ = storage.listdir(EXPORT_DIRECTORY)
+    except FileNotFoundError:
+        return
+    for job_directory in job_directories:
+        path = f'{EXPORT_DIRECTORY}/{job_directory}'
+        _, filenames = storage.listdir(path)
+        expired = [filename for filename in filenames if storage.get_modified_time(f'{path}/{filename}') < expires]
+        for filename in expired:
+            storage.delete(f'{path}/{filename}')
+        if len(expired) == len(filenames):
+            # Storages without directories ignore this
+            storage.delete(path)
+
+
+def start_export_job(table, *, filename, content_type, header, rows):
+    """
+    Start an export job for a bound table. `header` is a string and `rows` an
+    iterable with a string for each row, which is iterated in the background,
+    so it must not depend on the request being in progress.
+
+    The rows are what the table has when the job is started, with the same
+    filters, sort order and columns.
+
+    Each user can have one job running at a time, and each process at most
+    `MAX_QUEUED_JOBS`. Beyond that a 429 or a 503 response is returned
+    instead of the id of the job.
+    """
+    limit_response = job_limit_response(table)
+    if limit_response is not None:
+        return limit_response
+
+    job = ExportJob(table=table, filename=filename, content_type=content_type, header=header, rows=rows)
+    job.save_state()
+    job_cache().set(user_job_key(job.state['user']), job.id, timeout=JOB_TIMEOUT)
+    # Inside a transaction the job must not start before the transaction is committed
+    transaction.on_commit(lambda: submit_job(job))
+    return dict(job=job.id)
+
+
+def job_limit_response(table):
+    running_job_id = job_cache().get(user_job_key(user_pk(table)))
+    if running_job_id is not None:
+        state = job_cache().get(job_key(running_job_id))
+        if state is not None and not state['done'] and state['error'] is None:
+            return HttpResponse('An export job is already running', status=429)
+    if _queued_jobs >= MAX_QUEUED_JOBS:
+        return HttpResponse('Too many export jobs, try again later', status=503)
+    return None
+
+
+def submit_job(job):
+    global _queued_jobs, _last_cleanup
+    with _lock:
+        _queued_jobs += 1
+        cleanup = _last_cleanup is None or time.monotonic() - _last_cleanup >= CLEANUP_INTERVAL
+        if cleanup:
+            _last_cleanup = time.monotonic()
+
+    executor = get_executor()
+    executor.submit(job.run)
+    if cleanup:
+        executor.submit(delete_expired_export_files_logged, job.storage)
+
+
+def delete_expired_export_files_logged(storage):
+    try:
+        delete_expired_export_files(storage)
+    except Exception:
+        logger.exception('Deleting expired export files failed')
+
+
+def get_job_state(table, job_id):
+    state = job_cache().get(job_key(job_id)) if job_id else None
+    # Only the user that started a job can see it
+    if state is None or state['user'] != user_pk(table):
+        return None
+    return state
+
+
+def open_job_file(table, state):
+    return get_storage(table).open(state['name'], 'rb')
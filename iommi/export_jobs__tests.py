@@ -0,0 +1,163 @@
+import json
+import os
+import time
+
+import pytest
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.utils import (
+    timezone,
+    translation,
+)
+
+from iommi import (
+    Column,
+    Table,
+)
+from iommi.export_jobs import (
+    JOB_TIMEOUT,
+    delete_expired_export_files,
+    get_executor,
+)
+from iommi.struct import Struct
+from tests.helpers import req
+from tests.models import TFoo
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return FileSystemStorage(location=tmp_path)
+
+
+@pytest.fixture
+def rows(monkeypatch):
+    monkeypatch.setattr('iommi.export_jobs.PROGRESS_INTERVAL', 2)
+    TFoo.objects.bulk_create([TFoo(a=i, b=f'foo {i}') for i in range(5)])
+
+
+def request(method, url='/', user_pk=1, **data):
+    request = req(method, url=url, **data)
+    request.user = Struct(is_authenticated=True, pk=user_pk)
+    return request
+
+
+def response(storage, request, **kwargs):
+    return Table(
+        auto__model=TFoo,
+        extra__report_columns_all=True,
+        extra__report_storage=storage,
+        extra_evaluated__report_name='foo',
+        page_size=2,
+        **kwargs,
+    ).bind(request=request).render_to_response()
+
+
+def wait_for_job(storage, job, **kwargs):
+    for _ in range(100):
+        progress = json.loads(response(storage, request('get', **{'/job_progress': job}), **kwargs).content)
+        if progress['done'] or progress['error']:
+            return progress
+        time.sleep(0.05)
+    raise AssertionError('Export job did not finish')
+
+
+@pytest.mark.django_db(transaction=True)
+def test_csv_job(storage, rows):
+    expected = b''.join(response(storage, request('get', **{'/csv': '', 'order': '-a'})).streaming_content)
+
+    start = response(storage, request('post', url='/?order=-a', **{'/csv_job': ''}))
+    job = json.loads(start.content)['job']
+
+    # The job uses the sort order of the request that started it
+    assert wait_for_job(storage, job) == dict(rows_written=5, total=5, done=True, error=None)
+
+    download = response(storage, request('get', **{'/job_download': job}))
+    assert download['Content-Disposition'] == "attachment; filename*=UTF-8''foo.csv"
+    assert b''.join(download.streaming_content) == expected
+    assert expected.splitlines()[1].startswith(b'4,')
+    assert len(storage.listdir('iommi-exports')[0]) == 1
+
+
+@pytest.mark.django_db(transaction=True)
+def test_csv_job_only_post(storage, rows):
+    assert response(storage, request('get', **{'/csv_job': ''})).status_code == 405
+
+
+@pytest.mark.django_db(transaction=True)
+def test_job_of_other_user(storage, rows):
+    job = json.loads(response(storage, request('post', **{'/csv_job': ''})).content)['job']
+    wait_for_job(storage, job)
+
+    assert response(storage, request('get', user_pk=2, **{'/job_progress': job})).status_code == 404
+    assert response(storage, request('get', user_pk=2, **{'/job_download': job})).status_code == 404
+
+
+@pytest.mark.django_db
+def test_unknown_job(storage):
+    assert response(storage, request('get', **{'/job_progress': 'nope'})).status_code == 404
+    assert response(storage, request('get', **{'/job_download': 'nope'})).status_code == 404
+
+
+@pytest.mark.django_db(transaction=True)
+def test_csv_job_language_and_time_zone(storage, rows):
+    with translation.override('sv'), timezone.override('Europe/Stockholm'):
+        start = response(
+            storage,
+            request('post', **{'/csv_job': ''}),
+            columns__language=Column(cell__value=lambda **_: translation.get_language()),
+            columns__time_zone=Column(cell__value=lambda **_: timezone.get_current_timezone_name()),
+        )
+    job = json.loads(start.content)['job']
+    assert wait_for_job(storage, job)['done']
+
+    content = b''.join(response(storage, request('get', **{'/job_download': job})).streaming_content).decode()
+    assert content.splitlines()[1].endswith(',sv,Europe/Stockholm')
+
+
+def test_delete_expired_export_files(storage):
+    delete_expired_export_files(storage)
+
+    old = storage.save('iommi-exports/old/foo.csv', ContentFile(b'old'))
+    new = storage.save('iommi-exports/new/foo.csv', ContentFile(b'new'))
+    expired = time.time() - JOB_TIMEOUT - 60
+    os.utime(storage.path(old), (expired, expired))
+
+    delete_expired_export_files(storage)
+    assert storage.listdir('iommi-exports') == (['new'], [])
+    assert storage.exists(new)
+
+
+@pytest.mark.django_db(transaction=True)
+def test_job_limits(storage, rows, monkeypatch):
+    monkeypatch.setattr('iommi.export_jobs.submit_job', lambda job: None)
+
+    assert response(storage, request('post', **{'/csv_job': ''})).status_code == 200
+    # The job isn't done, so the same user can't start another one
+    assert response(storage, request('post', **{'/csv_job': ''})).status_code == 429
+    assert response(storage, request('post', user_pk=2, **{'/csv_job': ''})).status_code == 200
+
+    monkeypatch.setattr('iommi.export_jobs.MAX_QUEUED_JOBS', 0)
+    assert response(storage, request('post', user_pk=3, **{'/csv_job': ''})).status_code == 503
+
+
+@pytest.mark.django_db(transaction=True)
+def test_expired_export_files_are_deleted_at_most_every_interval(storage, rows, monkeypatch):
+    cleanups = []
+    monkeypatch.setattr('iommi.export_jobs._executor', None)
+    monkeypatch.setattr('iommi.export_jobs._last_cleanup', None)
+    monkeypatch.setattr('iommi.export_jobs.delete_expired_export_files', cleanups.append)
+
+    for _ in range(2):
+        job = json.loads(response(storage, request('post', **{'/csv_job': ''})).content)['job']
+        wait_for_job(storage, job)
+    # Wait for the cleanup too
+    get_executor().shutdown(wait=True)
+    assert cleanups == [storage]
@@ -10,7 +10,10 @@
     Decimal,
     InvalidOperation,
 )
-from functools import reduce
+from functools import (
+    partial,
+    reduce,
+)
 from itertools import groupby
 from operator import or_
 from urllib.parse import urlparse
@@ -57,17 +60,20 @@
     Actions,
     group_actions,
 )
+from iommi.async_render import afetch
 from iommi.attrs import Attrs
 from iommi.base import (
     MISSING,
     NOT_BOUND_MESSAGE,
     build_as_view_wrapper,
+    build_async_as_view_wrapper,
     capitalize,
     get_display_name,
     items,
     keys,
     values,
 )
+from iommi.concurrent_prefetch import fetch
 from iommi.datetime_parsing import (
     parse_relative_date,
     parse_relative_datetime,
@@ -82,6 +88,7 @@
     evaluate_strict,
 )
 from iommi.fragment import Fragment, Header, Tag, TransientFragment, build_and_bind_h_tag
+from iommi.fragment_cache import is_fragment_cache_hit
 from iommi.from_model import (
     AutoConfig,
     NoRegisteredSearchFieldException,
@@ -92,6 +99,7 @@
     model_from_choices,
     related_choices_from_model_field,
 )
+from iommi.html_buffer import HtmlBuffer
 from iommi.member import (
     bind_member,
     bind_members,
@@ -105,6 +113,7 @@
     Part,
     request_data,
 )
+from iommi.part_timing import timed
 from iommi.refinable import (
     EvaluatedRefinable,
     Prio,
@@ -2265,6 +2274,7 @@ def is_valid(self):
         assert self._valid is not None, "Internal error: Once a form is bound we should know if it is valid or not"
         return self._valid
 
+    @timed('validate')
     def validate(self):
         # When validate is called at the end of bind, self._valid will be either
         # False because a field's add_error was called during the fields bind.
@@ -2384,17 +2394,23 @@ def render_fields(self):
         if next_url:
             hidden_fields.append(format_html('<input type="hidden" name="next" value="{}">', next_url))
 
+        buffer = HtmlBuffer()
         if self.layout is not None:
-            html = render_template(request=self.get_request(), template=self.layout_template, context=context)
+            buffer.write(render_template(request=self.get_request(), template=self.layout_template, context=context))
         elif self.fields_template is None:
-            html = format_html('{}\n' * len(r), *r)
+            for part in r:
+                buffer.write(part)
+                buffer.write_safe('\n')
         else:
-            html = render_template(request=self.get_request(), template=self.fields_template, context=context)
+            buffer.write(render_template(request=self.get_request(), template=self.fields_template, context=context))
 
         if hidden_fields:
-            html = format_html('{}\n' * (len(hidden_fields) + 1), html, *hidden_fields)
+            buffer.write_safe('\n')
+            for hidden_field in hidden_fields:
+                buffer.write(hidden_field)
+                buffer.write_safe('\n')
 
-        return html
+        return buffer.__html__()
 
     @dispatch(
         render__call_target=render_template,
@@ -2539,6 +2555,32 @@ def delete(cls, **kwargs):
     def as_view(self):
         return build_as_view_wrapper(self)
 
+    def as_async_view(self):
+        return build_async_as_view_wrapper(self)
+
+    def _prefetch_choices(self):
+        # Fields with a choices endpoint only render the selected choices
+        return [
+            field.choices
+            for field in values(self.fields)
+            if isinstance(field.choices, QuerySet) and field.endpoints.get('choices') is None
+        ]
+
+    def iommi_prefetches(self):
+        # The bind was skipped on a cache hit, and nothing is rendered
+        if is_fragment_cache_hit(self):
+            return []
+        result = list(super(Form, self).iommi_prefetches())
+        result.extend(partial(fetch, choices) for choices in self._prefetch_choices())
+        return result
+
+    def iommi_async_prefetches(self):
+        if is_fragment_cache_hit(self):
+            return []
+        result = list(super(Form, self).iommi_async_prefetches())
+        result.extend(partial(afetch, choices) for choices in self._prefetch_choices())
+        return result
+
     def get_field(self, name):
         if name in self.fields:
             return self.fields[name]
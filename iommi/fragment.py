@@ -1,7 +1,8 @@
 
+from django.utils.html import conditional_escape
+
 from iommi._web_compat import (
     Template,
-    format_html,
     render_template,
 )
 from iommi.attrs import (
@@ -24,6 +25,7 @@
     evaluate_strict,
     find_static_items,
 )
+from iommi.html_buffer import HtmlBuffer
 from iommi.member import (
     bind_member,
     bind_members,
@@ -63,6 +65,8 @@
 
 
 class TransientFragment:
+    __slots__ = ('_is_bound', 'template', 'attrs', 'children', 'tag', 'parent')
+
     @dispatch(
         attrs__class=EMPTY,
         attrs__style=EMPTY,
@@ -92,10 +96,9 @@ def render_text_or_children(self, context=None):
         if context is None:
             context = self.get_context()
         request = self.get_request()
-        return format_html(
-            '{}' * len(self.children),
-            *[as_html(part=x, context=context, request=request) for x in values(self.children)],
-        )
+        buffer = HtmlBuffer()
+        buffer.write_all([as_html(part=x, context=context, request=request) for x in values(self.children)])
+        return buffer.__html__()
 
     def __html__(self):
         assert self._is_bound, NOT_BOUND_MESSAGE
@@ -121,41 +124,37 @@ def fragment__render(fragment, context):
 
     is_void_element = fragment.tag in _void_elements
 
-    if fragment.tag:
-        if rendered_children:
-            assert not is_void_element, f'{fragment.tag} is a void element, but it has children: {rendered_children}'
-            return format_html(
-                '<{tag}{attrs}>{children}</{tag}>',
-                tag=fragment.tag,
-                attrs=render_attrs(fragment.attrs),
-                children=rendered_children,
-            )
-        else:
-            return format_html(
-                '<{tag}{attrs}>' if is_void_element else '<{tag}{attrs}></{tag}>',
-                tag=fragment.tag,
-                attrs=render_attrs(fragment.attrs),
-            )
+    if not fragment.tag:
+        return conditional_escape(rendered_children)
 
-    else:
-        return format_html(
-            '{}',
-            rendered_children,
-        )
+    buffer = HtmlBuffer()
+    buffer.write_open_tag(fragment.tag, render_attrs(fragment.attrs))
+    if rendered_children:
+        assert not is_void_element, f'{fragment.tag} is a void element, but it has children: {rendered_children}'
+        buffer.write(rendered_children)
+    if not is_void_element:
+        buffer.write_close_tag(fragment.tag)
+    return buffer.__html__()
 
 
 class Tag:
+    __slots__ = ()
+
     def iommi_open_tag(self):
         if self.tag is None:
             return ''
         else:
-            return format_html('<{}{}>', self.tag, self.attrs)
+            buffer = HtmlBuffer()
+            buffer.write_open_tag(self.tag, self.attrs)
+            return buffer.__html__()
 
     def iommi_close_tag(self):
         if self.tag is None:
             return ''
         else:
-            return format_html('</{}>', self.tag)
+            buffer = HtmlBuffer()
+            buffer.write_close_tag(self.tag)
+            return buffer.__html__()
 
 
 class Fragment(Part, Tag):
@@ -231,10 +230,9 @@ def render_text_or_children(self, context=None):
         if context is None:
             context = self.get_context()
         request = self.get_request()
-        return format_html(
-            '{}' * len(self.children),
-            *[as_html(part=x, context=context, request=request) for x in values(self.children)],
-        )
+        buffer = HtmlBuffer()
+        buffer.write_all([as_html(part=x, context=context, request=request) for x in values(self.children)])
+        return buffer.__html__()
 
     def __repr__(self):
         if self.is_refine_done:
@@ -0,0 +1,351 @@
+import functools
+import hashlib
+from urllib.parse import urlencode
+from uuid import uuid4
+
+from django.core.cache import (
+    DEFAULT_CACHE_ALIAS,
+    caches,
+)
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_save,
+)
+from django.utils.safestring import mark_safe
+from django.utils.translation import get_language
+
+from iommi.base import items
+from iommi.conditional_get import Validators
+from iommi.debug import iommi_debug_on
+from iommi.declarative.namespace import getattr_path
+from iommi.endpoint import DISPATCH_PATH_SEPARATOR
+from iommi.evaluate import evaluate_strict
+
+
+class CachedAsset:
+    """
+    The rendered html of an asset collected by a cached part. This is what is
+    put in the collected assets of the page on a cache hit.
+    """
+
+    def __init__(self, html, after, in_body):
+        self.html = html
+        self.after = after
+        self.in_body = in_body
+
+    def __html__(self):
+        return mark_safe(self.html)
+
+    def __str__(self):
+        return self.__html__()
+
+
+class FragmentCache:
+    """
+    The state of a part with `cache` configured, for one bind. On a hit `html`
+    is the cached html, on a miss the html is stored when the part is rendered.
+    """
+
+    def __init__(self, part, config, cache, key):
+        self.part = part
+        self.config = config
+        self.cache = cache
+        self.key = key
+        self.html = None
+        self.title = None
+        self.assets = {}
+        # The conditional GET validators, see add_part_validators
+        self.validators = None
+
+    def lookup(self):
+        entry = self.cache.get(self.key)
+        if entry is None:
+            return False
+        self.html = entry['html']
+        self.title = entry['title']
+        self.assets = {name: CachedAsset(**asset) for name, asset in items(entry['assets'])}
+        validators = entry.get('validators')
+        if validators is not None:
+            self.validators = Validators.from_dict(validators)
+        return True
+
+    def is_ancestor_of(self, part):
+        node = part.iommi_parent()
+        while node is not None:
+            if node is self.part:
+                return True
+            node = node.iommi_parent()
+        return False
+
+    def store(self, html):
+        from iommi.part import get_title
+
+        title = get_title(self.part)
+        entry = dict(
+            html=str(html),
+            title=None if title is None else str(title),
+            assets={
+                name: dict(
+                    html=str(asset.__html__()),
+                    after=getattr(asset, 'after', None),
+                    in_body=getattr(asset, 'in_body', False),
+                )
+                for name, asset in items(self.assets)
+            },
+            validators=None if self.validators is None else self.validators.as_dict(),
+        )
+        self.cache.set(self.key, entry, timeout=self.config.get('timeout', DEFAULT_TIMEOUT))
+
+    def render(self, f, *args, **kwargs):
+        if self.html is not None:
+            return mark_safe(self.html)
+
+        part = self.part
+        # Django's get_token() sets CSRF_COOKIE_NEEDS_UPDATE, so clear it to see if
+        # this part renders a csrf token, and put it back afterwards
+        meta = part.get_request().META
+        csrf_cookie_used = meta.pop('CSRF_COOKIE_NEEDS_UPDATE', False)
+        # Calls to super().__html__() render as usual
+        part._iommi_fragment_cache = None
+        try:
+            html = f(part, *args, **kwargs)
+        finally:
+            part._iommi_fragment_cache = self
+            renders_csrf_token = meta.get('CSRF_COOKIE_NEEDS_UPDATE', False)
+            if csrf_cookie_used:
+                meta['CSRF_COOKIE_NEEDS_UPDATE'] = True
+
+        # Only the default rendering is cached, not renderings with a custom template and such.
+        # The csrf token is different for each visitor, so html with one in it is never cached.
+        if not args and not any(kwargs.values()):
+            if not renders_csrf_token:
+                self.store(html)
+            recorders = part.iommi_root()._iommi_fragment_cache_recorders
+            if self in recorders:
+                recorders.remove(self)
+        return html
+
+
+def is_fragment_cache_hit(part):
+    fragment_cache = part._iommi_fragment_cache
+    return fragment_cache is not None and fragment_cache.html is not None
+
+
+def should_use_fragment_cache(request):
+    if request is None or request.method != 'GET':
+        return False
+    # Endpoints need the real parts
+    return not any(key.startswith(DISPATCH_PATH_SEPARATOR) for key in request.GET)
+
+
+def model_version_key(model):
+    return f'iommi-fragment-model:{model._meta.label_lower}'
+
+
+def invalidate_model(sender, **_):
+    """
+    Invalidate all cached parts with this model in `cache__models`. This is
+    connected to the save and delete signals for those models.
+    """
+    caches[DEFAULT_CACHE_ALIAS].set(model_version_key(sender), uuid4().hex, timeout=None)
+
+
+def connect_model_signals(models):
+    for model in models:
+        uid = f'iommi_fragment_cache_{model._meta.label_lower}'
+        post_save.connect(invalidate_model, sender=model, dispatch_uid=uid)
+        post_delete.connect(invalidate_model, sender=model, dispatch_uid=uid)
+        for field in model._meta.local_many_to_many:
+            m2m_changed.connect(
+                functools.partial(invalidate_model, model),
+                sender=field.remote_field.through,
+                dispatch_uid=f'{uid}_{field.name}',
+                weak=False,
+            )
+
+
+def model_versions(models):
+    if not models:
+        return []
+    cache = caches[DEFAULT_CACHE_ALIAS]
+    keys = [model_version_key(model) for model in models]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            cache.add(key, uuid4().hex, timeout=None)
+            versions[key] = cache.get(key)
+    return [f'{key}={versions[key]}' for key in keys]
+
+
+def _param_value(value):
+    return str(getattr(value, 'pk', value))
+
+
+def fragment_cache_key(part, config, evaluate_parameters):
+    request = evaluate_parameters['request']
+
+    key_parts = [
+        part.iommi_dunder_path,
+        request.path,
+        str(get_language()),
+        str(iommi_debug_on()),
+    ]
+
+    if config.get('vary_on_user', True):
+        user = evaluate_parameters.get('user')
+        key_parts.append(str(getattr(user, 'pk', '')) if user is not None and user.is_authenticated else '')
+
+    vary_on_get = config.get('vary_on_get', True)
+    if vary_on_get is True:
+        key_parts.append(urlencode(sorted(request.GET.lists()), doseq=True))
+    elif vary_on_get:
+        key_parts.append(urlencode([(k, request.GET.getlist(k)) for k in sorted(vary_on_get)], doseq=True))
+
+    vary_on_params = config.get('vary_on_params', True)
+    params = evaluate_parameters.get('params') or {}
+    if vary_on_params is True:
+        vary_on_params = sorted(params)
+    key_parts.extend(f'{k}={_param_value(params.get(k))}' for k in vary_on_params or [])
+
+    key = config.get('key')
+    if key is not None:
+        key_parts.append(str(evaluate_strict(key, **evaluate_parameters)))
+
+    key_parts.extend(model_versions(config.get('models')))
+
+    return 'iommi-fragment:' + hashlib.sha1('\n'.join(key_parts).encode()).hexdigest()
+
+
+def get_fragment_cache_config(part):
+    config = part.cache
+    if config is True:
+        config = {}
+    return config
+
+
+def setup_fragment_cache(part):
+    """
+    Called on bind for parts with `cache` configured. Returns True on a cache
+    hit, in which case the part should skip the rest of the bind.
+    """
+    config = get_fragment_cache_config(part)
+    evaluate_parameters = part.iommi_evaluate_parameters()
+    if not should_use_fragment_cache(evaluate_parameters.get('request')):
+        return False
+
+    fragment_cache = FragmentCache(
+        part=part,
+        config=config,
+        cache=caches[config.get('alias', DEFAULT_CACHE_ALIAS)],
+        key=fragment_cache_key(part, config, evaluate_parameters),
+    )
+    part._iommi_fragment_cache = fragment_cache
+    if fragment_cache.lookup():
+        return True
+
+    root = part.iommi_root()
+    if root._iommi_fragment_cache_recorders is None:
+        root._iommi_fragment_cache_recorders = []
+    root._iommi_fragment_cache_recorders.append(fragment_cache)
+    return False
+
+
+def record_assets(part):
+    """
+    Record the assets of a part bound inside the subtree of a part that will
+    be stored in the cache, so they can be added to the page on a hit.
+    """
+    for fragment_cache in part.iommi_root()._iommi_fragment_cache_recorders:
+        if fragment_cache.is_ancestor_of(part):
+            fragment_cache.assets.update(part.assets)
+
+
+def cached_html(f):
+    """
+    Decorator for `__html__` of parts. When the part has `cache` configured
+    this returns the cached html, or stores the rendered html.
+    """
+
+    @functools.wraps(f)
+    def cached_html_inner(self, *args, **kwargs):
+        fragment_cache = self._iommi_fragment_cache
+        if fragment_cache is None:
+            return f(self, *args, **kwargs)
+        return fragment_cache.render(f, *args, **kwargs)
+
+    cached_html_inner._iommi_cached_html = True
+    return cached_html_inner
+
+
+def row_cache_prefix(table, config):
+    from iommi.style import get_style_object
+
+    evaluate_parameters = table.iommi_evaluate_parameters()
+    request = evaluate_parameters['request']
+
+    key_parts = [
+        table.iommi_dunder_path,
+        request.path,
+        str(get_language()),
+        str(iommi_debug_on()),
+        str(get_style_object(table).name),
+        ','.join(name for name, column in items(table.columns) if column.render_column),
+    ]
+
+    if config.get('vary_on_user', True):
+        user = evaluate_parameters.get('user')
+        key_parts.append(str(getattr(user, 'pk', '')) if user is not None and user.is_authenticated else '')
+
+    key = config.get('key')
+    if key is not None:
+        key_parts.append(str(evaluate_strict(key, **evaluate_parameters)))
+
+    return '\n'.join(key_parts)
+
+
+def render_rows_with_cache(table, cells_iterable):
+    """
+    Render the rows of a table with `row__cache` configured. The html of each
+    row is cached on the pk of the row and the `version` attribute, so only
+    the rows that aren't in the cache are rendered.
+
+    `cells_iterable` is what `Table.cells_for_rows` yields.
+    """
+    config = get_fragment_cache_config(table.row)
+    cache = caches[config.get('alias', DEFAULT_CACHE_ALIAS)]
+    version_attr = config.get('version')
+    prefix = row_cache_prefix(table, config)
+
+    items_to_render = list(cells_iterable)
+
+    key_by_index = {}
+    for i, cells in enumerate(items_to_render):
+        # Row group headers are already rendered
+        if isinstance(cells, str):
+            continue
+        pk = getattr(cells.row, 'pk', None)
+        version = getattr_path(cells.row, version_attr) if version_attr else ''
+        if pk is None or version is None:
+            continue
+        digest = hashlib.sha1(f'{prefix}\n{pk}\n{version}'.encode()).hexdigest()
+        key_by_index[i] = f'iommi-row:{digest}'
+
+    cached = cache.get_many(list(key_by_index.values())) if key_by_index else {}
+
+    to_store = {}
+    result = []
+    for i, cells in enumerate(items_to_render):
+        key = key_by_index.get(i)
+        html = cached.get(key) if key is not None else None
+        if html is None:
+            html = str(cells if isinstance(cells, str) else cells.__html__())
+            if key is not None:
+                to_store[key] = html
+        result.append(html)
+
+    if to_store:
+        cache.set_many(to_store, timeout=config.get('timeout', DEFAULT_TIMEOUT))
+
+    return mark_safe('\n'.join(result))
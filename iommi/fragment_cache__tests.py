@@ -0,0 +1,294 @@
+from unittest import mock
+
+import pytest
+from django.core.cache import (
+    cache,
+    caches,
+)
+
+from iommi import (
+    Asset,
+    Column,
+    Field,
+    Form,
+    Fragment,
+    Page,
+    Table,
+    html,
+)
+from iommi.fragment_cache import CachedAsset
+from iommi.struct import Struct
+from tests.helpers import (
+    req,
+    user_req,
+)
+from tests.models import TFoo
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+class CountingTable(Table):
+    on_bind_count = 0
+
+    def on_bind(self):
+        type(self).on_bind_count += 1
+        super().on_bind()
+
+
+def render(part, request):
+    return part.bind(request=request).render_to_response().content.decode()
+
+
+def test_cache_hit_skips_bind_and_render():
+    CountingTable.on_bind_count = 0
+
+    class MyPage(Page):
+        table = CountingTable(
+            columns__a=Column(),
+            rows=[Struct(a='first')],
+            cache=True,
+            assets__my_asset=Asset.js('my_script()'),
+        )
+        greeting = html.div(
+            html.span('hello', assets__child_asset=Asset.js('child_script()')),
+            cache__timeout=10,
+        )
+
+    first = render(MyPage(), req('get'))
+    assert CountingTable.on_bind_count == 1
+
+    second = render(MyPage(parts__table__rows=[Struct(a='second')]), req('get'))
+    assert CountingTable.on_bind_count == 1
+    assert second == first
+    assert 'first' in second
+    assert 'my_script()' in second
+    assert 'child_script()' in second
+
+
+def test_cache_hit_registers_endpoints_and_assets():
+    class MyPage(Page):
+        greeting = html.div(
+            html.span('hello', assets__child_asset=Asset.js('child_script()')),
+            endpoints__foo__func=lambda **_: 'foo',
+            cache=True,
+        )
+
+    render(MyPage(), req('get'))
+    page = MyPage().bind(request=req('get'))
+    greeting = page.parts.greeting
+
+    assert greeting._iommi_fragment_cache.html is not None
+    assert greeting.endpoints.foo.func() == 'foo'
+    assert isinstance(page._iommi_collected_assets['child_asset'], CachedAsset)
+    assert greeting.__html__() == '<div><span>hello</span></div>'
+
+
+def test_cache_varies_on_get():
+    def table(text):
+        return Table(
+            columns__a=Column(),
+            rows=lambda request, **_: [Struct(a=f'{text} {request.GET.get("x")}')],
+            cache=True,
+        )
+
+    assert 'first 1' in render(table('first'), req('get', x='1'))
+    assert 'second 2' in render(table('second'), req('get', x='2'))
+    assert 'first 1' in render(table('changed'), req('get', x='1'))
+
+
+def test_cache_vary_on_get_keys():
+    def fragment(text):
+        return Fragment(text, cache__vary_on_get=['foo'])
+
+    assert render(fragment('a'), req('get', foo='1', bar='1')) == render(fragment('b'), req('get', foo='1', bar='2'))
+    assert render(fragment('a'), req('get', foo='1')) != render(fragment('b'), req('get', foo='2'))
+
+
+def test_cache_varies_on_user():
+    def fragment(text, **kwargs):
+        return Fragment(text, cache=kwargs or True)
+
+    def request(pk):
+        r = user_req('get')
+        r.user.pk = pk
+        return r
+
+    assert 'first' in render(fragment('first'), request(pk=1))
+    assert 'second' in render(fragment('second'), request(pk=2))
+    assert 'first' in render(fragment('changed'), request(pk=1))
+
+    render(fragment('shared', vary_on_user=False), request(pk=1))
+    assert 'shared' in render(fragment('not shared', vary_on_user=False), request(pk=2))
+
+
+def test_cache_varies_on_params_and_key():
+    def fragment(text, **kwargs):
+        return Fragment(text, cache=kwargs or True)
+
+    def request(**params):
+        r = req('get')
+        r.iommi_view_params = params
+        return r
+
+    assert 'one' in render(fragment('one'), request(pk=1))
+    assert 'two' in render(fragment('two'), request(pk=2))
+
+    render(fragment('first', vary_on_params=[]), request(pk=1))
+    assert 'first' in render(fragment('second', vary_on_params=[]), request(pk=2))
+
+    assert 'a' in render(fragment('a', key=lambda request, **_: request.GET.get('x')), req('get'))
+    assert 'b' in render(fragment('b', key='other'), req('get'))
+
+
+def test_cache_is_bypassed_for_post():
+    CountingTable.on_bind_count = 0
+    table = CountingTable(columns__a=Column(), rows=[Struct(a='a')], cache=True)
+    render(table, req('get'))
+    table.bind(request=req('post', **{'-foo': ''}))
+    assert CountingTable.on_bind_count == 2
+
+
+def test_cache_does_not_store_csrf_tokens():
+    from django.middleware.csrf import _unmask_cipher_token
+
+    class MyPage(Page):
+        form = Form(fields__name=Field(), cache=True)
+        greeting = html.div('hello', cache=True)
+
+    def render_for_anonymous_visitor(csrf_secret):
+        request = req('get')
+        request.META['CSRF_COOKIE'] = csrf_secret
+        content = render(MyPage(), request)
+        assert request.META['CSRF_COOKIE_NEEDS_UPDATE']
+        token = content.partition('name="csrfmiddlewaretoken" value="')[2].partition('"')[0]
+        return _unmask_cipher_token(token)
+
+    assert render_for_anonymous_visitor('a' * 32) == 'a' * 32
+    assert render_for_anonymous_visitor('b' * 32) == 'b' * 32
+
+    # The greeting is a cache hit, and the form is never stored
+    with mock.patch('iommi.fragment_cache.FragmentCache.store') as store:
+        render_for_anonymous_visitor('c' * 32)
+    assert not store.called
+
+
+@pytest.mark.django_db
+def test_cache_with_endpoint_tbody():
+    TFoo.objects.create(a=1, b='cached')
+
+    def page():
+        return Page(parts__table=Table(auto__model=TFoo, cache__models=[TFoo]))
+
+    assert 'cached' in render(page(), req('get'))
+
+    TFoo.objects.update(b='updated')
+    assert 'cached' in render(page(), req('get'))
+
+    response = page().bind(request=req('get', **{'/table/tbody': ''})).render_to_response()
+    assert 'updated' in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_cache_is_invalidated_by_model_changes():
+    foo = TFoo.objects.create(a=1, b='before')
+
+    def table():
+        return Table(auto__model=TFoo, cache__models=[TFoo])
+
+    assert 'before' in render(table(), req('get'))
+
+    foo.b = 'after'
+    foo.save()
+    assert 'after' in render(table(), req('get'))
+
+    foo.delete()
+    assert 'after' not in render(table(), req('get'))
+
+
+def test_cache_title():
+    class MyPage(Page):
+        table = Table(columns__a=Column(), rows=[], title='Cached title', cache=True)
+
+    render(MyPage(), req('get'))
+    page = MyPage().bind(request=req('get'))
+    assert page.parts.table.title == 'Cached title'
+    assert '<title>Cached title</title>' in page.render_to_response().content.decode()
+
+
+def test_cache_with_super_html():
+    class MyFragment(Fragment):
+        def __html__(self, **kwargs):
+            return super().__html__(**kwargs) + '!'
+
+    assert render(MyFragment('hello', cache=True), req('get')) == render(MyFragment('bye', cache=True), req('get'))
+    assert MyFragment('hello', cache=True).bind(request=req('get')).__html__() == 'hello!'
+
+
+def row_cache_table(rows, calls, **kwargs):
+    def format_value(value, **_):
+        calls.append(value)
+        return f'value {value}'
+
+    return Table(
+        columns__a=Column(cell__format=format_value),
+        rows=rows,
+        row__cache__version='version',
+        **kwargs,
+    )
+
+
+def test_row_cache():
+    calls = []
+    rows = [Struct(pk=i, a=i, version=1) for i in range(3)]
+
+    first = row_cache_table(rows, calls).bind(request=req('get')).__html__()
+    assert calls == [0, 1, 2]
+
+    calls.clear()
+    rows[1].a = 'changed'
+    rows[1].version = 2
+    with mock.patch.object(caches['default'], 'get_many', wraps=caches['default'].get_many) as get_many:
+        second = row_cache_table(rows, calls).bind(request=req('get')).__html__()
+    assert get_many.call_count == 1
+    assert calls == ['changed']
+    assert second == first.replace('value 1', 'value changed')
+
+
+def test_row_cache_without_pk_or_version():
+    calls = []
+    rows = [Struct(pk=None, a='no pk', version=1), Struct(pk=1, a='no version', version=None)]
+
+    row_cache_table(rows, calls).bind(request=req('get')).__html__()
+    row_cache_table(rows, calls).bind(request=req('get')).__html__()
+    assert calls == ['no pk', 'no version', 'no pk', 'no version']
+
+
+def test_row_cache_with_row_groups():
+    calls = []
+    rows = [Struct(pk=i, a=i, group='group', version=1) for i in range(2)]
+
+    def table():
+        return row_cache_table(rows, calls, columns__group=Column(row_group__include=True))
+
+    first = table().bind(request=req('get')).__html__()
+    second = table().bind(request=req('get')).__html__()
+    assert calls == [0, 1]
+    assert second == first
+    assert second.count('<th colspan="99">') == 1
+
+
+def test_row_cache_is_bypassed_for_auto_rowspan():
+    calls = []
+    rows = [Struct(pk=i, a=i, version=1) for i in range(2)]
+
+    def table():
+        return row_cache_table(rows, calls, columns__a__auto_rowspan=True)
+
+    table().bind(request=req('get')).__html__()
+    table().bind(request=req('get')).__html__()
+    assert calls == [0, 1, 0, 1]
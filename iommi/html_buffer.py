@@ -0,0 +1,42 @@
+from django.utils.html import conditional_escape
+from django.utils.safestring import (
+    SafeString,
+    mark_safe,
+)
+
+
+class HtmlBuffer:
+    """
+    Collects the pieces of some html in a list and joins them once at the end,
+    instead of building a new safe string for each element like `format_html`
+    does. Markup written with `write_safe` is used as is, values written with
+    `write` are escaped unless they are already safe, just like the arguments
+    to `format_html`.
+    """
+
+    __slots__ = ('parts',)
+
+    def __init__(self):
+        self.parts = []
+
+    def write_safe(self, s):
+        self.parts.append(s)
+
+    def write(self, value):
+        self.parts.append(value if type(value) is SafeString else conditional_escape(value))
+
+    def write_all(self, values):
+        for value in values:
+            self.write(value)
+
+    def write_open_tag(self, tag, attrs):
+        self.parts += ['<', conditional_escape(tag), conditional_escape(attrs), '>']
+
+    def write_close_tag(self, tag):
+        self.parts += ['</', conditional_escape(tag), '>']
+
+    def __html__(self):
+        return mark_safe(''.join(self.parts))
+
+    def __str__(self):
+        return self.__html__()
@@ -0,0 +1,54 @@
+from django.utils.safestring import (
+    SafeString,
+    mark_safe,
+)
+
+from iommi import (
+    Column,
+    Table,
+)
+from iommi.attrs import render_attrs
+from iommi.declarative.namespace import Namespace
+from iommi.html_buffer import HtmlBuffer
+from iommi.struct import Struct
+from iommi.table import (
+    Cell,
+    Cells,
+)
+from tests.helpers import req
+
+
+def test_html_buffer():
+    buffer = HtmlBuffer()
+    buffer.write_open_tag('div', render_attrs(Namespace(foo='"bar"')))
+    buffer.write_all(['<a>', mark_safe('<b>'), 1, None])
+    buffer.write_safe('<br>')
+    buffer.write_close_tag('div')
+
+    html = buffer.__html__()
+    assert isinstance(html, SafeString)
+    assert html == '<div foo="&quot;bar&quot;">&lt;a&gt;<b>1None<br></div>'
+    assert str(buffer) == html
+
+
+def test_html_buffer_empty():
+    assert HtmlBuffer().__html__() == ''
+
+
+def test_cells_use_overridden_cell_html():
+    class MyCell(Cell):
+        def __html__(self):
+            return mark_safe('<td>overridden</td>')
+
+    class MyCells(Cells):
+        class Meta:
+            cell_class = MyCell
+
+    table = Table(
+        columns__a=Column(),
+        columns__b=Column(),
+        cells_class=MyCells,
+        rows=[Struct(a=1, b=2)],
+    ).bind(request=req('get'))
+    cells = next(iter(table.cells_for_rows()))
+    assert cells.__html__() == '<tr><td>overridden</td>\n<td>overridden</td></tr>'
@@ -48,6 +48,77 @@ class NoTranslateString(str):
     pass
 
 
+_style_config_cache = {}
+
+
+def _style_config(style, obj):
+    # Menus and menu items have no shortcuts, so the style config only depends on the type
+    key = (style, type(obj))
+    conf = _style_config_cache.get(key)
+    if conf is None:
+        conf = _style_config_cache[key] = Namespace(*style.resolve(obj))
+    return conf
+
+
+def _url_parts(url):
+    return PurePosixPath(url).parts
+
+
+class _UrlTrie:
+    """
+    Maps the segments of the static urls of a menu to the items, so finding
+    the items whose url is a prefix of the current path is a walk down the
+    segments of the path instead of a walk over the whole menu.
+    """
+
+    def __init__(self):
+        self.children = {}
+        self.items = []
+
+    def insert(self, parts, item):
+        node = self
+        for part in parts:
+            node = node.children.setdefault(part, _UrlTrie())
+        node.items.append(item)
+
+    def matches(self, parts):
+        """Yield `(likeness, item)`, best match first."""
+        found = []
+        node = self
+        for depth, part in enumerate(parts, start=1):
+            node = node.children.get(part)
+            if node is None:
+                break
+            found.append((depth, node.items))
+
+        for depth, items in reversed(found):
+            for item in items:
+                yield depth, item
+
+
+def _compile_items(items, parent_url, order, trie):
+    has_dynamic = False
+    for i, (name, m) in enumerate(items.items()):
+        m._order = order + (i,)
+        if m.url is None:
+            if parent_url is not None and parent_url.endswith('/'):
+                m._static_url = parent_url + name + '/'
+            else:
+                m._static_url = None
+        elif isinstance(m.url, str):
+            m._static_url = m.url
+        else:
+            m._static_url = None
+
+        if m._static_url is not None and '://' not in m._static_url:
+            trie.insert(_url_parts(m._static_url), m)
+
+        children_have_dynamic = _compile_items(m.items, m._static_url, m._order, trie)
+        m._has_dynamic = m._static_url is None or m.dynamic_items is not None or children_have_dynamic
+        has_dynamic = has_dynamic or m._has_dynamic
+    return has_dynamic
+
+
 def path(path, view_or_list, name=None, kwargs=None):
     if isinstance(view_or_list, list):
         assert kwargs is None
@@ -84,6 +155,15 @@ def __init__(self, *, items=None, attrs, template=MISSING, paths=None, extra, ex
         for name, c in self.items.items():
             c.parent = self
             c._set_name(name)
+        self._url_trie = None
+
+    def _compile(self):
+        # The items can't change after the menu is declared, so what doesn't depend on the request is done once
+        if self._url_trie is None:
+            trie = _UrlTrie()
+            _compile_items(self.items, '/', (), trie)
+            self._url_trie = trie
+        return self._url_trie
 
     def urlpatterns(self):
         if 'iommi.main_menu.main_menu_middleware' not in settings.MIDDLEWARE:
@@ -97,22 +177,24 @@ def urlpatterns(self):
         ] + self.paths
 
     def bind(self, request):
-        style = resolve_style(None)
-        conf = Namespace(*style.resolve(self))
+        self._compile()
+
+        conf = _style_config(resolve_style(None), self)
 
-        style_template = conf.pop('template', 'iommi/main_menu/menu.html')
+        style_template = conf.get('template', 'iommi/main_menu/menu.html')
         if self.template is MISSING:
             self.template = style_template
 
         assets = {
             k: v.bind(request=request)
-            for k, v in conf.pop('assets', {}).items()
+            for k, v in conf.get('assets', {}).items()
             if v
         }
 
-        attrs = Namespace(self.attrs, conf.pop('attrs', {}))
+        attrs = Namespace(self.attrs, conf.get('attrs', {}))
 
-        assert not conf, f'Unknown configuration {conf} for `MainMenu`'
+        unknown = {k: v for k, v in conf.items() if k not in ('template', 'assets', 'attrs')}
+        assert not unknown, f'Unknown configuration {unknown} for `MainMenu`'
 
         return BoundMainMenu(
             self,
@@ -141,47 +223,90 @@ def __init__(self, main_menu, request, attrs, template, assets):
 
         self.attrs = evaluate_attrs(self, **self._own_evaluate_parameters)
 
+        self.order = ()
         self.raw_items = {
-            k: v.bind(request=request, root=self)
-            for k, v in self.main_menu.items.items()
+            k: v.bind(request=request, root=self, order=(i,))
+            for i, (k, v) in enumerate(self.main_menu.items.items())
         }
         self.items = {k: v for k, v in self.raw_items.items() if v.include}
 
-        # Set active_item
         self.url = None
+        self.active_item = self._find_active_item()
+
+        # The active item and its parents, from the top of the menu down
+        self.active_path = []
+        item = self.active_item
+        while item is not None:
+            self.active_path.insert(0, item)
+            item = item.parent
+
+    def _find_active_item(self):
+        """
+        The active item is the one with the longest url that is a prefix of
+        the current path. On a tie the first one in the menu wins.
+
+        Static urls are looked up in the url trie of the menu. Only the
+        branches of the menu with urls that are callables, or items that are
+        generated per request, are bound and evaluated to find their urls.
+        """
+        path_parts = _url_parts(urlparse(self.request.get_full_path()).path)
+
         best_match = None
-        path_parts = PurePosixPath(urlparse(self.request.get_full_path()).path).parts
+        best_key = (0, ())
+
+        for likeness, m in self.main_menu._url_trie.matches(path_parts):
+            bound = self._bound_item_for(m)
+            if bound is not None:
+                best_match = bound
+                best_key = (likeness, bound.order)
+                break
 
         def url_likeness(x):
-            if x is None:
-                return 0
-            a = PurePosixPath(x.url).parts
+            a = _url_parts(x.url)
             b = path_parts
             # if a starts with b
             if a == b[:len(a)]:
                 return len(a)
             return 0
 
-        def foo(x):
-            nonlocal best_match
+        def visit_dynamic(x):
+            nonlocal best_match, best_key
 
             if not x.params_are_satisfied():
                 return
 
-            if x.url and '://' not in x.url and url_likeness(best_match) < url_likeness(x):
-                best_match = x
+            if x is not self and x.m._static_url is None and x.url and '://' not in x.url:
+                likeness = url_likeness(x)
+                if likeness > best_key[0] or (likeness and likeness == best_key[0] and x.order < best_key[1]):
+                    best_match = x
+                    best_key = (likeness, x.order)
 
             for sub_item in x.raw_items.values():
-                foo(sub_item)
-
-        foo(self)
-        self.active_item = best_match
+                if sub_item.m._has_dynamic:
+                    visit_dynamic(sub_item)
+
+        visit_dynamic(self)
+        return best_match
+
+    def _bound_item_for(self, m):
+        chain = []
+        while isinstance(m, M):
+            chain.append(m)
+            m = m.parent
+
+        items = self.raw_items
+        bound = None
+        for m in reversed(chain):
+            bound = items.get(m.name)
+            if bound is None or not bound.params_are_satisfied():
+                return None
+            items = bound.raw_items
+        return bound
 
     def check_access(self):
-        for item in self.raw_items.values():
-            if not item.is_active():
-                continue
-            item.check_access()
+        for item in self.active_path:
+            if not item.include:
+                raise PermissionDenied()
 
     def params_are_satisfied(self):
         return True
@@ -264,6 +389,9 @@ def __init__(self, *, icon=None, view=None, view_kwargs=None, path=MISSING, url=
             }
 
         self.parent = None
+        self._order = None
+        self._static_url = None
+        self._has_dynamic = True
         self.params = params
         self.open = open
         self.attrs = attrs
@@ -315,12 +443,13 @@ def urlpatterns(self):
             if x.view is not EXTERNAL
         ] + self.paths
 
-    def bind(self, request, root):
+    def bind(self, request, root, order=()):
         return BoundM(
             self,
             request=request,
             root=root,
             parent=None,
+            order=order,
         )
 
     def _name_path(self):
@@ -328,56 +457,73 @@ def _name_path(self):
 
 
 class BoundM(Tag):
-    def __init__(self, m, *, request, parent, root):
+    """
+    A menu item bound to a request. Only `include` and `render_item` are
+    evaluated up front. Everything else, including the sub items, is
+    evaluated when it is used, so the branches of the menu that are not
+    rendered or checked for access cost nothing.
+    """
+
+    def __init__(self, m, *, request, parent, root, order):
         self.tag = 'li'
         self.m = m
         self.request = request
         self.parent = parent
         self.root = root
+        self.order = order
+        self._own_evaluate_parameters = self.own_evaluate_parameters()
         self.include = self._include()
 
-        style = resolve_style(None)
-        conf = Namespace(*style.resolve(self))
+        conf = _style_config(resolve_style(None), self)
 
-        template = conf.pop('template', 'iommi/main_menu/menu_item.html')
+        template = conf.get('template', 'iommi/main_menu/menu_item.html')
         if self.m.template is not MISSING:
             template = self.m.template
 
         self.template = template
-        attrs = Namespace(self.m.attrs, conf.pop('attrs', {}))
-        self.attrs = attrs
-
-        assert not conf, f'Unsupported configuration {conf}'
+        self._attrs = Namespace(self.m.attrs, conf.get('attrs', {}))
 
-        self._own_evaluate_parameters = self.own_evaluate_parameters()
+        unknown = {k: v for k, v in conf.items() if k not in ('template', 'attrs')}
+        assert not unknown, f'Unsupported configuration {unknown}'
 
         self.render_item = evaluate_strict(self.m.render, **self._own_evaluate_parameters)
 
-        if self.include:
-            self.display_name = self._display_name()
-            items = self.m.items
-
-            if self.m.dynamic_items:
-                assert not items
-                items = evaluate_strict(self.m.dynamic_items, **self._own_evaluate_parameters)
-
-            self.raw_items = {
-                k: BoundM(
-                    v,
-                    request=request,
-                    root=root,
-                    parent=self,
-                )
-                for k, v in items.items()
-            }
-            self.items = {k: v for k, v in self.raw_items.items() if v.include}
-        else:
-            self.raw_items = {}
-            self.items = {}
+    @cached_property
+    def display_name(self):
+        return self._display_name()
 
-        self.attrs = evaluate_attrs(self, **self._own_evaluate_parameters)
+    @cached_property
+    def raw_items(self):
+        if not self.include:
+            return {}
+
+        items = self.m.items
+        if self.m.dynamic_items:
+            assert not items
+            items = evaluate_strict(self.m.dynamic_items, **self._own_evaluate_parameters)
+
+        return {
+            k: BoundM(
+                v,
+                request=self.request,
+                root=self.root,
+                parent=self,
+                order=self.order + (i,),
+            )
+            for i, (k, v) in enumerate(items.items())
+        }
 
-        self.has_rendered_items = len([x for x in self.items.values() if x.render_item]) > 0
+    @cached_property
+    def items(self):
+        return {k: v for k, v in self.raw_items.items() if v.include}
+
+    @cached_property
+    def attrs(self):
+        return evaluate_attrs(Struct(attrs=self._attrs), **self._own_evaluate_parameters)
+
+    @cached_property
+    def has_rendered_items(self):
+        return len([x for x in self.items.values() if x.render_item]) > 0
 
     def __str__(self):
         return self.__html__()
@@ -405,7 +551,7 @@ def iommi_close_details_tag(self):
         return format_html('</details>', )
 
     def is_active(self):
-        return self.root.active_item is self or any([item.is_active() for item in self.raw_items.values()])
+        return any(item is self for item in self.root.active_path)
 
     def own_evaluate_parameters(self):
         request = self.request
@@ -439,7 +585,7 @@ def params_are_satisfied(self):
 
     def _include(self):
         if self.m.include is not None:
-            return self.params_are_satisfied() and evaluate_strict(self.m.include, **self.own_evaluate_parameters())
+            return self.params_are_satisfied() and evaluate_strict(self.m.include, **self._own_evaluate_parameters)
         return self.params_are_satisfied()
 
     @cached_property
@@ -486,12 +632,13 @@ def _display_name(self):
         return evaluate_strict(self.m.display_name, **self.own_evaluate_parameters())
 
     def check_access(self):
-        if self.is_active() and not self.include:
-            raise PermissionDenied()
-        for item in self.raw_items.values():
-            if not item.is_active():
-                continue
-            item.check_access()
+        active_path = self.root.active_path
+        for i, item in enumerate(active_path):
+            if item is self:
+                for active_item in active_path[i:]:
+                    if not active_item.include:
+                        raise PermissionDenied()
+                return
 
 
 @django.utils.decorators.sync_and_async_middleware
@@ -15,6 +15,7 @@
 )
 from iommi.main_menu import (
     EXTERNAL,
+    BoundM,
     M,
     MainMenu,
     main_menu_middleware,
@@ -579,3 +580,110 @@ def test_styling_6(settings):
     assert test_main_menu_style.resolve(MainMenu())[0]['assets']['iommi_main_menu_css'] is None
     with register_style('test_main_menu_style', test_main_menu_style):
         MainMenu().bind(request=req('get'))
+
+
+def test_active_item_only_binds_the_matching_branch():
+    evaluated = []
+
+    def include(item, **_):
+        evaluated.append(item.m.name)
+        return True
+
+    menu = MainMenu(
+        items=dict(
+            foo=M(
+                view=fake_view,
+                items=dict(
+                    bar=M(view=fake_view, include=include),
+                ),
+            ),
+            baz=M(
+                view=fake_view,
+                items=dict(
+                    quux=M(view=fake_view, include=include),
+                ),
+            ),
+        ),
+    )
+
+    bound = menu.bind(request=req('get', url='/baz/quux/'))
+    assert bound.active_item.url == '/baz/quux/'
+    assert evaluated == ['quux']
+
+    str(bound)
+    assert evaluated == ['quux', 'bar']
+
+
+def test_active_item_with_callable_url():
+    menu = MainMenu(
+        items=dict(
+            foo=M(
+                view=fake_view,
+                items=dict(
+                    static=M(view=fake_view, url='/foo/x/'),
+                    dynamic=M(view=fake_view, url=lambda **_: '/foo/x/y/'),
+                    dynamic_tie=M(view=fake_view, url=lambda **_: '/foo/x/'),
+                ),
+            ),
+            generated=M(
+                view=fake_view,
+                items=lambda **_: dict(
+                    child=M(view=fake_view, url='/generated/child/'),
+                ),
+            ),
+        ),
+    )
+
+    assert menu.bind(request=req('get', url='/foo/x/')).active_item.m.name == 'static'
+    assert menu.bind(request=req('get', url='/foo/x/y/')).active_item.m.name == 'dynamic'
+    assert menu.bind(request=req('get', url='/generated/child/')).active_item.url == '/generated/child/'
+    assert menu.bind(request=req('get', url='/nope/')).active_item is None
+
+
+def test_dynamic_url_wins_tie_when_first():
+    menu = MainMenu(
+        items=dict(
+            dynamic=M(view=fake_view, url=lambda **_: '/x/'),
+            static=M(view=fake_view, url='/x/'),
+        ),
+    )
+
+    assert menu.bind(request=req('get', url='/x/')).active_item.m.name == 'dynamic'
+
+
+def test_check_access_only_binds_the_active_path(monkeypatch):
+    bound_items = []
+    original_init = BoundM.__init__
+
+    def counting_init(self, *args, **kwargs):
+        bound_items.append(self)
+        original_init(self, *args, **kwargs)
+
+    monkeypatch.setattr(BoundM, '__init__', counting_init)
+
+    menu = MainMenu(
+        items={
+            f'a{i}': M(
+                view=fake_view,
+                items={
+                    f'b{j}': M(
+                        view=fake_view,
+                        items={f'c{k}': M(view=fake_view) for k in range(3)},
+                    )
+                    for j in range(3)
+                },
+            )
+            for i in range(4)
+        },
+    )
+
+    bound = menu.bind(request=req('get', url='/a1/b1/c1/'))
+    # The top level, and the items on the levels below a1 and b1
+    assert len(bound_items) == 4 + 3 + 3
+    assert [x.m.name for x in bound.active_path] == ['a1', 'b1', 'c1']
+
+    bound.check_access()
+    assert len(bound_items) == 4 + 3 + 3
+    assert bound.items['a1'].is_active()
+    assert not bound.items['a0'].is_active()
+    assert len(bound_items) == 4 + 3 + 3
@@ -305,7 +305,7 @@ class DebugMenu(Menu):
         # the bound part tree, pick highlights elements with data-iommi-path), so
         # they are useless for plain function based views.
         tree = MenuItem(
-            url='?/debug_tree',
+            url=lambda request, **_: '?/debug_tree&_iommi_timing' if '_iommi_timing' in request.GET else '?/debug_tree',
             tag='li',
             include=has_iommi_part,
         )
@@ -364,6 +364,11 @@ class DebugMenu(Menu):
             tag='li',
             include=lambda **_: 'iommi.profiling.Middleware' in settings.MIDDLEWARE,
         )
+        timing = MenuItem(
+            url=lambda request, **_: add_get_parameter_to_current_url(request, _iommi_timing=''),
+            tag='li',
+            include=has_iommi_part,
+        )
         sql_trace = MenuItem(
             display_name='SQL trace',
             url=lambda request, **_: add_get_parameter_to_current_url(request, _iommi_sql_trace=''),
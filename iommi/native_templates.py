@@ -0,0 +1,430 @@
+from pathlib import Path
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.template import (
+    Context,
+    TemplateDoesNotExist,
+)
+from django.template.backends.django import Template as DjangoBackendTemplate
+from django.template.base import render_value_in_context
+from django.template.context_processors import csrf
+from django.template.loader import (
+    get_template,
+    render_to_string,
+)
+from django.utils.html import conditional_escape
+from django.utils.safestring import (
+    SafeData,
+    mark_safe,
+)
+
+BUILTIN_TEMPLATES_DIR = Path(__file__).parent / 'templates'
+
+# Autoescape, and localization and time zones from the settings, like a template with default settings
+_default_context = Context()
+
+_native_renderers = {}
+_is_unmodified_cache = {}
+
+
+def native_renderer(template_name):
+    """
+    Register a function that renders the built-in template `template_name`
+    without the template engine. The function gets `request` and `context`
+    and must return exactly what the template renders.
+    """
+
+    def decorator(f):
+        _native_renderers[template_name] = f
+        return f
+
+    return decorator
+
+
+def is_unmodified_builtin_template(template_name):
+    result = _is_unmodified_cache.get(template_name)
+    if result is None:
+        try:
+            template = get_template(template_name)
+        except TemplateDoesNotExist:
+            result = False
+        else:
+            engine = getattr(getattr(template, 'template', None), 'engine', None)
+            result = (
+                isinstance(template, DjangoBackendTemplate)
+                and Path(template.origin.name) == BUILTIN_TEMPLATES_DIR / template_name
+                and engine.autoescape
+                and engine.string_if_invalid == ''
+            )
+        _is_unmodified_cache[template_name] = result
+    return result
+
+
+def _clear_cache(*, setting, **_):
+    if setting in ('TEMPLATES', 'INSTALLED_APPS', 'IOMMI_NATIVE_TEMPLATES'):
+        _is_unmodified_cache.clear()
+
+
+setting_changed.connect(_clear_cache)
+
+
+def get_native_renderer(request, template_name):
+    """
+    Returns the native renderer for a template name, if there is one and the
+    template that Django would use is the unmodified built-in template.
+    """
+    renderer = _native_renderers.get(template_name)
+    if renderer is None:
+        return None
+    if not getattr(settings, 'IOMMI_NATIVE_TEMPLATES', True):
+        return None
+    # The code finder annotates the output of the template engine
+    if request is not None and '_iommi_code_finder' in request.GET:
+        return None
+    if not is_unmodified_builtin_template(template_name):
+        return None
+    return renderer
+
+
+def render_native_or_template(request, template_name, context):
+    renderer = get_native_renderer(request, template_name)
+    if renderer is not None:
+        return renderer(request, context)
+    return render_to_string(template_name=template_name, context=context, request=request)
+
+
+def value(x):
+    """
+    `{{ x }}`
+    """
+    return render_value_in_context(x, _default_context)
+
+
+def stringformat(x):
+    """
+    `{{ x|stringformat:'s' }}`
+    """
+    result = '%s' % (str(x) if isinstance(x, tuple) else x)
+    return value(mark_safe(result) if isinstance(x, SafeData) else result)
+
+
+def call(x):
+    # The template engine calls callables
+    if callable(x) and not getattr(x, 'do_not_call_in_templates', False):
+        return x()
+    return x
+
+
+def lookup(x, *path, default=None):
+    """
+    A lookup like `x.a.b` in a template. Returns `default` if some step
+    fails, which is `None` in an `{% if %}` and `''` in a `{{ }}`.
+    """
+    for name in path:
+        try:
+            x = x[name]
+        except (TypeError, AttributeError, KeyError, ValueError, IndexError):
+            try:
+                x = getattr(x, name)
+            except (TypeError, AttributeError):
+                return default
+        x = call(x)
+    return x
+
+
+def csrf_token(request, context):
+    if 'csrf_token' in context:
+        return value(context['csrf_token'])
+    if request is None:
+        return ''
+    return value(csrf(request)['csrf_token'])
+
+
+@native_renderer('iommi/table/table.html')
+def render_table(request, context):
+    return value(context['table'].outer) + '\n'
+
+
+@native_renderer('iommi/table/header.html')
+def render_header(request, context):
+    header = context['header']
+    url = header.url
+    return ''.join([
+        '<th', value(header.attrs), '>\n    ',
+        f'\n        <a href="{value(url)}">\n    ' if url else '',
+        '\n    ', value(header.display_name), '\n    ',
+        '\n        </a>\n    ' if url else '',
+        '\n</th>\n',
+    ])
+
+
+@native_renderer('iommi/table/select_column_header.html')
+def render_select_column_header(request, context):
+    header = context['header']
+    icon = lookup(header.column, 'extra', 'icon', default='')
+    return ''.join([
+        '<th', value(header.attrs), '>\n',
+        '    <i class="', value(icon), '"\n',
+        '       onclick="iommi_table_js_select_all(this, ',
+        'true' if lookup(header.table, 'parts', 'page', 'is_paginated') else 'false',
+        ')"></i>\n',
+        '</th>\n',
+    ])
+
+
+@native_renderer('iommi/table/row_group.html')
+def render_row_group(request, context):
+    row_group = context['row_group']
+    return ''.join([
+        '<tr>\n    ', value(row_group.iommi_open_tag()),
+        '\n        ', value(context.get('value', '')),
+        '\n    ', value(row_group.iommi_close_tag()),
+        '\n</tr>\n',
+    ])
+
+
+@native_renderer('iommi/table/table_tag.html')
+def render_table_tag(request, context):
+    table = context['table']
+    if not lookup(table, 'query', 'form', 'is_valid') and table.invalid_form_message:
+        result = ['\n    ', value(table.invalid_form_message), '\n']
+    elif not lookup(table, 'paginator', 'count') and table.empty_message is not None:
+        result = ['\n    ', value(table.empty_message), '\n']
+    else:
+        result = [
+            '\n\n    <div class="iommi-table-plus-paginator">\n        ',
+            value(table.table_tag_wrapper.iommi_open_tag()), '\n        ',
+            value(table.iommi_open_tag()), '\n\n            ',
+            value(table.header), '\n\n            ',
+            value(table.tbody), '\n\n        ',
+            value(table.iommi_close_tag()), '\n        ',
+            value(table.table_tag_wrapper.iommi_close_tag()), '\n\n        ',
+            value(table.paginator), '\n    </div>\n\n',
+        ]
+    result.append('\n')
+    return ''.join(result)
+
+
+@native_renderer('iommi/table/table_container.html')
+def render_table_container(request, context):
+    table = context['table']
+    bulk = table.bulk
+    result = []
+    if bulk:
+        result += [
+            '\n', value(bulk.iommi_open_tag()),
+            '<input type="hidden" name="csrfmiddlewaretoken" value="', csrf_token(request, context), '"/>\n',
+        ]
+    result += ['\n    \n\n    ', render_native_or_template(request, 'iommi/table/table_tag.html', context), '\n\n    \n\n    ']
+    if bulk:
+        result += [
+            '\n        ', value(table.bulk_container.iommi_open_tag()),
+            '\n\n        ', value(bulk.h_tag),
+            '\n        ', value(bulk.errors),
+            '\n        ', value(bulk.render_fields),
+            '\n        ', value(bulk.render_actions),
+            '\n\n        ', value(table.bulk_container.iommi_close_tag()),
+            '\n    ',
+        ]
+    result.append('\n\n     \n\n')
+    if bulk:
+        result += ['\n', value(bulk.iommi_close_tag()), '\n']
+    result.append('\n')
+    return ''.join(result)
+
+
+def _render_paginator_items(context, item_tag, active_item_tag, active_link_attrs=True):
+    """
+    The items of `paginator.html`, which are the same for all styles apart
+    from the tags, and if the link of the active item has its own attrs.
+    """
+    paginator = context['paginator']
+    extra = value(conditional_escape(context['extra']))
+    path = value(paginator.iommi_path)
+    item_attrs = value(paginator.item.attrs)
+    link_attrs = value(paginator.link.attrs)
+    page = context['page']
+
+    def item(page_number, label, text):
+        return ''.join([
+            '\n            <', item_tag, item_attrs, '>\n                ',
+            f'<a href="?{extra}{path}={page_number}" aria-label="{label}"{link_attrs}>{text}</a>',
+            '\n            </', item_tag, '>\n        ',
+        ])
+
+    result = []
+    if context['show_first']:
+        result.append(item('1', 'First Page', '&laquo;'))
+    result.append('\n\n        ')
+    if context['has_previous']:
+        result.append(item(stringformat(context['previous']), 'Previous Page', '&lt;'))
+    result.append('\n\n        ')
+
+    active_item_attrs = value(paginator.active_item.attrs)
+    active_link_attrs = value(paginator.active_link.attrs) if active_link_attrs else link_attrs
+    for num in context['page_numbers']:
+        is_active = num == page
+        result += [
+            '\n            <', active_item_tag, active_item_attrs if is_active else item_attrs, '>\n                ',
+            f'<a href="?{extra}{path}={stringformat(num)}" aria-label="Page {value(num)}"',
+            active_link_attrs if is_active else link_attrs, '>', value(num), '</a>',
+            '\n            </', active_item_tag, '>\n        ',
+        ]
+    result.append('\n\n        ')
+
+    if context['has_next']:
+        result.append(item(stringformat(context['next']), 'Next Page', '&gt;'))
+    result.append('\n\n        ')
+    if context['show_last']:
+        result.append(item(stringformat(context['pages']), 'Last Page', '&raquo;'))
+    return ''.join(result)
+
+
+@native_renderer('iommi/table/paginator.html')
+def render_paginator(request, context):
+    paginator = context['paginator']
+    container_tag = value(paginator.container.tag)
+    return ''.join([
+        value(paginator.iommi_open_tag()),
+        '\n    <', container_tag, value(paginator.container.attrs), '>\n        ',
+        _render_paginator_items(context, item_tag=value(paginator.item.tag), active_item_tag=value(paginator.active_item.tag)),
+        '\n    </', container_tag, '>\n',
+        value(paginator.iommi_close_tag()), '\n',
+    ])
+
+
+@native_renderer('iommi/table/bootstrap/paginator.html')
+def render_bootstrap_paginator(request, context):
+    paginator = context['paginator']
+    return ''.join([
+        '<nav aria-label="Pages"', value(paginator.attrs), '>\n',
+        '    <ul', value(paginator.container.attrs), '>\n        ',
+        _render_paginator_items(context, item_tag='li', active_item_tag='li', active_link_attrs=False),
+        '\n    </ul>\n</nav>\n\n',
+    ])
+
+
+@native_renderer('iommi/form/form.html')
+def render_form(request, context):
+    form = context['form']
+    result = [value(form.iommi_open_tag())]
+    if not form.is_nested_form and lookup(form.attrs, 'method') == 'post':
+        result += ['<input type="hidden" name="csrfmiddlewaretoken" value="', csrf_token(request, context), '"/>']
+    result += [
+        '\n\n    ', value(form.h_tag),
+        '\n\n    \n\n    ', value(form.errors),
+        '\n    ', value(form.render_fields),
+        '\n\n    \n\n    ', value(form.render_actions),
+        '\n\n    \n\n', value(form.iommi_close_tag()), '\n',
+    ]
+    return ''.join(result)
+
+
+@native_renderer('iommi/form/actions.html')
+def render_actions(request, context):
+    non_grouped_actions = context['non_grouped_actions']
+    grouped_actions = context['grouped_actions']
+    if not (non_grouped_actions or grouped_actions):
+        return '\n'
+
+    actions = context['actions']
+    result = ['\n    ', value(actions.iommi_open_tag()), '\n        ']
+    for category, category_id, actions_in_group in grouped_actions:
+        result += [
+            '\n            <div class="btn-group">\n',
+            '                <button id="id_dropdown_', value(category_id), '" role="button" data-toggle="dropdown" data-target="#" href="/page.html" class="btn btn-primary dropdown-toggle" type="button">\n',
+            '                    ', value(category), '\n',
+            '                </button>\n\n',
+            '                <div class="dropdown-menu" role="menu" aria-labelledby="id_dropdown_', value(category), '">\n                    ',
+        ]
+        for action in actions_in_group:
+            result += ['\n                        ', value(action), '\n                    ']
+        result.append('\n                </div>\n            </div>\n        ')
+    result.append('\n\n        ')
+    for action in non_grouped_actions:
+        result += ['\n            ', value(action), '\n        ']
+    result += ['\n    ', value(actions.iommi_close_tag()), '\n\n']
+    return ''.join(result)
+
+
+def _render_choice_input(field, input_type):
+    result = []
+    attrs = value(field.attrs)
+    input_attrs = value(field.input.attrs)
+    id = value(lookup(field, 'extra_evaluated', 'id', default=''))
+    for choice in field.choice_tuples:
+        choice_id = f'{id}_{value(choice[4])}'
+        result += [
+            '\n    <div', attrs, '>\n',
+            f'        <input type="{input_type}" value="', stringformat(choice[1]), f'" id="{choice_id}" ', input_attrs, ' ', 'checked' if choice[3] else '', '/>\n',
+            f'        <label for="{choice_id}">', value(choice[2]), '</label>\n',
+            '    </div>\n',
+        ]
+    result.append('\n')
+    return ''.join(result)
+
+
+@native_renderer('iommi/form/radio.html')
+def render_radio(request, context):
+    return _render_choice_input(context['field'], 'radio')
+
+
+@native_renderer('iommi/form/checkboxes.html')
+def render_checkboxes(request, context):
+    return _render_choice_input(context['field'], 'checkbox')
+
+
+@native_renderer('iommi/form/choice.html')
+def render_choice(request, context):
+    field = context['field']
+    result = ['<select', value(field.input.attrs), '>\n    ']
+    for optgroup, choice_tuples in field.grouped_choice_tuples:
+        result.append('\n        ')
+        if optgroup:
+            result += ['\n            <optgroup label="', value(optgroup), '">\n        ']
+        result.append('\n            ')
+        for choice in choice_tuples:
+            result += [
+                '\n                <option value="', stringformat(choice[1]), '" ',
+                'selected="selected"' if choice[3] else '', '>', value(choice[2]), '</option>\n            ',
+            ]
+        result.append('\n        ')
+        if optgroup:
+            result.append('\n            </optgroup>\n        ')
+        result.append('\n    ')
+    result.append('\n</select>\n')
+    return ''.join(result)
+
+
+@native_renderer('iommi/main_menu/menu_items.html')
+def render_menu_items(request, context):
+    result = []
+    for item in context['items']:
+        result += ['\n    ', value(item), '\n']
+    result.append('\n')
+    return ''.join(result)
+
+
+@native_renderer('iommi/main_menu/menu_item.html')
+def render_menu_item(request, context):
+    item = context['item']
+    if not item.include:
+        return '\n'
+
+    result = ['\n    ', value(item.iommi_open_tag()), '\n        ']
+    if item.has_rendered_items:
+        result += [
+            '\n            ', value(item.iommi_open_details_tag()),
+            '\n                <summary>\n                    <div class="menu_open_close"></div>\n                    ',
+            value(item.link),
+            '\n                </summary>\n                <ul>\n                    ',
+            render_native_or_template(request, 'iommi/main_menu/menu_items.html', {**context, 'items': lookup(item, 'items', 'values')}),
+            '\n                </ul>\n            ',
+            value(item.iommi_close_details_tag()),
+            '\n        ',
+        ]
+    else:
+        result += ['\n            ', value(item.link), '\n        ']
+    result += ['\n    ', value(item.iommi_close_tag()), '\n\n']
+    return ''.join(result)
@@ -0,0 +1,177 @@
+import re
+
+import pytest
+
+from docs.models import (
+    Album,
+    Artist,
+    Genre,
+)
+from iommi import (
+    Action,
+    Column,
+    Field,
+    Form,
+    Table,
+)
+from iommi.main_menu import (
+    M,
+    MainMenu,
+)
+from iommi.native_templates import (
+    get_native_renderer,
+    is_unmodified_builtin_template,
+)
+from iommi.struct import Struct
+from tests.helpers import (
+    req,
+    staff_req,
+)
+
+
+def fake_view():
+    pass  # pragma: no cover
+
+
+def render(part, request):
+    html = str(part.bind(request=request).__html__())
+    # The csrf token is different for each render
+    return re.sub('name="csrfmiddlewaretoken" value="[^"]*"', '', html)
+
+
+def assert_same_as_templates(settings, part, request, template_names):
+    for template_name in template_names:
+        assert get_native_renderer(request, template_name) is not None
+
+    native = render(part, request)
+    settings.IOMMI_NATIVE_TEMPLATES = False
+    assert render(part, request) == native
+    settings.IOMMI_NATIVE_TEMPLATES = True
+
+
+@pytest.fixture
+def albums():
+    artist = Artist.objects.create(name='Black Sabbath')
+    for i in range(30):
+        Album.objects.create(name=f'<Album> {i}', artist=artist, year=1980 + i // 10)
+    Genre.objects.create(name='Heavy Metal')
+    Genre.objects.create(name='Doom')
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize(
+    'iommi_style, paginator_template',
+    [
+        ('bootstrap', 'iommi/table/bootstrap/paginator.html'),
+        ('base', 'iommi/table/paginator.html'),
+    ],
+)
+def test_table(settings, albums, iommi_style, paginator_template):
+    table = Table(
+        auto__model=Album,
+        columns__select__include=True,
+        columns__name__bulk__include=True,
+        columns__year__row_group__include=True,
+        bulk__actions__foo=Action.button(group='Things'),
+        page_size=2,
+        iommi_style=iommi_style,
+    )
+    assert_same_as_templates(
+        settings,
+        table,
+        req('get', page='7', foo='<bar>'),
+        [
+            'iommi/table/table.html',
+            'iommi/table/table_container.html',
+            'iommi/table/table_tag.html',
+            'iommi/table/header.html',
+            'iommi/table/select_column_header.html',
+            'iommi/table/row_group.html',
+            'iommi/form/actions.html',
+            paginator_template,
+        ],
+    )
+
+
+@pytest.mark.django_db
+def test_table_messages(settings):
+    def table():
+        return Table(
+            auto__model=Album,
+            columns__year__filter__include=True,
+            empty_message='No <albums>',
+            invalid_form_message='Invalid <query>',
+        )
+
+    assert_same_as_templates(settings, table(), req('get'), ['iommi/table/table_tag.html'])
+    assert 'No &lt;albums&gt;' in render(table(), req('get'))
+
+    assert_same_as_templates(settings, table(), req('get', year='not a year'), ['iommi/table/table_tag.html'])
+    assert 'Invalid &lt;query&gt;' in render(table(), req('get', year='not a year'))
+
+
+@pytest.mark.django_db
+def test_form(settings, albums):
+    form = Form(
+        fields=dict(
+            genre=Field.choice_queryset(choices=Genre.objects.all()),
+            grouped=Field.choice(
+                choices=['a', 'b', '<c>'],
+                choice_to_optgroup=lambda choice, **_: 'Group <1>' if choice == 'a' else 'Group 2',
+            ),
+            radio=Field.radio(choices=['a', 'b'], initial='b'),
+            checkboxes=Field.checkboxes(choices=['a', 'b'], initial=['a']),
+        ),
+        actions__grouped=Action.button(group='Things'),
+        attrs__method='post',
+    )
+    assert_same_as_templates(
+        settings,
+        form,
+        req('get'),
+        [
+            'iommi/form/form.html',
+            'iommi/form/actions.html',
+            'iommi/form/choice.html',
+            'iommi/form/radio.html',
+            'iommi/form/checkboxes.html',
+        ],
+    )
+
+
+def test_main_menu(settings):
+    menu = MainMenu(
+        items=dict(
+            foo=M(
+                view=fake_view,
+                items=dict(
+                    bar=M(view=fake_view, open=True),
+                    hidden=M(view=fake_view, include=False),
+                ),
+            ),
+            baz=M(view=fake_view),
+        ),
+    )
+    request = staff_req('get', url='/foo/bar/')
+    assert get_native_renderer(request, 'iommi/main_menu/menu_item.html') is not None
+    native = str(menu.bind(request=request))
+    settings.IOMMI_NATIVE_TEMPLATES = False
+    assert str(menu.bind(request=request)) == native
+    assert get_native_renderer(request, 'iommi/main_menu/menu_item.html') is None
+
+
+def test_overridden_template_uses_the_template_engine(settings, tmp_path):
+    assert is_unmodified_builtin_template('iommi/table/header.html')
+
+    (tmp_path / 'iommi' / 'table').mkdir(parents=True)
+    (tmp_path / 'iommi' / 'table' / 'header.html').write_text('<th>overridden</th>')
+    settings.TEMPLATES = [{**settings.TEMPLATES[0], 'DIRS': [str(tmp_path)]}]
+
+    assert not is_unmodified_builtin_template('iommi/table/header.html')
+    table = Table(columns__a=Column(), rows=[Struct(a=1)])
+    assert '<th>overridden</th>' in table.bind(request=req('get')).__html__()
+
+
+def test_code_finder_uses_the_template_engine():
+    assert get_native_renderer(req('get'), 'iommi/table/header.html') is not None
+    assert get_native_renderer(req('get', _iommi_code_finder=''), 'iommi/table/header.html') is None
@@ -1,3 +1,4 @@
+from asgiref.sync import sync_to_async
 
 from iommi._web_compat import (
     format_html,
@@ -6,9 +7,12 @@
 from iommi.base import (
     NOT_BOUND_MESSAGE,
     build_as_view_wrapper,
+    build_async_as_view_wrapper,
     items,
     values,
 )
+from iommi.concurrent_prefetch import prefetch_in_threads
+from iommi.conditional_get import add_part_validators
 from iommi.declarative import declarative
 from iommi.declarative.dispatch import dispatch
 from iommi.declarative.namespace import (
@@ -24,6 +28,7 @@
     Header,
     build_and_bind_h_tag,
 )
+from iommi.fragment_cache import is_fragment_cache_hit
 from iommi.member import (
     bind_members,
     refine_done_members,
@@ -62,12 +67,16 @@ class Page(Part):
     context = SpecialEvaluatedRefinable()
     h_tag: Fragment | str = SpecialEvaluatedRefinable()
     parts: dict[str, PartType] = RefinableMembers()
+    concurrent: Namespace | bool | None = Refinable()
+
+    _iommi_prefetch_done = False
 
     class Meta:
         member_class = Fragment
 
         parts = EMPTY
         context = EMPTY
+        concurrent = None
 
     @with_defaults(
         h_tag__call_target=Header,
@@ -108,9 +117,50 @@ def on_bind(self) -> None:
     def own_evaluate_parameters(self):
         return dict(page=self)
 
+    def add_conditional_get_validators(self, validators):
+        super(Page, self).add_conditional_get_validators(validators)
+        for part in values(self.parts):
+            if isinstance(part, Part):
+                add_part_validators(part, validators)
+
+    def iommi_prefetches(self):
+        # The bind was skipped on a cache hit, and nothing is rendered
+        if is_fragment_cache_hit(self):
+            return []
+        result = list(super(Page, self).iommi_prefetches())
+        for part in values(self.parts):
+            if isinstance(part, Part):
+                result.extend(part.iommi_prefetches())
+        return result
+
+    def iommi_async_prefetches(self):
+        if is_fragment_cache_hit(self):
+            return []
+        if self.concurrent:
+            # The async ORM runs all queries in the same thread, use a thread pool instead
+            return [sync_to_async(self._prefetch_in_threads, thread_sensitive=False)]
+
+        result = list(super(Page, self).iommi_async_prefetches())
+        for part in values(self.parts):
+            if isinstance(part, Part):
+                result.extend(part.iommi_async_prefetches())
+        return result
+
+    def _prefetch_in_threads(self):
+        """
+        Fetch the data of all parts concurrently in a thread pool. This is
+        done before rendering for pages with `concurrent` configured.
+        """
+        if self._iommi_prefetch_done:
+            return
+        self._iommi_prefetch_done = True
+        prefetch_in_threads(self)
+
     @dispatch(render=lambda rendered: format_html('{}' * len(rendered), *values(rendered)))
     def __html__(self, *, render=None):
         assert self._is_bound, NOT_BOUND_MESSAGE
+        if self.concurrent:
+            self._prefetch_in_threads()
         self.context = evaluate_as_needed(self.context or {}, self.iommi_evaluate_parameters())
         request = self.get_request()
         context = {**self.get_context(), **self.iommi_evaluate_parameters()}
@@ -128,3 +178,6 @@ def __html__(self, *, render=None):
 
     def as_view(self):
         return build_as_view_wrapper(self)
+
+    def as_async_view(self):
+        return build_async_as_view_wrapper(self)
@@ -0,0 +1,111 @@
+import multiprocessing
+import threading
+from concurrent.futures import ProcessPoolExecutor
+
+from django.db import connections
+from django.db.models import QuerySet
+
+from iommi.concurrent_prefetch import in_atomic_block
+
+# Fewer rows than this per process isn't worth starting the processes for
+MIN_ROWS_PER_PROCESS = 10000
+
+# Set in the worker processes by _init_worker
+_rows = None
+_format_rows = None
+
+
+def _init_worker(rows, format_rows):
+    global _rows, _format_rows
+    _rows = rows
+    _format_rows = format_rows
+
+
+def _format_pk_range(start_index, start, stop):
+    rows = _rows.order_by('pk')
+    if start is not None:
+        rows = rows.filter(pk__gte=start)
+    if stop is not None:
+        rows = rows.filter(pk__lt=stop)
+    try:
+        return _format_rows(rows, start_index)
+    finally:
+        connections.close_all()
+
+
+def is_ordered_by_pk(rows):
+    query = rows.query
+    if query.order_by:
+        order_by = query.order_by
+    elif query.default_ordering:
+        order_by = rows.model._meta.ordering
+    else:
+        order_by = []
+    pk = rows.model._meta.pk
+    return list(order_by) in ([], ['pk'], [pk.name], [pk.attname])
+
+
+def can_format_in_processes(rows):
+    """
+    Rows can be split in pk ranges if they are a `QuerySet` in pk order (or
+    without an order). The worker processes are forked, and use their own
+    database connections, so this isn't done inside a transaction, where
+    closing the connections would lose it. Forking a process with more
+    than one thread can deadlock on locks held by the other threads, so
+    this is also only done in a single threaded process (like a sync
+    worker of gunicorn, but not runserver or a threaded or ASGI server).
+    """
+    return (
+        isinstance(rows, QuerySet)
+        and not rows.query.is_sliced
+        and is_ordered_by_pk(rows)
+        and 'fork' in multiprocessing.get_all_start_methods()
+        and threading.active_count() == 1
+        and not in_atomic_block()
+    )
+
+
+def pk_range_boundaries(rows, processes):
+    """
+    The pks that split `rows` in about equally large pk ranges, one for each
+    process, as `(index, pk)` pairs where `index` is the number of rows
+    before `pk`. An empty list if there are too few rows.
+    """
+    pks = rows.order_by('pk').values_list('pk', flat=True)
+    count = pks.count()
+    processes = min(processes, count // MIN_ROWS_PER_PROCESS)
+    if processes < 2:
+        return []
+    indexes = {count * i // processes for i in range(1, processes)}
+    # One pass over the pks, instead of an OFFSET query for each boundary
+    return [(index, pk) for index, pk in enumerate(pks.iterator()) if index in indexes]
+
+
+def format_in_processes(rows, format_rows, processes):
+    """
+    Format the rows of a `QuerySet` in worker processes, each with its own
+    database connection and a range of pks. `format_rows` gets a `QuerySet`
+    and the index of its first row in `rows`, and returns a string. The
+    strings are yielded in order, so joined they are what
+    `format_rows(rows.order_by('pk'), 0)` would return.
+    """
+    boundaries = pk_range_boundaries(rows, processes)
+    if not boundaries:
+        yield format_rows(rows, 0)
+        return
+
+    indexes = [index for index, _ in boundaries]
+    pks = [pk for _, pk in boundaries]
+    ranges = list(zip([0, *indexes], [None, *pks], [*pks, None]))
+
+    # The workers are forked, so they get the rows and format_rows without
+    # pickling them. They must not share the database connections of this
+    # process, so these are closed, and opened again when needed.
+    connections.close_all()
+    with ProcessPoolExecutor(
+        max_workers=len(ranges),
+        mp_context=multiprocessing.get_context('fork'),
+        initializer=_init_worker,
+        initargs=(rows, format_rows),
+    ) as executor:
+        yield from executor.map(_format_pk_range, *zip(*ranges))
@@ -0,0 +1,96 @@
+import os
+
+import pytest
+from django.db import transaction
+
+from iommi import (
+    Column,
+    Table,
+)
+from iommi.parallel_export import (
+    can_format_in_processes,
+    format_in_processes,
+    pk_range_boundaries,
+)
+from tests.helpers import req
+from tests.models import (
+    CSVExportTestModel,
+    TFoo,
+)
+
+
+@pytest.fixture
+def rows(monkeypatch):
+    monkeypatch.setattr('iommi.parallel_export.MIN_ROWS_PER_PROCESS', 3)
+    # The test runner can have other threads, which are not forked
+    monkeypatch.setattr('iommi.parallel_export.threading.active_count', lambda: 1)
+    CSVExportTestModel.objects.bulk_create([
+        CSVExportTestModel(a=i, b=f'b{i}', c=i / 4, danger='=1+1' if i % 2 else 'safe')
+        for i in range(10)
+    ])
+
+
+def format_pids(queryset, start_index):
+    return ','.join(f'{row.a}:{os.getpid()}' for row in queryset) + ';'
+
+
+@pytest.mark.django_db(transaction=True)
+def test_format_in_processes(rows, django_assert_num_queries):
+    queryset = CSVExportTestModel.objects.all()
+    pks = list(queryset.order_by('pk').values_list('pk', flat=True))
+    # The count and one pass over the pks
+    with django_assert_num_queries(2):
+        assert pk_range_boundaries(queryset, processes=3) == [(3, pks[3]), (6, pks[6])]
+
+    chunks = list(format_in_processes(queryset, format_pids, processes=3))
+    assert len(chunks) == 3
+    assert [pair.split(':')[0] for chunk in chunks for pair in chunk.rstrip(';').split(',')] == [str(i) for i in range(10)]
+    pids = {pair.split(':')[1] for chunk in chunks for pair in chunk.rstrip(';').split(',')}
+    assert len(pids) == 3
+    assert str(os.getpid()) not in pids
+
+
+@pytest.mark.django_db(transaction=True)
+def test_format_in_processes_too_few_rows(rows):
+    queryset = CSVExportTestModel.objects.filter(a__lt=5)
+    assert pk_range_boundaries(queryset, processes=3) == []
+    assert list(format_in_processes(queryset, format_pids, processes=3)) == [format_pids(queryset, 0)]
+
+
+@pytest.mark.django_db(transaction=True)
+def test_can_format_in_processes(monkeypatch):
+    monkeypatch.setattr('iommi.parallel_export.threading.active_count', lambda: 1)
+    assert can_format_in_processes(TFoo.objects.all())
+    assert can_format_in_processes(TFoo.objects.order_by('pk'))
+    assert not can_format_in_processes(TFoo.objects.order_by('a'))
+    assert not can_format_in_processes(TFoo.objects.all()[:10])
+    assert not can_format_in_processes([TFoo()])
+    with transaction.atomic():
+        assert not can_format_in_processes(TFoo.objects.all())
+
+    # Forking with other threads running can deadlock
+    monkeypatch.setattr('iommi.parallel_export.threading.active_count', lambda: 2)
+    assert not can_format_in_processes(TFoo.objects.all())
+
+
+def export(endpoint, **kwargs):
+    table = Table(
+        auto__model=CSVExportTestModel,
+        columns__row_index=Column(cell__value=lambda cells, **_: cells.row_index),
+        endpoints__ndjson__include=True,
+        page_size=None,
+        extra__report_columns_all=True,
+        extra_evaluated__report_name='foo',
+        **kwargs,
+    ).bind(request=req('get', **{endpoint: ''}))
+    return b''.join(table.render_to_response().streaming_content)
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.parametrize('endpoint', ['/csv', '/ndjson'])
+def test_export_in_processes_is_the_same(rows, endpoint):
+    expected = export(endpoint)
+    assert export(endpoint, extra__report_processes=3) == expected
+    assert expected.count(b'\n') >= 10
+    # The row_index of the last row, which continues over the ranges of the processes
+    assert expected.splitlines()[-1].rstrip(b'}').endswith(b'9')
@@ -3,9 +3,13 @@
 from abc import abstractmethod
 from typing import Any
 
+from asgiref.sync import (
+    async_to_sync,
+    sync_to_async,
+)
 from django.conf import settings
 from django.core.serializers.json import DjangoJSONEncoder
-from django.http import HttpResponse, QueryDict
+from django.http import HttpResponse, QueryDict, StreamingHttpResponse
 from django.http.response import HttpResponseBase
 from django.template import engines
 from django.template.utils import InvalidTemplateEngineError
@@ -14,11 +18,20 @@
     Template,
     render_template,
 )
+from iommi.async_render import (
+    aprefetch,
+    awaited,
+)
 from iommi.base import (
     MISSING,
     NOT_BOUND_MESSAGE,
     items,
 )
+from iommi.conditional_get import (
+    add_configured_validators,
+    conditional_get_validators,
+    not_modified_response,
+)
 from iommi.debug import (
     get_instantiated_at_info,
     iommi_debug_panel_on,
@@ -32,14 +45,23 @@
     DISPATCH_PATH_SEPARATOR,
     Endpoint,
     InvalidEndpointPathException,
+    find_target,
     perform_ajax_dispatch,
     perform_post_dispatch,
 )
+from iommi.fragment_cache import (
+    cached_html,
+    connect_model_signals,
+    get_fragment_cache_config,
+    record_assets,
+    setup_fragment_cache,
+)
 from iommi.member import (
     bind_members,
     refine_done_members,
 )
 from iommi.shortcut import with_defaults
+from iommi.streaming import streaming_content
 from iommi.style import get_style_object
 from iommi.traversable import Traversable
 
@@ -69,9 +91,17 @@ class Part(Traversable):
     endpoints: Namespace = RefinableMembers()
     # Only the assets used by this part
     assets: Namespace = RefinableMembers()
+    cache: Namespace | bool | None = Refinable()
+    conditional_get: Namespace | bool | None = Refinable()
+
+    _iommi_fragment_cache = None
+    _iommi_fragment_cache_recorders = None
+    _iommi_deferred_html = None
 
     class Meta:
         extra = EMPTY
+        cache = None
+        conditional_get = None
 
     @with_defaults(
         include=True,
@@ -88,8 +118,16 @@ def on_refine_done(self):
 
         refine_done_members(self, name='endpoints', members_from_namespace=self.endpoints, cls=Endpoint)
         refine_done_members(self, name='assets', members_from_namespace=self.assets, cls=Asset)
+        if self.cache:
+            connect_model_signals(get_fragment_cache_config(self).get('models') or [])
         super().on_refine_done()
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        html = cls.__dict__.get('__html__')
+        if html is not None and not getattr(html, '_iommi_cached_html', False):
+            cls.__html__ = cached_html(html)
+
     @dispatch(
         render=EMPTY,
     )
@@ -108,25 +146,30 @@ def bind(self, *, parent=None, request=None):
         del self
         bind_members(result, name='endpoints')
         bind_members(result, name='assets', lazy=False)
-        result.iommi_root()._iommi_collected_assets.update(result.assets)
+        root = result.iommi_root()
+        root._iommi_collected_assets.update(result.assets)
+        if root._iommi_fragment_cache_recorders:
+            record_assets(result)
+        if result._iommi_fragment_cache is not None:
+            root._iommi_collected_assets.update(result._iommi_fragment_cache.assets)
 
         return result
 
-    @dispatch
-    def perform_dispatch(self, **kwargs):
+    def _bind_from_cache(self):
+        if not self.cache or not setup_fragment_cache(self):
+            return False
+        if hasattr(self, 'title'):
+            self.title = self._iommi_fragment_cache.title
+        return True
+
+    def _dispatch_command(self):
+        """
+        Returns `(dispatcher, path, value, dispatch_error)` for the dispatch
+        command in the request, or `None` for a plain GET.
+        """
         request = self.get_request()
         req_data = request_data(request)
 
-        def dispatch_response_handler(r):
-            if isinstance(r, HttpResponseBase):
-                return r
-            elif isinstance(r, Part):
-                if not r._is_bound:
-                    r = r.bind(request=request)
-                return HttpResponse(render_root(part=r, **kwargs))
-            else:
-                return HttpResponse(json.dumps(r, cls=DjangoJSONEncoder), content_type='application/json')
-
         # allowing endpoint requests via POST too
         ajax_dispatch_commands = {
             **{key: value for key, value in items(request.GET) if key.startswith(DISPATCH_PATH_SEPARATOR)},
@@ -153,33 +196,141 @@ def dispatch_response_handler(r):
             assert False  # This has already been checked in request_data()
 
         assert len(dispatch_commands) in (0, 1), 'You can only have one or no dispatch commands'
-        if dispatch_commands:
-            dispatch_target, value = next(iter(dispatch_commands.items()))
-            try:
-                result = dispatcher(root=self, path=dispatch_target, value=value)
-            except InvalidEndpointPathException:
-                if settings.DEBUG:
-                    raise
-                result = dict(error=dispatch_error)
-
-            if result is not None:
-                return dispatch_response_handler(result)
-        else:
+        if not dispatch_commands:
             if request.method == 'POST':
                 assert False, 'This request was a POST, but there was no dispatch command present.'
+            return None
 
-        return None
+        dispatch_target, value = next(iter(dispatch_commands.items()))
+        return dispatcher, dispatch_target, value, dispatch_error
+
+    def _perform_dispatch_command(self, dispatcher, path, value, dispatch_error):
+        # For async endpoints this returns an awaitable
+        try:
+            return dispatcher(root=self, path=path, value=value)
+        except InvalidEndpointPathException:
+            if settings.DEBUG:
+                raise
+            return dict(error=dispatch_error)
+
+    def _is_async_dispatch_command(self, dispatcher, path, value, dispatch_error):
+        if dispatcher is not perform_ajax_dispatch:
+            return False
+        try:
+            target = find_target(path=path, root=self)
+        except InvalidEndpointPathException:
+            return False
+        return inspect.iscoroutinefunction(getattr(target, 'func', None))
+
+    def _dispatch_response(self, r, **kwargs):
+        if isinstance(r, HttpResponseBase):
+            return r
+        elif isinstance(r, Part):
+            if not r._is_bound:
+                r = r.bind(request=self.get_request())
+            return HttpResponse(render_root(part=r, **kwargs))
+        else:
+            return HttpResponse(json.dumps(r, cls=DjangoJSONEncoder), content_type='application/json')
 
     @dispatch
-    def render_to_response(self, **kwargs):
-        dispatch = self.perform_dispatch(**kwargs)
-        if dispatch is not None:
-            return dispatch
+    def perform_dispatch(self, **kwargs):
+        command = self._dispatch_command()
+        if command is None:
+            return None
 
-        response = HttpResponse(render_root(part=self, **kwargs))
+        result = self._perform_dispatch_command(*command)
+        if inspect.isawaitable(result):
+            result = async_to_sync(awaited)(result)
+        if result is None:
+            return None
+        return self._dispatch_response(result, **kwargs)
+
+    def add_conditional_get_validators(self, validators):
+        add_configured_validators(self, validators)
+
+    def iommi_prefetches(self):
+        """
+        Functions without arguments that fetch the data this part needs for
+        rendering. They are run concurrently by a `Page` with `concurrent`
+        configured.
+        """
+        return []
+
+    def iommi_async_prefetches(self):
+        """
+        Async functions without arguments that fetch the data this part needs
+        for rendering with the async ORM. They are awaited together by
+        `arender_to_response` before the part is rendered.
+        """
+        return []
+
+    def _render_root_response(self, **kwargs):
+        # Parts can defer html (like the rows of a streamed table) to after the rest of the page is sent
+        self._iommi_deferred_html = {}
+        try:
+            html = render_root(part=self, **kwargs)
+        finally:
+            deferred_html = self._iommi_deferred_html
+            self._iommi_deferred_html = None
+
+        if deferred_html:
+            response = StreamingHttpResponse(streaming_content(html, deferred_html))
+        else:
+            response = HttpResponse(html)
         response.iommi_part = self
         return response
 
+    @dispatch
+    def render_to_response(self, **kwargs):
+        validators = conditional_get_validators(self)
+        if validators is not None:
+            not_modified = not_modified_response(self.get_request(), validators)
+            if not_modified is not None:
+                return not_modified
+
+        response = self.perform_dispatch(**kwargs)
+        if response is None:
+            response = self._render_root_response(**kwargs)
+
+        if validators is not None:
+            validators.set_headers(response)
+        return response
+
+    @dispatch
+    async def arender_to_response(self, **kwargs):
+        """
+        Async version of `render_to_response`. The data of the tables and the
+        choices of the forms are fetched with the async ORM in the event
+        loop, and then the page is rendered in a thread, so the rendering can
+        use the sync ORM (like a query in a `cell__format`). Endpoints with an
+        async `func` are awaited.
+        """
+        command = self._dispatch_command()
+        if command is not None and not self._is_async_dispatch_command(*command):
+            return await sync_to_async(self.render_to_response)(**kwargs)
+
+        validators = await sync_to_async(conditional_get_validators)(self)
+        if validators is not None:
+            not_modified = not_modified_response(self.get_request(), validators)
+            if not_modified is not None:
+                return not_modified
+
+        response = None
+        if command is not None:
+            result = self._perform_dispatch_command(*command)
+            if inspect.isawaitable(result):
+                result = await result
+            if result is not None:
+                response = await sync_to_async(self._dispatch_response)(result, **kwargs)
+
+        if response is None:
+            await aprefetch(self)
+            response = await sync_to_async(self._render_root_response)(**kwargs)
+
+        if validators is not None:
+            validators.set_headers(response)
+        return response
+
     def iommi_collected_assets(self):
         main_menu = getattr(self.get_request(), 'iommi_main_menu', None)
         menu_assets = main_menu.assets if main_menu else {}
@@ -0,0 +1,277 @@
+import functools
+import tracemalloc
+from contextlib import (
+    ExitStack,
+    contextmanager,
+)
+from time import perf_counter
+
+from django.conf import settings
+
+from iommi._web_compat import format_html
+from iommi.struct import Struct
+
+
+def should_time_parts(request):
+    is_staff = hasattr(request, 'user') and request.user.is_staff
+    return '_iommi_timing' in request.GET and (settings.DEBUG or is_staff)
+
+
+def part_timings_for_request(request):
+    return getattr(request, 'iommi_part_timings', None)
+
+
+@contextmanager
+def part_timing_paused(request):
+    timings = part_timings_for_request(request)
+    if timings is None:
+        yield
+        return
+
+    del request.iommi_part_timings
+    try:
+        yield
+    finally:
+        request.iommi_part_timings = timings
+
+
+class PartTimings:
+    """
+    Collects wall time, SQL count and SQL time per part for one request,
+    aggregated on the dunder path of the part. The `kind` of a measurement
+    is one of `bind`, `render`, `rows` or `validate`.
+
+    All numbers are inclusive: the bind time of a table includes the bind
+    time of its columns.
+
+    With `track_memory` the growth of the memory traced by `tracemalloc` is
+    collected too. This is only meaningful when `tracemalloc` is tracing.
+    """
+
+    def __init__(self, track_memory=False):
+        self.stats = {}
+        self.sql_count = 0
+        self.sql_time = 0.0
+        self.track_memory = track_memory
+        self._active = set()
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.sql_count += 1
+            self.sql_time += perf_counter() - start
+
+    @contextmanager
+    def sql_wrapped(self):
+        from django.db import connections
+
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self.execute_wrapper))
+            yield
+
+    def start(self):
+        memory = tracemalloc.get_traced_memory()[0] if self.track_memory else 0
+        return perf_counter(), self.sql_count, self.sql_time, memory
+
+    def stop(self, part, kind, start):
+        time, sql_count, sql_time, memory = start
+        path = _part_path(part)
+        stat = self.stats.get((path, kind))
+        if stat is None:
+            stat = self.stats[(path, kind)] = Struct(
+                path=path,
+                kind=kind,
+                type_name=type(part).__name__,
+                count=0,
+                time=0.0,
+                sql_count=0,
+                sql_time=0.0,
+                memory=0,
+            )
+        stat.count += 1
+        stat.time += perf_counter() - time
+        stat.sql_count += self.sql_count - sql_count
+        stat.sql_time += self.sql_time - sql_time
+        if self.track_memory:
+            stat.memory += tracemalloc.get_traced_memory()[0] - memory
+
+    @contextmanager
+    def section(self, part, kind):
+        key = (id(part), kind)
+        if key in self._active:
+            # super().__html__() and friends: only count the outermost call
+            yield
+            return
+
+        self._active.add(key)
+        start = self.start()
+        try:
+            yield
+        finally:
+            self._active.discard(key)
+            self.stop(part, kind, start)
+
+    def by_path(self):
+        result = {}
+        for stat in self.stats.values():
+            node = result.get(stat.path)
+            if node is None:
+                node = result[stat.path] = Struct(path=stat.path, type_name=stat.type_name)
+            node[stat.kind] = stat
+        return result
+
+    def tree(self):
+        """
+        Returns the timed parts in tree order, with a `depth` on each node.
+        Parts are recorded when they are done, so children come before their
+        parents in `stats`.
+        """
+        by_path = self.by_path()
+        children = {}
+        roots = []
+        for path in by_path:
+            parent = path.rpartition('__')[0] if path else None
+            while parent and parent not in by_path:
+                parent = parent.rpartition('__')[0]
+            if path and parent in by_path:
+                children.setdefault(parent, []).append(path)
+            else:
+                roots.append(path)
+
+        result = []
+
+        def traverse(path, depth):
+            node = by_path[path]
+            node.depth = depth
+            node.name = path.rpartition('__')[2] if path else 'root'
+            result.append(node)
+            for child in children.get(path, []):
+                traverse(child, depth + 1)
+
+        for root in roots:
+            traverse(root, 0)
+        return result
+
+
+def _part_path(part):
+    from iommi.traversable import build_long_path
+
+    try:
+        return build_long_path(part).replace('/', '__')
+    except AssertionError:
+        return f'<{type(part).__name__}>'
+
+
+def timed(kind):
+    """
+    Decorator for methods of bound parts. When timing is off this costs one
+    attribute lookup.
+    """
+
+    def decorator(f):
+        @functools.wraps(f)
+        def timed_inner(self, *args, **kwargs):
+            timings = self._iommi_part_timings
+            if timings is None:
+                return f(self, *args, **kwargs)
+            with timings.section(self, kind):
+                return f(self, *args, **kwargs)
+
+        timed_inner._iommi_timed = True
+        return timed_inner
+
+    return decorator
+
+
+def timed_generator(kind):
+    """
+    Like `timed`, but for generator methods. Only the work done to produce
+    each item is counted, not the work the consumer does between items.
+    """
+
+    def decorator(f):
+        @functools.wraps(f)
+        def timed_generator_inner(self, *args, **kwargs):
+            timings = self._iommi_part_timings
+            if timings is None:
+                return f(self, *args, **kwargs)
+            return _timed_iter(timings, self, kind, f(self, *args, **kwargs))
+
+        return timed_generator_inner
+
+    return decorator
+
+
+def _timed_iter(timings, part, kind, iterator):
+    while True:
+        start = timings.start()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            timings.stop(part, kind, start)
+            return
+        timings.stop(part, kind, start)
+        yield item
+
+
+def format_ms(seconds):
+    return f'{seconds * 1000:.1f}'
+
+
+def render_timings(timings):
+    def cell(node, kind):
+        stat = node.get(kind)
+        if stat is None:
+            return format_html('<td></td><td></td>')
+        return format_html(
+            '<td>{}</td><td>{}{}</td>',
+            format_ms(stat.time),
+            stat.sql_count,
+            f' ({format_ms(stat.sql_time)})' if stat.sql_count else '',
+        )
+
+    rows = [
+        format_html(
+            '<tr><td style="padding-left: {}em">{}</td><td>{}</td>{}{}{}{}</tr>',
+            node.depth,
+            node.name,
+            node.type_name,
+            cell(node, 'bind'),
+            cell(node, 'render'),
+            cell(node, 'rows'),
+            cell(node, 'validate'),
+        )
+        for node in timings.tree()
+    ]
+
+    # language=HTML
+    return format_html(
+        '''
+            <details class="iommi-part-timing">
+                <summary>Part timing (ms, SQL count (ms))</summary>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Name</th>
+                            <th>Type</th>
+                            <th>Bind</th>
+                            <th>SQL</th>
+                            <th>Render</th>
+                            <th>SQL</th>
+                            <th>Rows</th>
+                            <th>SQL</th>
+                            <th>Validate</th>
+                            <th>SQL</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {}
+                    </tbody>
+                </table>
+            </details>
+        ''',
+        format_html('{}' * len(rows), *rows),
+    )
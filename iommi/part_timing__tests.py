@@ -0,0 +1,140 @@
+import pytest
+
+from iommi import (
+    Field,
+    Form,
+    Page,
+    Table,
+    html,
+)
+from iommi.endpoint import find_target
+from iommi.part_timing import (
+    PartTimings,
+    part_timing_paused,
+    should_time_parts,
+)
+from tests.helpers import (
+    call_view_through_middleware,
+    req,
+    staff_req,
+    user_req,
+)
+from tests.models import TFoo
+
+
+def timed_request(*args, **kwargs):
+    request = req(*args, **kwargs)
+    request.iommi_part_timings = PartTimings()
+    return request
+
+
+def test_should_time_parts(settings):
+    settings.DEBUG = False
+    assert not should_time_parts(req('get'))
+    assert not should_time_parts(req('get', _iommi_timing=''))
+    assert not should_time_parts(user_req('get', _iommi_timing=''))
+    assert should_time_parts(staff_req('get', _iommi_timing=''))
+
+    settings.DEBUG = True
+    assert should_time_parts(req('get', _iommi_timing=''))
+    assert not should_time_parts(req('get'))
+
+
+def test_no_timings_by_default():
+    page = Page(parts__foo=html.div('foo')).bind(request=req('get'))
+    assert page._iommi_part_timings is None
+    assert page.parts.foo._iommi_part_timings is None
+
+
+@pytest.mark.django_db
+def test_timings_for_table():
+    TFoo.objects.create(a=1, b='a')
+    TFoo.objects.create(a=2, b='b')
+
+    request = timed_request('get')
+    timings = request.iommi_part_timings
+    with timings.sql_wrapped():
+        table = Table(auto__model=TFoo).bind(request=request)
+        table.__html__()
+
+    by_path = timings.by_path()
+    assert by_path[''].type_name == 'Table'
+    assert by_path[''].bind.count == 1
+    assert by_path[''].render.count == 1
+    assert by_path['columns__a'].bind.count == 1
+
+    # one Cells bind per row
+    assert by_path['row'].bind.count == 2
+    assert by_path[''].rows.count == 3
+
+    assert by_path[''].bind.sql_count + by_path[''].render.sql_count >= 1
+    assert by_path[''].render.time >= by_path[''].rows.time
+
+    tree = timings.tree()
+    assert tree[0].path == ''
+    assert tree[0].depth == 0
+    columns_a = [x for x in tree if x.path == 'columns__a'][0]
+    assert columns_a.depth == 2
+    assert columns_a.name == 'a'
+
+
+def test_nested_render_is_counted_once():
+    class MyPage(Page):
+        def __html__(self, **kwargs):
+            return super().__html__(**kwargs)
+
+    request = timed_request('get')
+    MyPage(parts__foo=html.div('foo')).bind(request=request).__html__()
+    assert request.iommi_part_timings.by_path()[''].render.count == 1
+
+
+def test_timings_for_form_validate():
+    request = timed_request('post', **{'-submit': '', 'foo': 'bar'})
+    Form(fields__foo=Field()).bind(request=request)
+    assert request.iommi_part_timings.by_path()[''].validate.count == 1
+
+
+def test_part_timing_paused():
+    request = timed_request('get')
+    with part_timing_paused(request):
+        Page().bind(request=request)
+    assert request.iommi_part_timings.stats == {}
+    assert isinstance(request.iommi_part_timings, PartTimings)
+
+
+@pytest.mark.django_db
+def test_middleware_and_debug_panel(settings):
+    settings.DEBUG = True
+    settings.IOMMI_DISABLE_DEBUG_PANEL = False
+    TFoo.objects.create(a=1, b='a')
+
+    def view(request):
+        return Table(auto__model=TFoo)
+
+    request = req('get', _iommi_timing='')
+    response = call_view_through_middleware(view, request)
+    content = response.content.decode()
+
+    assert 'Part timing' in content
+    assert '?/debug_tree&amp;_iommi_timing' in content
+    by_path = request.iommi_part_timings.by_path()
+    assert by_path[''].bind.sql_count + by_path[''].render.sql_count >= 1
+    assert 'DebugMenu' not in {x.type_name for x in by_path.values()}
+
+
+def test_debug_tree_with_timings(settings):
+    settings.IOMMI_DEFAULT_STYLE = 'base'
+    settings.DEBUG = True
+
+    class MyPage(Page):
+        bar = 'bar'
+
+    root = MyPage(assets=None).bind(request=timed_request('get', **{'/debug_tree': '7'}))
+    target = find_target(path='/debug_tree', root=root)
+    result = target.func(value='', **target.iommi_evaluate_parameters())
+
+    assert 'bind_ms' in result.columns
+    rows = {cells.row.dunder_path: cells for cells in result.cells_for_rows()}
+    assert rows['parts__bar']['bind_ms'].value != ''
+    assert rows['parts__bar']['render_ms'].value != ''
+    assert rows['parts__bar']['bind_sql'].value == '0'
@@ -1,15 +1,31 @@
 # Based on https://www.djangosnippets.org/snippets/186/
 
 import cProfile
+import itertools
 import marshal
 import os
 import pstats
+import random
 import subprocess
 import sys
 import threading
+import tracemalloc
+from collections import (
+    OrderedDict,
+    defaultdict,
+)
 from io import StringIO
 from pathlib import Path
-from tempfile import NamedTemporaryFile
+from tempfile import (
+    NamedTemporaryFile,
+    gettempdir,
+)
+from time import monotonic
+from urllib.parse import (
+    quote,
+    unquote,
+    urlencode,
+)
 
 from django.template import (
     Context,
@@ -28,12 +44,21 @@
     sync_to_async,
 )
 from django.conf import settings
-from django.http import HttpResponse
+from django.core.exceptions import PermissionDenied
+from django.http import (
+    Http404,
+    HttpResponse,
+    HttpResponseBadRequest,
+)
 from django.http.response import (
     HttpResponseBase,
     StreamingHttpResponse,
 )
-from django.utils.html import escape
+from django.utils.html import (
+    escape,
+    format_html,
+)
+from django.utils.safestring import mark_safe
 
 from iommi.debug import src_debug_url_builder
 
@@ -71,19 +96,21 @@ def strip_extra_path(s, token):
 
 class HTMLStats(pstats.Stats):
     _get_params = None
+    _sort_param = '_iommi_prof'
 
     def _build_url(self, **overrides):
         params = self._get_params.copy() if self._get_params else {}
         params.update(overrides)
         from django.http import QueryDict
+
         qd = QueryDict(mutable=True)
         qd.update(params)
         return '?' + qd.urlencode()
 
     def print_title(self):
-        ncalls_url = self._build_url(_iommi_prof='ncalls')
-        tottime_url = self._build_url(_iommi_prof='tottime')
-        cumtime_url = self._build_url(_iommi_prof='cumtime')
+        ncalls_url = self._build_url(**{self._sort_param: 'ncalls'})
+        tottime_url = self._build_url(**{self._sort_param: 'tottime'})
+        cumtime_url = self._build_url(**{self._sort_param: 'cumtime'})
         print(
             # language=HTML
             f'''
@@ -176,8 +203,12 @@ def f8(x):
             print(f'<td>{escape(function_name)}</td>', file=self.stream)
 
         from iommi import traversable
+
         if function_name in traversable.worst_offenders_candidates:
-            print(f'<td><a href="?_iommi_func_worst_offender={escape(function_name)}">Worst offenders</a></td>', file=self.stream)
+            print(
+                f'<td><a href="?_iommi_func_worst_offender={escape(function_name)}">Worst offenders</a></td>',
+                file=self.stream,
+            )
         else:
             print('<td></td>', file=self.stream)
 
@@ -186,6 +217,12 @@ def f8(x):
         print('</tr>', file=self.stream)
 
 
+# Limits for the stacks rebuilt from a pstats call graph, where the number of
+# paths can grow exponentially with the depth
+MAX_FOLDED_DEPTH = 100
+MAX_FOLDED_LINES = 20000
+
+
 def _yappi_generate_folded_data(func_stats, threshold):
     """Generate folded stack data directly from yappi's native tree.
 
@@ -242,6 +279,460 @@ def walk(stat, trace):
     return '\n'.join(lines)
 
 
+def _pstats_generate_folded_data(stats, threshold, max_depth=MAX_FOLDED_DEPTH, max_lines=MAX_FOLDED_LINES):
+    """Generate folded stack data from a pstats call graph.
+
+    pstats only knows the direct callers of each function, so the stacks
+    are rebuilt by walking the caller/callee edges from the functions that
+    have no callers. A function called from several places has its time
+    split over the paths to it, in proportion to the time of the call on
+    each path, so the total of the stacks is the time of the roots.
+    """
+    children = defaultdict(list)
+    for func, (cc, nc, tt, ct, callers) in stats.stats.items():
+        for caller, (caller_cc, caller_nc, caller_tt, caller_ct) in callers.items():
+            children[caller].append((func, caller_tt, caller_ct))
+
+    roots = [func for func, (cc, nc, tt, ct, callers) in stats.stats.items() if not callers]
+    if not roots and stats.stats:
+        roots = [max(stats.stats, key=lambda func: stats.stats[func][3])]
+
+    total_time = sum(stats.stats[func][3] for func in roots)
+    if total_time <= 0:
+        return ''
+
+    lines = []
+
+    def format_frame(func):
+        filename, lineno, name = func
+        return f'{name} ({filename}:{lineno})'
+
+    def walk(func, trace, seen, share):
+        # `share` is the part of the time of `func` that is spent on this path
+        if len(trace) >= max_depth:
+            return
+        for child, tt, ct in sorted(children[func], key=lambda c: -c[2]):
+            if len(lines) >= max_lines:
+                return
+            path_ct = ct * share
+            if child in seen or path_ct / total_time < threshold:
+                continue
+
+            child_trace = trace + (format_frame(child),)
+            count = int(tt * share * 1_000_000)
+            if count > 0:
+                lines.append(f'{";".join(child_trace)} {count}')
+            child_ct = stats.stats[child][3]
+            if child_ct > 0:
+                walk(child, child_trace, seen | {child}, min(1.0, path_ct / child_ct))
+
+    for root in roots:
+        root_trace = (format_frame(root),)
+        count = int(stats.stats[root][2] * 1_000_000)
+        if count > 0:
+            lines.append(f'{";".join(root_trace)} {count}')
+        walk(root, root_trace, {root}, 1.0)
+
+    return '\n'.join(lines)
+
+
+_aggregated_profiles = {}
+_aggregated_profiles_lock = threading.Lock()
+_last_flush = monotonic()
+
+
+def should_sample_profile(request):
+    sample_rate = getattr(settings, 'IOMMI_PROFILE_SAMPLE_RATE', 0)
+    if not sample_rate or getattr(request, 'profiler_disabled', True):
+        return False
+    return random.random() < sample_rate
+
+
+def get_profile_dir():
+    return Path(getattr(settings, 'IOMMI_PROFILE_DIR', Path(gettempdir()) / 'iommi_profiles'))
+
+
+def view_name_for_request(request):
+    resolver_match = getattr(request, 'resolver_match', None)
+    if resolver_match is None:
+        return None
+    return resolver_match.view_name or resolver_match._func_path
+
+
+def _profile_filename(view_name):
+    return f'{quote(view_name, safe="")}.{os.getpid()}.prof'
+
+
+def record_aggregated_profile(view_name, profile):
+    with _aggregated_profiles_lock:
+        stats = _aggregated_profiles.get(view_name)
+        if stats is None:
+            _aggregated_profiles[view_name] = pstats.Stats(profile)
+        else:
+            stats.add(profile)
+
+        if monotonic() - _last_flush >= getattr(settings, 'IOMMI_PROFILE_FLUSH_INTERVAL', 60):
+            _flush_aggregated_profiles()
+
+
+def flush_aggregated_profiles():
+    with _aggregated_profiles_lock:
+        _flush_aggregated_profiles()
+
+
+def _flush_aggregated_profiles():
+    global _last_flush
+    profile_dir = get_profile_dir()
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    # The stats in memory are everything this process has collected, so each
+    # flush overwrites the file of this process. Processes are merged on read.
+    for view_name, stats in _aggregated_profiles.items():
+        stats.dump_stats(profile_dir / _profile_filename(view_name))
+    _last_flush = monotonic()
+
+
+def clear_aggregated_profiles():
+    with _aggregated_profiles_lock:
+        _aggregated_profiles.clear()
+
+
+def _aggregated_profile_files():
+    profile_dir = get_profile_dir()
+    if not profile_dir.exists():
+        return {}
+
+    result = defaultdict(list)
+    for path in sorted(profile_dir.glob('*.prof')):
+        quoted_view_name, _, _ = path.name.rsplit('.', 2)
+        result[unquote(quoted_view_name)].append(path)
+    return result
+
+
+def load_aggregated_stats(view_name, stream):
+    """Merge the stats for a view from all processes that have flushed them."""
+    files = _aggregated_profile_files().get(view_name)
+    if not files:
+        return None
+    return HTMLStats(*[str(x) for x in files], stream=stream)
+
+
+def stats_page_html(stats_output, links):
+    # language=html
+    start_html = Template('''
+        <style>
+            html {
+                font-family: monospace;
+                white-space: pre-line;
+            }
+
+            div, table {
+                white-space: normal;
+            }
+
+            td, th {
+                white-space: nowrap;
+                padding-right: 0.5rem;
+                color: #666;
+            }
+
+            th {
+                text-align: left;
+            }
+
+            .numeric {
+                text-align: right;
+            }
+
+            .own td {
+                font-weight: bold;
+                color: black;
+            }
+
+            @media (prefers-color-scheme: dark) {
+                html {
+                    background-color: black;
+                    color: #bbb;
+                }
+                td, th {
+                    color: #888;
+                }
+
+                .own td {
+                    color: white;
+                }
+
+                a {
+                    color: #1d5aff;
+                }
+                a:visited {
+                    color: #681dff;
+                }
+            }
+        </style>
+
+        <div>
+            {% for name, url in links %}
+                <a href="{{ url }}">{{ name }}</a>
+            {% endfor %}
+        </div>
+
+        <p></p>
+    ''').render(Context(dict(links=links)))
+
+    return start_html.strip() + stats_output
+
+
+def flame_graph_html(folded_data):
+    from django.templatetags.static import static
+
+    formatter_url = 'pycharm://open?file={filename}&line={lineno}'
+
+    base_dir_css = str(settings.BASE_DIR).replace('\\', '\\\\').replace('"', '\\"')
+
+    # language=html
+    return f'''\
+<!DOCTYPE html>
+<html>
+    <head>
+        <meta charset="utf-8">
+        <title>iommi profiler</title>
+        <style>
+            html {{ color-scheme: light dark; }}
+            body {{ background: light-dark(white, #1e1e1e); color: light-dark(black, #ccc); }}
+            .flame-graph span[title] {{
+                background-color: light-dark(#d0d0d0, #404040);
+                border-radius: 3px;
+                margin: 1px;
+            }}
+            .flame-graph span[title*="/site-packages/"] {{
+                background-color: light-dark(#f5d58d, #5a4420);
+            }}
+            .flame-graph span[title*="{base_dir_css}"]:not([title*="/site-packages/"]) {{
+                background-color: light-dark(#a8d5a8, #305830);
+            }}
+            .legend {{ display: flex; gap: 16px; padding: 8px 12px; font-family: monospace; font-size: 12px; }}
+            .legend-swatch {{ display: inline-block; width: 12px; height: 12px; border-radius: 2px; margin-right: 4px; vertical-align: middle; }}
+            .legend-project {{ background-color: light-dark(#a8d5a8, #305830); }}
+            .legend-thirdparty {{ background-color: light-dark(#f5d58d, #5a4420); }}
+            .legend-stdlib {{ background-color: light-dark(#d0d0d0, #404040); }}
+        </style>
+    </head>
+    <body>
+        <div class="legend">
+            <span><span class="legend-swatch legend-project"></span>project</span>
+            <span><span class="legend-swatch legend-thirdparty"></span>third-party</span>
+            <span><span class="legend-swatch legend-stdlib"></span>stdlib</span>
+        </div>
+        <div id="elm"></div>
+        <script src="{static('js/flame_graph.js')}"></script>
+        <script>
+            Elm.Main.init({{
+                node: document.getElementById('elm'),
+                flags: {{
+                    data: {folded_data!r},
+                    urlFormat: {formatter_url!r}
+                }}
+            }});
+        </script>
+    </body>
+</html>'''
+
+
+_memory_profiles = OrderedDict()
+_memory_profile_ids = itertools.count(1)
+_memory_profiles_lock = threading.Lock()
+_MEMORY_PROFILES_KEEP = 10
+
+
+def _start_memory_profiling(request):
+    from iommi.part_timing import (
+        PartTimings,
+        part_timings_for_request,
+    )
+
+    request._iommi_prof_started_tracemalloc = not tracemalloc.is_tracing()
+    if request._iommi_prof_started_tracemalloc:
+        tracemalloc.start()
+    request._iommi_prof_snapshot = tracemalloc.take_snapshot()
+    tracemalloc.reset_peak()
+
+    timings = part_timings_for_request(request)
+    if timings is None:
+        request.iommi_part_timings = PartTimings(track_memory=True)
+    else:
+        timings.track_memory = True
+
+
+def _memory_by_line(request):
+    after = tracemalloc.take_snapshot()
+    peak = tracemalloc.get_traced_memory()[1]
+    if request._iommi_prof_started_tracemalloc:
+        tracemalloc.stop()
+
+    ignored = (
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        tracemalloc.Filter(False, '<frozen importlib._bootstrap_external>'),
+        tracemalloc.Filter(False, '<unknown>'),
+    )
+    diff = after.filter_traces(ignored).compare_to(request._iommi_prof_snapshot.filter_traces(ignored), 'lineno')
+    by_line = {
+        (stat.traceback[0].filename, stat.traceback[0].lineno): (stat.size_diff, stat.count_diff)
+        for stat in diff
+        if stat.size_diff or stat.count_diff
+    }
+    return by_line, peak
+
+
+def record_memory_profile(by_line):
+    with _memory_profiles_lock:
+        memory_profile_id = next(_memory_profile_ids)
+        _memory_profiles[memory_profile_id] = by_line
+        while len(_memory_profiles) > _MEMORY_PROFILES_KEEP:
+            _memory_profiles.popitem(last=False)
+    return memory_profile_id
+
+
+def format_size(size):
+    return f'{size / 1024:.1f} KiB'
+
+
+def memory_profile_html(*, memory_profile_id, by_line, peak, part_timings, compare_with=None, limit=280):
+    def file_cell(filename, lineno):
+        base_dir = str(settings.BASE_DIR)
+        nice_path = strip_extra_path(filename.replace(base_dir, ''), '/site-packages')
+        return format_html(
+            '<td><a href="{}">{}</a></td><td class="numeric">{}</td>',
+            src_debug_url_builder(filename, lineno),
+            nice_path,
+            lineno,
+        )
+
+    def tr(key, cells):
+        filename = key[0]
+        own = str(settings.BASE_DIR) in filename and '/site-packages/' not in filename
+        return format_html('<tr{}>{}</tr>', mark_safe(' class="own"') if own else '', cells)
+
+    if compare_with is None:
+        line_header = mark_safe('<th class="numeric">size</th><th class="numeric">count</th>')
+        lines = sorted(by_line.items(), key=lambda x: -x[1][0])[:limit]
+        line_rows = [
+            tr(
+                key,
+                format_html(
+                    '<td class="numeric">{}</td><td class="numeric">{}</td>{}',
+                    format_size(size),
+                    count,
+                    file_cell(*key),
+                ),
+            )
+            for key, (size, count) in lines
+        ]
+    else:
+        line_header = mark_safe(
+            '<th class="numeric">size</th><th class="numeric">compared to</th><th class="numeric">difference</th>'
+        )
+        keys = set(by_line) | set(compare_with)
+        lines = sorted(
+            ((key, by_line.get(key, (0, 0))[0], compare_with.get(key, (0, 0))[0]) for key in keys),
+            key=lambda x: -abs(x[1] - x[2]),
+        )[:limit]
+        line_rows = [
+            tr(
+                key,
+                format_html(
+                    '<td class="numeric">{}</td><td class="numeric">{}</td><td class="numeric">{}</td>{}',
+                    format_size(size),
+                    format_size(other_size),
+                    format_size(size - other_size),
+                    file_cell(*key),
+                ),
+            )
+            for key, size, other_size in lines
+            if size != other_size
+        ]
+
+    part_rows = (
+        [
+            format_html(
+                '<tr><td>{}</td><td>{}</td><td>{}</td><td class="numeric">{}</td><td class="numeric">{}</td></tr>',
+                stat.path or 'root',
+                stat.type_name,
+                stat.kind,
+                format_size(stat.memory),
+                stat.count,
+            )
+            for stat in sorted(part_timings.stats.values(), key=lambda x: -x.memory)[:limit]
+        ]
+        if part_timings is not None
+        else []
+    )
+
+    # language=html
+    return format_html(
+        '''
+            Memory profile #{memory_profile_id}. Add _iommi_prof_compare={memory_profile_id} to a later memory profile to compare with this one.
+            Peak traced memory: {peak}
+            Net growth: {total}
+
+            <h2>By file and line</h2>
+            <table>
+                <thead><tr>{line_header}<th>filename</th><th class="numeric">lineno</th></tr></thead>
+                {line_rows}
+            </table>
+
+            <h2>By iommi part</h2>
+            <table>
+                <thead><tr><th>path</th><th>type</th><th>kind</th><th class="numeric">size</th><th class="numeric">count</th></tr></thead>
+                {part_rows}
+            </table>
+        ''',
+        memory_profile_id=memory_profile_id,
+        peak=format_size(peak),
+        total=format_size(sum(size for size, count in by_line.values())),
+        line_header=line_header,
+        line_rows=format_html('{}' * len(line_rows), *line_rows),
+        part_rows=format_html('{}' * len(part_rows), *part_rows),
+    )
+
+
+def memory_profile_response(request, response):
+    from iommi.part_timing import part_timings_for_request
+
+    if isinstance(response, StreamingHttpResponse):
+        # The allocations made while streaming belong to the request too
+        for _ in response.streaming_content:
+            pass
+
+    by_line, peak = _memory_by_line(request)
+    memory_profile_id = record_memory_profile(by_line)
+
+    compare_with = None
+    compare_id = request.GET.get('_iommi_prof_compare')
+    if compare_id:
+        if not compare_id.isdigit():
+            return HttpResponseBadRequest('_iommi_prof_compare must be the number of a memory profile')
+        compare_with = _memory_profiles.get(int(compare_id))
+        if compare_with is None:
+            return HttpResponse(
+                f'Memory profile #{int(compare_id)} is gone, only the last {_MEMORY_PROFILES_KEEP} are kept'
+            )
+
+    result = memory_profile_html(
+        memory_profile_id=memory_profile_id,
+        by_line=by_line,
+        peak=peak,
+        part_timings=part_timings_for_request(request),
+        compare_with=compare_with,
+    )
+
+    preserved_params = request.GET.copy()
+    preserved_params['_iommi_prof'] = ''
+    preserved_params.pop('_iommi_prof_compare', None)
+    cpu_url = '?' + preserved_params.urlencode()
+    return HttpResponse(stats_page_html(result, links=[('cpu', cpu_url)]))
+
+
 class Middleware:
     async_capable = True
     sync_capable = True
@@ -276,6 +767,9 @@ def _process_response(self, request, response):
 
             return HttpResponse(s.getvalue(), content_type='text/plain')
 
+        if request._iommi_prof == 'mem':
+            return memory_profile_response(request, response)
+
         if request._iommi_prof:
             if isinstance(response, StreamingHttpResponse):
                 # consume the entire streaming response, redirecting to stdout
@@ -314,65 +808,13 @@ def _process_response(self, request, response):
                         gprof2dot.wait()
 
             elif prof_command == 'flame':
-                from django.templatetags.static import static
-
                 if not hasattr(request, '_iommi_yappi_func_stats'):
                     return HttpResponse('You must `pip install yappi` to use the flamegraph feature')
 
                 threshold = float(request.GET.get('_iommi_prof_threshold', 0.00001)) / 100
                 folded_data = _yappi_generate_folded_data(request._iommi_yappi_func_stats, threshold)
 
-                formatter_url = 'pycharm://open?file={filename}&line={lineno}'
-
-                base_dir_css = str(settings.BASE_DIR).replace('\\', '\\\\').replace('"', '\\"')
-
-                # language=html
-                response.content = f'''\
-<!DOCTYPE html>
-<html>
-    <head>
-        <meta charset="utf-8">
-        <title>iommi profiler</title>
-        <style>
-            html {{ color-scheme: light dark; }}
-            body {{ background: light-dark(white, #1e1e1e); color: light-dark(black, #ccc); }}
-            .flame-graph span[title] {{
-                background-color: light-dark(#d0d0d0, #404040);
-                border-radius: 3px;
-                margin: 1px;
-            }}
-            .flame-graph span[title*="/site-packages/"] {{
-                background-color: light-dark(#f5d58d, #5a4420);
-            }}
-            .flame-graph span[title*="{base_dir_css}"]:not([title*="/site-packages/"]) {{
-                background-color: light-dark(#a8d5a8, #305830);
-            }}
-            .legend {{ display: flex; gap: 16px; padding: 8px 12px; font-family: monospace; font-size: 12px; }}
-            .legend-swatch {{ display: inline-block; width: 12px; height: 12px; border-radius: 2px; margin-right: 4px; vertical-align: middle; }}
-            .legend-project {{ background-color: light-dark(#a8d5a8, #305830); }}
-            .legend-thirdparty {{ background-color: light-dark(#f5d58d, #5a4420); }}
-            .legend-stdlib {{ background-color: light-dark(#d0d0d0, #404040); }}
-        </style>
-    </head>
-    <body>
-        <div class="legend">
-            <span><span class="legend-swatch legend-project"></span>project</span>
-            <span><span class="legend-swatch legend-thirdparty"></span>third-party</span>
-            <span><span class="legend-swatch legend-stdlib"></span>stdlib</span>
-        </div>
-        <div id="elm"></div>
-        <script src="{static('js/flame_graph.js')}"></script>
-        <script>
-            Elm.Main.init({{
-                node: document.getElementById('elm'),
-                flags: {{
-                    data: {folded_data!r},
-                    urlFormat: {formatter_url!r}
-                }}
-            }});
-        </script>
-    </body>
-</html>'''
+                response.content = flame_graph_html(folded_data)
                 response['Content-Type'] = 'text/html'
 
             else:
@@ -386,77 +828,13 @@ def _process_response(self, request, response):
                 flame_url = '?' + preserved_params.urlencode()
                 preserved_params['_iommi_prof'] = 'graph'
                 graph_url = '?' + preserved_params.urlencode()
+                preserved_params['_iommi_prof'] = 'mem'
+                mem_url = '?' + preserved_params.urlencode()
 
-                # language=html
-                start_html = Template('''
-                    <style>
-                        html {
-                            font-family: monospace;
-                            white-space: pre-line;
-                        }
-
-                        div, table {
-                            white-space: normal;
-                        }
-
-                        td, th {
-                            white-space: nowrap;
-                            padding-right: 0.5rem;
-                            color: #666;
-                        }
-
-                        th {
-                            text-align: left;
-                        }
-
-                        .numeric {
-                            text-align: right;
-                        }
-
-                        .own td {
-                            font-weight: bold;
-                            color: black;
-                        }
-
-                        @media (prefers-color-scheme: dark) {
-                            html {
-                                background-color: black;
-                                color: #bbb;
-                            }
-                            td, th {
-                                color: #888;
-                            }
-
-                            .own td {
-                                color: white;
-                            }
-
-                            a {
-                                color: #1d5aff;
-                            }
-                            a:visited {
-                                color: #681dff;
-                            }
-                        }
-                    </style>
-
-                    <div>
-                        <a href="{{ flame_url }}">flamegraph</a>
-                        <a href="{{ graph_url }}">graph</a>
-                    </div>
-
-                    <p></p>
-                ''').render(
-                    Context(
-                        dict(
-                            flame_url=flame_url,
-                            graph_url=graph_url,
-                        )
-                    )
+                response.content = stats_page_html(
+                    result,
+                    links=[('flamegraph', flame_url), ('graph', graph_url), ('memory', mem_url)],
                 )
-
-                response.content = start_html.strip() + result
-
                 response['Content-Type'] = 'text/html'
 
         return response
@@ -466,7 +844,10 @@ def process_view(self, request, view_func, view_args, view_kwargs):
 
     @staticmethod
     def _start_profiling(request):
-        if yappi is not None:
+        if request.GET.get('_iommi_prof') == 'mem':
+            _start_memory_profiling(request)
+            request._iommi_prof = 'mem'
+        elif yappi is not None:
             yappi.set_clock_type("wall")
             yappi.clear_stats()
             yappi.start(builtins=True)
@@ -495,9 +876,7 @@ def _yappi_stats_to_pstats_dict(func_stats):
             for child in stat.children:
                 child_key = (child.module, child.lineno, child.name)
                 if child_key in pdict:
-                    pdict[child_key][4][caller_key] = (
-                        child.nactualcall, child.ncall, child.tsub, child.ttot
-                    )
+                    pdict[child_key][4][caller_key] = (child.nactualcall, child.ncall, child.tsub, child.ttot)
 
         return pdict
 
@@ -534,11 +913,32 @@ def _build_stats(request, stream):
             ps = HTMLStats(*request._iommi_prof, stream=stream)
         return ps
 
+    @staticmethod
+    def _sample(request, get_response):
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # Another profiler is already running in this process
+            return get_response(request)
+
+        try:
+            response = get_response(request)
+        finally:
+            profile.disable()
+
+        view_name = view_name_for_request(request)
+        if view_name is not None:
+            record_aggregated_profile(view_name, profile)
+        return response
+
     def __call__(self, request):
         if iscoroutinefunction(self):
             return self.__acall__(request)
         self._setup_request(request)
         if not should_profile(request):
+            if should_sample_profile(request):
+                return self._sample(request, self.get_response)
             return self.get_response(request)
         self._start_profiling(request)
         response = self.get_response(request)
@@ -546,6 +946,8 @@ def __call__(self, request):
 
     def _sync_profile(self, request):
         if not should_profile(request):
+            if should_sample_profile(request):
+                return self._sample(request, async_to_sync(self.get_response))
             return async_to_sync(self.get_response)(request)
         if getattr(request, '_iommi_view_is_async', False):
             return HttpResponse('Profiling is not supported for async views. Use an async-aware profiler instead.')
@@ -556,3 +958,34 @@ def _sync_profile(self, request):
     async def __acall__(self, request):
         self._setup_request(request)
         return await sync_to_async(self._sync_profile)(request)
+
+
+def aggregated_profile_view(request):
+    if not request.user.is_staff:
+        raise PermissionDenied()
+
+    flush_aggregated_profiles()
+
+    view_name = request.GET.get('view')
+    if view_name is None:
+        links = [
+            format_html('<li><a href="?{}">{}</a></li>', urlencode(dict(view=name)), name)
+            for name in _aggregated_profile_files()
+        ]
+        return HttpResponse(format_html('<ul>{}</ul>', format_html('{}' * len(links), *links)))
+
+    s = StringIO()
+    ps = load_aggregated_stats(view_name, stream=s)
+    if ps is None:
+        raise Http404()
+
+    if 'flame' in request.GET:
+        threshold = float(request.GET.get('threshold', 0.00001)) / 100
+        return HttpResponse(flame_graph_html(_pstats_generate_folded_data(ps, threshold)))
+
+    ps._get_params = dict(view=view_name)
+    ps._sort_param = 'sort'
+    ps.sort_stats(request.GET.get('sort', 'cumulative'))
+    ps.print_stats()
+    flame_url = '?' + urlencode(dict(view=view_name, flame=''))
+    return HttpResponse(stats_page_html(s.getvalue(), links=[('flamegraph', flame_url)]))
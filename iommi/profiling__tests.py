@@ -1,6 +1,8 @@
 import sys
 
 import pytest
+from django.core.exceptions import PermissionDenied
+from django.http import Http404
 from django.http.response import HttpResponseBase
 from django.test import override_settings
 
@@ -117,3 +119,253 @@ class user:
 
     # No profiler_disabled attribute -> defaults to disabled=True -> profiling not allowed.
     assert should_profile(_Req()) is False
+
+
+def _sample_view(request):
+    return sentinel
+
+
+def _sampled_req(path='/foo/'):
+    from django.urls import ResolverMatch
+
+    request = req('get')
+    request.path = path
+    request.resolver_match = ResolverMatch(_sample_view, (), {}, url_name='sample_view')
+    return request
+
+
+@pytest.fixture
+def aggregated_profiles(settings, tmp_path):
+    from iommi.profiling import clear_aggregated_profiles
+
+    settings.DEBUG = False
+    settings.IOMMI_PROFILE_DIR = tmp_path
+    settings.IOMMI_PROFILE_SAMPLE_RATE = 1
+    clear_aggregated_profiles()
+    yield tmp_path
+    clear_aggregated_profiles()
+
+
+def test_aggregated_profiling_off_by_default(aggregated_profiles, settings):
+    from iommi.profiling import should_sample_profile
+
+    del settings.IOMMI_PROFILE_SAMPLE_RATE
+    assert not should_sample_profile(_sampled_req())
+
+
+def test_aggregated_profiling_skips_media(aggregated_profiles):
+    from iommi.profiling import _aggregated_profiles
+
+    assert middleware(_sampled_req(path='/static/foo.css')) is sentinel
+    assert _aggregated_profiles == {}
+
+
+def test_aggregated_profiling(aggregated_profiles, settings):
+    from iommi.profiling import (
+        _aggregated_profiles,
+        aggregated_profile_view,
+    )
+
+    settings.IOMMI_PROFILE_FLUSH_INTERVAL = 1000
+
+    assert middleware(_sampled_req()) is sentinel
+    assert middleware(_sampled_req()) is sentinel
+    assert list(_aggregated_profiles) == ['sample_view']
+    # Not flushed yet
+    assert list(aggregated_profiles.iterdir()) == []
+
+    with pytest.raises(PermissionDenied):
+        aggregated_profile_view(user_req('get'))
+
+    content = aggregated_profile_view(staff_req('get')).content.decode()
+    assert '<a href="?view=sample_view">sample_view</a>' in content
+    assert [x.name.partition('.')[0] for x in aggregated_profiles.iterdir()] == ['sample_view']
+
+    content = aggregated_profile_view(staff_req('get', view='sample_view')).content.decode()
+    assert 'white-space: nowrap' in content
+    assert '?view=sample_view&sort=tottime' in content
+    assert 'lambda' in content
+
+    content = aggregated_profile_view(staff_req('get', view='sample_view', flame='')).content.decode()
+    assert 'Elm.Main.init' in content
+
+    with pytest.raises(Http404):
+        aggregated_profile_view(staff_req('get', view='does_not_exist'))
+
+
+def test_aggregated_profiling_merges_processes(aggregated_profiles):
+    import cProfile
+    import pstats
+
+    from iommi.profiling import (
+        _profile_filename,
+        load_aggregated_stats,
+    )
+
+    def profile_of(f):
+        profile = cProfile.Profile()
+        profile.runcall(f)
+        return profile
+
+    def foo():
+        pass
+
+    pstats.Stats(profile_of(foo)).dump_stats(aggregated_profiles / _profile_filename('my:view'))
+    pstats.Stats(profile_of(foo)).dump_stats(aggregated_profiles / 'my%3Aview.1.prof')
+
+    stats = load_aggregated_stats('my:view', stream=None)
+    [(key, value)] = [(k, v) for k, v in stats.stats.items() if k[2] == 'foo']
+    assert value[1] == 2
+
+
+def test_pstats_generate_folded_data():
+    import cProfile
+    import pstats
+
+    from iommi.profiling import _pstats_generate_folded_data
+
+    def leaf():
+        sum(range(10000))
+
+    def middle():
+        for _ in range(10):
+            leaf()
+
+    profile = cProfile.Profile()
+    profile.runcall(middle)
+    folded = _pstats_generate_folded_data(pstats.Stats(profile), threshold=0)
+
+    assert any(
+        'middle (' in line and 'leaf (' in line and line.index('middle (') < line.index('leaf (')
+        for line in folded.split('\n')
+    )
+    assert 'leaf (' not in _pstats_generate_folded_data(pstats.Stats(profile), threshold=2)
+
+
+def fake_stats(edges, own_time):
+    """
+    A pstats-like call graph from a {(caller, callee): cumulative time} dict
+    and a {function: own time} dict. The own time of a call is split over
+    its callers in proportion to the time of the calls.
+    """
+    from iommi.struct import Struct
+
+    def func(name):
+        return ('file.py', 1, name)
+
+    cumulative = {}
+
+    def ct(name):
+        if name not in cumulative:
+            cumulative[name] = own_time[name] + sum(t for (caller, _), t in edges.items() if caller == name)
+        return cumulative[name]
+
+    stats = {}
+    for name in own_time:
+        callers = {}
+        for (caller, callee), edge_ct in edges.items():
+            if callee == name:
+                share = edge_ct / ct(name)
+                callers[func(caller)] = (1, 1, own_time[name] * share, edge_ct)
+        stats[func(name)] = (1, 1, own_time[name], ct(name), callers)
+    return Struct(stats=stats)
+
+
+def folded_total(folded):
+    return sum(int(line.rsplit(' ', 1)[1]) for line in folded.split('\n') if line)
+
+
+def test_pstats_generate_folded_data_diamond():
+    from iommi.profiling import _pstats_generate_folded_data
+
+    # top -> a, b -> shared -> leaf, with the time of shared and leaf split over a and b
+    stats = fake_stats(
+        edges={('top', 'a'): 5, ('top', 'b'): 5, ('a', 'shared'): 4, ('b', 'shared'): 4, ('shared', 'leaf'): 8},
+        own_time={'top': 0, 'a': 1, 'b': 1, 'shared': 0, 'leaf': 8},
+    )
+    folded = _pstats_generate_folded_data(stats, threshold=0)
+    assert folded_total(folded) == 10_000_000
+    leaf_lines = [line for line in folded.split('\n') if line.split(' (')[-2].endswith('leaf')]
+    assert len(leaf_lines) == 2
+    assert all(line.endswith(' 4000000') for line in leaf_lines)
+
+
+def test_pstats_generate_folded_data_deep():
+    from iommi.profiling import _pstats_generate_folded_data
+
+    # Every function on a level is called by both functions on the level above,
+    # so there are 2**depth paths to the bottom
+    depth = 16
+    edges = {('top', f'f0_{i}'): 2**depth for i in range(2)}
+    own_time = {'top': 0}
+    for level in range(depth):
+        for i in range(2):
+            own_time[f'f{level}_{i}'] = 2**depth
+            if level < depth - 1:
+                for j in range(2):
+                    edges[(f'f{level}_{i}', f'f{level + 1}_{j}')] = 2**depth
+    stats = fake_stats(edges=edges, own_time=own_time)
+
+    folded = _pstats_generate_folded_data(stats, threshold=0, max_lines=1000)
+    assert len(folded.split('\n')) == 1000
+
+    folded = _pstats_generate_folded_data(stats, threshold=0, max_depth=5)
+    assert max(line.count(';') + 1 for line in folded.split('\n')) == 5
+
+    # Paths with a small share of the time are cut by the threshold
+    folded = _pstats_generate_folded_data(stats, threshold=0.001)
+    assert len(folded.split('\n')) < 2**12
+    assert folded_total(folded) <= 2 * 2**depth * 1_000_000
+
+
+def _allocating_view(request):
+    from django.http import HttpResponse
+
+    from iommi import (
+        Page,
+        html,
+    )
+
+    request.allocated = [str(i) * 10 for i in range(10000)]
+    page = Page(parts__foo=html.div('foo')).bind(request=request)
+    return HttpResponse(page.__html__())
+
+
+def test_memory_profile(settings):
+    import tracemalloc
+
+    settings.DEBUG = True
+    middleware = Middleware(_allocating_view)
+
+    content = middleware(req('get', _iommi_prof='mem')).content.decode()
+    assert not tracemalloc.is_tracing()
+    assert 'Memory profile #' in content
+    assert 'By file and line' in content
+    # the list comprehension in _allocating_view is the top allocation site
+    line = _allocating_view.__code__.co_firstlineno + 8
+    assert f'profiling__tests.py</a></td><td class="numeric">{line}</td>' in content
+    # per part
+    assert '<tr><td>root</td><td>Page</td><td>bind</td>' in content
+    assert '<tr><td>root</td><td>Page</td><td>render</td>' in content
+
+    memory_profile_id = int(content.partition('Memory profile #')[2].partition('.')[0])
+    content = middleware(req('get', _iommi_prof='mem', _iommi_prof_compare=str(memory_profile_id))).content.decode()
+    assert 'compared to' in content
+
+    content = middleware(req('get', _iommi_prof='mem', _iommi_prof_compare='0')).content.decode()
+    assert content == 'Memory profile #0 is gone, only the last 10 are kept'
+
+    response = middleware(req('get', _iommi_prof='mem', _iommi_prof_compare='nope'))
+    assert response.status_code == 400
+
+
+def test_memory_profile_keeps_tracemalloc_running(settings):
+    import tracemalloc
+
+    settings.DEBUG = True
+    tracemalloc.start()
+    try:
+        assert 'Memory profile #' in Middleware(_allocating_view)(req('get', _iommi_prof='mem')).content.decode()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
@@ -4,7 +4,10 @@
 import re
 import sys
 import threading
-from collections import defaultdict
+from collections import (
+    defaultdict,
+    deque,
+)
 from contextlib import contextmanager
 from datetime import (
     date,
@@ -18,14 +21,20 @@
     markcoroutinefunction,
 )
 from django.conf import settings
+from django.core.exceptions import PermissionDenied
 from django.db import connections
 from django.db.backends import utils as django_db_utils
 from django.db.utils import DEFAULT_DB_ALIAS
-from django.http import HttpResponse
+from django.http import (
+    Http404,
+    HttpResponse,
+)
 from django.utils.timezone import now
 
 from iommi._web_compat import format_html
 from iommi.attrs import render_style
+from iommi.base import items
+from iommi.struct import Struct
 from iommi.thread_locals import (
     get_current_request,
     set_current_request,
@@ -146,6 +155,167 @@ def no_coloring(text, color=None, on_color=None, attrs=None):
 assert getattr(settings, 'SQL_DEBUG', None) in SQL_DEBUG_LEVELS, f'SQL_DEBUG must be one of: {SQL_DEBUG_LEVELS}'
 
 
+_fingerprint_token_re = re.compile(
+    r'''
+    (?P<identifier>"(?:[^"]|"")*"|`[^`]*`)
+    | (?P<string>'(?:[^']|'')*')
+    | (?P<placeholder>%s|%\(\w+\)s|\?)
+    | (?P<number>(?<![\w.])-?\d+(?:\.\d+)?(?![\w.]))
+    ''',
+    re.VERBOSE,
+)
+_fingerprint_in_list_re = re.compile(r'\bIN \(\?(?:, \?)*\)', re.IGNORECASE)
+_fingerprint_values_list_re = re.compile(r'\bVALUES \(([?, ]*)\)(?:, \(\1\))*', re.IGNORECASE)
+
+
+def sql_fingerprint(sql):
+    """
+    Normalize an SQL statement so that statements which only differ in their
+    literals, parameters or the length of their `IN` lists get the same
+    fingerprint.
+    """
+
+    def replace(m):
+        if m.group('identifier') is not None:
+            return m.group('identifier')
+        return '?'
+
+    sql = ' '.join(sql.split())
+    sql = _fingerprint_token_re.sub(replace, sql)
+    sql = _fingerprint_in_list_re.sub('IN (...)', sql)
+    sql = _fingerprint_values_list_re.sub(r'VALUES (\1)', sql)
+    return sql
+
+
+def group_by_fingerprint(iommi_sql_debug_log):
+    """
+    Group the log entries of a request by `sql_fingerprint`, over the entire
+    request. Groups are returned in order of first appearance.
+    """
+    groups = {}
+    for x in iommi_sql_debug_log:
+        groups.setdefault(sql_fingerprint(x['sql']), []).append(x)
+    return groups
+
+
+def find_part_in_stack(frame):
+    """
+    Find the innermost bound iommi part (column, field, filter, etc) that is
+    on the stack for the given frame.
+    """
+    from iommi.traversable import Traversable
+
+    while frame is not None:
+        f_locals = getattr(frame, 'f_locals', None) or {}
+        for name in ('column', 'field', 'filter', 'traversable', 'self'):
+            candidate = f_locals.get(name)
+            if isinstance(candidate, Traversable) and candidate._is_bound:
+                return candidate
+        frame = frame.f_back
+    return None
+
+
+def part_path(part):
+    if part is None:
+        return None
+    try:
+        return part.iommi_dunder_path
+    except Exception:
+        return None
+
+
+def _model_for_part(part):
+    from django.db.models import Model
+
+    node = part.iommi_parent() if hasattr(part, 'attr') else part
+    while node is not None:
+        model = getattr(node, 'model', None)
+        if isinstance(model, type) and issubclass(model, Model):
+            return model
+        node = node.iommi_parent()
+    return None
+
+
+_sql_from_table_re = re.compile(r'\bFROM "?(?P<table>\w+)"?', re.IGNORECASE)
+
+
+def suggest_related(sql, part):
+    """
+    Suggest the `select_related`/`prefetch_related` that would remove a repeated
+    query issued while evaluating `part`, or `None` if we can't figure it out.
+    """
+    if part is None:
+        return None
+
+    m = _sql_from_table_re.search(sql)
+    if not m:
+        return None
+    db_table = m.group('table')
+
+    model = _model_for_part(part)
+    if model is None:
+        return None
+
+    def suggestion(path, field):
+        if field.many_to_one or field.one_to_one:
+            return f"select_related('{path}')"
+        return f"prefetch_related('{path}')"
+
+    def related_table(field):
+        return field.related_model._meta.db_table if field.related_model is not None else None
+
+    # Prefer the relation path of the attr of the part, e.g. attr='album__artist__name'
+    attr = getattr(part, 'attr', None)
+    if isinstance(attr, str):
+        current_model = model
+        path = []
+        for segment in attr.split('__'):
+            try:
+                field = current_model._meta.get_field(segment)
+            except Exception:
+                break
+            if not field.is_relation:
+                break
+            path.append(segment)
+            if related_table(field) == db_table:
+                return suggestion('__'.join(path), field)
+            current_model = field.related_model
+
+    for field in model._meta.get_fields():
+        if field.is_relation and related_table(field) == db_table:
+            name = field.get_accessor_name() if field.auto_created and not field.concrete else field.name
+            return suggestion(name, field)
+
+    return None
+
+
+def find_repeated_queries(iommi_sql_debug_log, cutoff=None):
+    """
+    Find the fingerprints that were executed more than `cutoff` times in a
+    request. These are usually N+1 problems.
+    """
+    if cutoff is None:
+        cutoff = getattr(settings, 'SQL_DEBUG_WORST_SUSPICIOUS_CUTOFF', 3)
+
+    result = []
+    for fingerprint, entries in items(group_by_fingerprint(iommi_sql_debug_log)):
+        if len(entries) <= cutoff:
+            continue
+        part = next((x['part'] for x in entries if x.get('part') is not None), None)
+        result.append(
+            dict(
+                fingerprint=fingerprint,
+                count=len(entries),
+                duration=sum(x['duration'] for x in entries),
+                entries=entries,
+                part=part,
+                path=part_path(part),
+                suggestion=suggest_related(entries[0]['sql'], part),
+            )
+        )
+    return sorted(result, key=lambda x: -x['count'])
+
+
 def linkify(s):
     from iommi.debug import src_debug_url_builder
 
@@ -171,6 +341,147 @@ def linkify(s):
     return format_html('{}' * len(r), *r)
 
 
+_sample_counter = itertools.count()
+_sample_id_counter = itertools.count(1)
+_sampled_requests = deque()
+_sampled_requests_lock = threading.Lock()
+
+
+def should_sample_request():
+    """
+    Sampled tracing is for production, where `SQL_DEBUG` is off. It is turned on by
+    setting `SQL_DEBUG_SAMPLE_EVERY` (trace one request in N) and/or
+    `SQL_DEBUG_SAMPLE_SLOW_THRESHOLD` (only keep requests slower than this many seconds).
+    """
+    sample_every = getattr(settings, 'SQL_DEBUG_SAMPLE_EVERY', None)
+    slow_threshold = getattr(settings, 'SQL_DEBUG_SAMPLE_SLOW_THRESHOLD', None)
+    if sample_every is None:
+        if slow_threshold is None:
+            return False
+        sample_every = 1
+    return next(_sample_counter) % sample_every == 0
+
+
+def start_sampling(request):
+    request.iommi_sql_trace_sampled = True
+    request.iommi_sql_trace_sample_start = monotonic()
+    slow_threshold = getattr(settings, 'SQL_DEBUG_SAMPLE_SLOW_THRESHOLD', None) or 0
+    request.iommi_sql_trace_stacks_after = request.iommi_sql_trace_sample_start + slow_threshold
+    # Django only uses our debug cursor when queries are logged, which is off when DEBUG is off
+    request.iommi_sql_trace_force_debug_cursor = {}
+    for connection in connections.all():
+        request.iommi_sql_trace_force_debug_cursor[connection.alias] = connection.force_debug_cursor
+        connection.force_debug_cursor = True
+
+
+def stop_sampling(request, response):
+    duration = monotonic() - request.iommi_sql_trace_sample_start
+    for alias, force_debug_cursor in items(request.iommi_sql_trace_force_debug_cursor):
+        connections[alias].force_debug_cursor = force_debug_cursor
+    request.iommi_sql_trace_sampled = False
+
+    slow_threshold = getattr(settings, 'SQL_DEBUG_SAMPLE_SLOW_THRESHOLD', None) or 0
+    if duration < slow_threshold:
+        return
+
+    log = getattr(request, 'iommi_sql_debug_log', None) or []
+    record_sampled_request(
+        Struct(
+            id=next(_sample_id_counter),
+            time=request.iommi_start_time,
+            method=request.method,
+            path=request.get_full_path(),
+            status_code=response.status_code if response is not None else None,
+            duration=duration,
+            sql_count=len(log),
+            sql_duration=sum(x['duration'] for x in log),
+            log=log,
+        )
+    )
+
+
+def record_sampled_request(sample):
+    keep = getattr(settings, 'SQL_DEBUG_SAMPLE_KEEP', 50)
+    with _sampled_requests_lock:
+        _sampled_requests.append(sample)
+        while len(_sampled_requests) > keep:
+            _sampled_requests.popleft()
+
+
+def get_sampled_requests():
+    """
+    The sampled requests kept in memory, newest first.
+    """
+    with _sampled_requests_lock:
+        return list(reversed(_sampled_requests))
+
+
+def clear_sampled_requests():
+    with _sampled_requests_lock:
+        _sampled_requests.clear()
+
+
+def sampled_requests_view(request):
+    """
+    Staff only view of the requests kept by the sampled SQL trace. Add it to your urls:
+
+    .. code-block:: python
+
+        path('_iommi_sql_samples/', sampled_requests_view),
+    """
+    if not request.user.is_staff:
+        raise PermissionDenied()
+
+    from iommi import (
+        Column,
+        Table,
+    )
+
+    samples = get_sampled_requests()
+
+    sample_id = request.GET.get('sample')
+    if sample_id is not None:
+        sample = next((x for x in samples if str(x.id) == sample_id), None)
+        if sample is None:
+            raise Http404()
+
+        table = Table(
+            title=f'{sample.method} {sample.path} ({sample.duration:.3f}s)',
+            rows=[Struct(index=i, **x) for i, x in enumerate(sample.log)],
+            page_size=None,
+            sortable=False,
+            columns=dict(
+                index=Column.number(),
+                duration=Column.float(cell__format=lambda value, **_: f'{value:.3f}s'),
+                sql=Column(
+                    cell__value=lambda row, **_: row.sql % safe_unicode_literal(row.params) if row.params else row.sql,
+                    cell__format=lambda value, **_: format_sql(value),
+                ),
+                stack=Column(
+                    cell__format=lambda value, **_: format_html('<pre>{}</pre>', linkify(str(value))) if value else '',
+                ),
+            ),
+        )
+    else:
+        table = Table(
+            title='Sampled requests',
+            rows=samples,
+            page_size=None,
+            sortable=False,
+            columns=dict(
+                time=Column.datetime(),
+                method=Column(),
+                path=Column.link(cell__url=lambda row, **_: f'?sample={row.id}'),
+                status_code=Column.number(),
+                duration=Column.float(cell__format=lambda value, **_: f'{value:.3f}s'),
+                sql_count=Column.number(),
+                sql_duration=Column.float(cell__format=lambda value, **_: f'{value:.3f}s'),
+            ),
+        )
+
+    return table.bind(request=request).render_to_response()
+
+
 class Middleware:
     async_capable = True
     sync_capable = True
@@ -184,10 +495,14 @@ def __init__(self, get_response):
     def _setup_request(self, request):
         set_current_request(request)
         request.iommi_start_time = now()
+        request.iommi_sql_trace_sampled = False
         sql_trace = request.GET.get('_iommi_sql_trace')
 
         if sql_trace is None:
             sql_trace = get_sql_debug()
+            if sql_trace is None and should_sample_request():
+                sql_trace = SQL_DEBUG_LEVEL_WORST
+                start_sampling(request)
 
         if sql_trace == '':
             sql_trace = SQL_DEBUG_LEVEL_WORST
@@ -201,6 +516,10 @@ def _setup_request(self, request):
 
     def _process_response(self, request, response, sql_trace, old_state):
         try:
+            if request.iommi_sql_trace_sampled:
+                stop_sampling(request, response)
+                return response
+
             sql_debug_last_call(response)
 
             if '_iommi_sql_trace' not in request.GET:
@@ -267,8 +586,7 @@ def _process_response(self, request, response, sql_trace, old_state):
 
                         result.append('<br><br>By group:<br>')
 
-                        for k, group in itertools.groupby(iommi_sql_debug_log, key=lambda x: x['sql']):
-                            group = list(group)
+                        for k, group in items(group_by_fingerprint(iommi_sql_debug_log)):
                             duration = sum(x["duration"] for x in group)
                             proportion = duration / total_duration * 100
                             k = k.replace('>', '&gt;')
@@ -283,6 +601,20 @@ def _process_response(self, request, response, sql_trace, old_state):
                                 )
                             )
 
+                    repeated_queries = find_repeated_queries(iommi_sql_debug_log)
+                    if repeated_queries:
+                        result.append('<p></p>Repeated queries (possible N+1):<pre>')
+                        for x in repeated_queries:
+                            result.append(format_html('<b>{} times</b> ({}s)', x['count'], f'{x["duration"]:.3}'))
+                            if x['path']:
+                                result.append(format_html(', from <b>{}</b>', x['path']))
+                            if x['suggestion']:
+                                result.append(format_html(', try <b>{}</b>', x['suggestion']))
+                            result.append('\n')
+                            result.append(format_sql(x['fingerprint']))
+                            result.append('\n\n')
+                        result.append('</pre>')
+
                     result.append('<p></p><pre>')
 
                     for i, x in enumerate(iommi_sql_debug_log):
@@ -296,7 +628,7 @@ def _process_response(self, request, response, sql_trace, old_state):
                             result.append(f' <a href="?_iommi_sql_trace={sql_trace}&_iommi_sql_explain={i}#query_{i}">[EXPLAIN]</a>')
                         if sql_trace == SQL_DEBUG_LEVEL_ALL_WITH_STACKS:
                             result.append('\n\n')
-                            result.append(linkify(x['stack']))
+                            result.append(linkify(str(x['stack'])))
                         if i == explain_index and explain_output:
                             result.append('\n')
                             result.append('</pre>')
@@ -317,6 +649,8 @@ def __call__(self, request):
         try:
             response = self.get_response(request)
         except Exception:
+            if request.iommi_sql_trace_sampled:
+                stop_sampling(request, response=None)
             set_sql_debug(old_state)
             raise
         return self._process_response(request, response, sql_trace, old_state)
@@ -326,6 +660,8 @@ async def __acall__(self, request):
         try:
             response = await self.get_response(request)
         except Exception:
+            if request.iommi_sql_trace_sampled:
+                stop_sampling(request, response=None)
             set_sql_debug(old_state)
             raise
         return self._process_response(request, response, sql_trace, old_state)
@@ -506,9 +842,11 @@ def get_line_cached_on_request(file_name, line):
     if file_name not in request._iommi_line_cache:
         request._iommi_line_cache[file_name] = linecache.getlines(file_name)
 
-    if not request._iommi_line_cache[file_name]:
+    lines = request._iommi_line_cache[file_name]
+    # The file might have changed since the stack was captured
+    if not 0 < line <= len(lines):
         return ''
-    return request._iommi_line_cache[file_name][line - 1]
+    return lines[line - 1]
 
 
 def format_clickable_filename(file_name, line, fn, extra=None):
@@ -528,11 +866,31 @@ def format_clickable_filename(file_name, line, fn, extra=None):
     return f'  File "{file_name}", line {line}, in {fn} => {extra.strip()}'.rstrip()
 
 
-def sql_debug_format_stack_trace(frame):
+class LazyStack:
+    """
+    A captured stack trace that is only formatted (which involves reading
+    source lines from disk) when it is converted to a string.
+    """
+
+    def __init__(self, entries):
+        self.entries = entries
+        self._formatted = None
+
+    def __str__(self):
+        if self._formatted is None:
+            lines = [format_clickable_filename(file_name, line, fn, extra) for file_name, line, fn, extra in self.entries]
+            self._formatted = "\n".join(lines).rstrip()
+        return self._formatted
+
+    def __repr__(self):
+        return f'<LazyStack {len(self.entries)} frames>'
+
+
+def capture_stack(frame):
     if frame is None:
         return None
 
-    lines = []
+    entries = []
     skip_template_code = False
 
     def skip_line(frame):
@@ -567,12 +925,18 @@ def skip_line(frame):
         elif skip_template_code:
             skip_template_code = False
 
-        lines.append(format_clickable_filename(file_name, line, fn, extra))
+        entries.append((file_name, line, fn, extra))
 
         frame = frame.f_back
 
-    stack = "\n".join(lines).rstrip()
-    return stack
+    return LazyStack(entries)
+
+
+def sql_debug_format_stack_trace(frame):
+    stack = capture_stack(frame)
+    if stack is None:
+        return None
+    return str(stack)
 
 
 def sql_debug_last_call(response):
@@ -580,11 +944,9 @@ def sql_debug_last_call(response):
     if get_sql_debug() == SQL_DEBUG_LEVEL_WORST and hasattr(
         request, 'iommi_sql_debug_log'
     ):  # hasattr check because process_request might not be called in case of an early redirect
-        stacks = defaultdict(list)
-        for x in request.iommi_sql_debug_log:
-            stacks[x['sql']].append(x)
+        stacks = group_by_fingerprint(request.iommi_sql_debug_log)
 
-        highscore = sorted([(len(logs), stack_trace, logs) for stack_trace, logs in stacks.items()])
+        highscore = sorted([(len(logs), fingerprint, logs) for fingerprint, logs in stacks.items()])
         # Print the worst offenders
         number_of_offenders = getattr(settings, 'SQL_DEBUG_WORST_NUMBER_OF_OFFENDERS', 3)
         query_cutoff = getattr(settings, 'SQL_DEBUG_WORST_QUERY_CUTOFF', 4)
@@ -602,6 +964,12 @@ def sql_debug_last_call(response):
                     )
                     sql_debug('With Stack:')
                 sql_debug(logs[-1]['stack'], sql_trace=True)
+                part = next((x['part'] for x in logs if x.get('part') is not None), None)
+                if part is not None:
+                    sql_debug(f'From iommi part: {part_path(part)}')
+                    suggestion = suggest_related(logs[-1]['sql'], part)
+                    if suggestion:
+                        sql_debug(f'Suggestion: {suggestion}')
                 for x in logs[:query_cutoff]:
                     sql_debug_trace_sql(**x)
                 if len(logs) > query_cutoff:
@@ -629,8 +997,16 @@ def _execute_and_log(self, *, f, **kwargs):
             frame = sys._getframe().f_back.f_back
             while "django/db" in frame.f_code.co_filename:
                 frame = frame.f_back
+            # Looking at the locals of every frame is too expensive for sampled production requests
+            request = get_current_request()
+            sampled = getattr(request, 'iommi_sql_trace_sampled', False)
+            part = find_part_in_stack(frame) if not sampled else None
+            if sampled and monotonic() < request.iommi_sql_trace_stacks_after:
+                # Only requests slower than the threshold are kept, so don't capture stacks before that
+                frame = None
         else:
             frame = None
+            part = None
 
         start = monotonic()
         try:
@@ -639,11 +1015,13 @@ def _execute_and_log(self, *, f, **kwargs):
             stop = monotonic()
             duration = stop - start
             sql_debug_log_to_request(
-                stack=sql_debug_format_stack_trace(frame),
+                stack=capture_stack(frame),
+                part=part,
                 duration=duration,
                 rowcount=self.cursor.rowcount,
                 using=self.db.alias,
-                **kwargs,
+                # executemany has a param_list instead
+                **{'params': None, **kwargs},
             )
 
             self.db.queries_log.append(
@@ -1,5 +1,7 @@
+import itertools
 import logging
 import re
+import time
 from datetime import (
     date,
     datetime,
@@ -9,30 +11,45 @@
 import pytest
 import time_machine
 from django.contrib.auth.models import User
+from django.db import connection
 from django.http import HttpResponse
 from django.urls import path
 
 from iommi.sql_trace import (
     SQL_DEBUG_LEVEL_WORST,
+    LazyStack,
+    capture_stack,
+    clear_sampled_requests,
     colorize,
+    find_repeated_queries,
     format_clickable_filename,
     format_explain_output,
     format_sql,
+    get_line_cached_on_request,
+    get_sampled_requests,
     get_sql_debug,
+    group_by_fingerprint,
     is_explainable,
     linkify,
     no_sql_debug,
     run_explain,
     safe_unicode_literal,
+    sampled_requests_view,
     set_sql_debug,
     sql_debug_format_stack_trace,
     sql_debug_log_to_request,
     sql_debug_total_time,
     sql_debug_trace_sql,
+    sql_fingerprint,
+    suggest_related,
 )
 from iommi.struct import Struct
 from iommi.thread_locals import set_current_request
-from tests.helpers import req
+from tests.helpers import (
+    req,
+    staff_req,
+)
+from tests.models import TFoo
 
 
 def bogus_view(request):
@@ -47,9 +64,25 @@ def bogus_view_with_no_queries(request):
     return HttpResponse('unseen')
 
 
+def bulk_view(request):
+    TFoo.objects.bulk_create([TFoo(a=1, b='foo'), TFoo(a=2, b='bar')])
+    with connection.cursor() as cursor:
+        cursor.executemany(f'UPDATE {TFoo._meta.db_table} SET b = %s WHERE a = %s', [('baz', 1), ('qux', 2)])
+    return HttpResponse('unseen')
+
+
+def slow_view(request):
+    list(User.objects.filter(username='before'))
+    time.sleep(0.1)
+    list(User.objects.filter(username='after'))
+    return HttpResponse('unseen')
+
+
 urlpatterns = [
     path('', bogus_view),
     path('no_queries/', bogus_view_with_no_queries),
+    path('bulk/', bulk_view),
+    path('slow/', slow_view),
 ]
 
 
@@ -423,3 +456,243 @@ def test_format_explain_output_scales_to_actual_max_cost():
     )
     assert 'rgba(79,79,255,0.3) 100.0%' in html
     assert 'rgba(79,79,255,0.3) 50.0%' in html
+
+
+@pytest.mark.parametrize(
+    'sql, expected',
+    [
+        ('SELECT "a"."id" FROM "a" WHERE "a"."id" = %s', 'SELECT "a"."id" FROM "a" WHERE "a"."id" = ?'),
+        ("SELECT * FROM a WHERE b = 'foo' AND c = 3.5", 'SELECT * FROM a WHERE b = ? AND c = ?'),
+        ('SELECT * FROM a WHERE b IN (%s, %s, %s)', 'SELECT * FROM a WHERE b IN (...)'),
+        ('SELECT * FROM a WHERE b IN (1, 2)', 'SELECT * FROM a WHERE b IN (...)'),
+        ('SELECT * FROM a LIMIT 21', 'SELECT * FROM a LIMIT ?'),
+        ('SELECT "t1"."col2" FROM "t1"', 'SELECT "t1"."col2" FROM "t1"'),
+        ('INSERT INTO a (b, c) VALUES (%s, %s), (%s, %s)', 'INSERT INTO a (b, c) VALUES (?, ?)'),
+        ('SELECT  *\n  FROM a', 'SELECT * FROM a'),
+    ],
+)
+def test_sql_fingerprint(sql, expected):
+    assert sql_fingerprint(sql) == expected
+
+
+def test_group_by_fingerprint_is_not_only_consecutive():
+    log = [
+        dict(sql='SELECT * FROM a WHERE id = %s', duration=1),
+        dict(sql='SELECT * FROM b', duration=1),
+        dict(sql='SELECT * FROM a WHERE id IN (%s, %s)', duration=1),
+        dict(sql='SELECT * FROM a WHERE id = 7', duration=1),
+    ]
+    groups = group_by_fingerprint(log)
+    assert list(groups.keys()) == [
+        'SELECT * FROM a WHERE id = ?',
+        'SELECT * FROM b',
+        'SELECT * FROM a WHERE id IN (...)',
+    ]
+    assert groups['SELECT * FROM a WHERE id = ?'] == [log[0], log[3]]
+
+
+@pytest.mark.django_db
+def test_find_repeated_queries_attributes_to_column_and_suggests_select_related(settings):
+    from iommi import (
+        Column,
+        Table,
+    )
+    from tests.models import (
+        TBar,
+        TFoo,
+    )
+
+    settings.DEBUG = True
+    settings.SQL_DEBUG_WORST_SUSPICIOUS_CUTOFF = 3
+
+    for i in range(5):
+        TBar.objects.create(foo=TFoo.objects.create(a=i, b='b'), c=False)
+
+    request = req('get')
+    set_current_request(request)
+    set_sql_debug(SQL_DEBUG_LEVEL_WORST)
+
+    table = Table(
+        auto__model=TBar,
+        auto__include=['c'],
+        columns__foo_a=Column(cell__value=lambda row, **_: row.foo.a),
+    ).bind(request=request)
+    table.__html__()
+
+    repeated = find_repeated_queries(request.iommi_sql_debug_log)
+    assert len(repeated) == 1
+    assert repeated[0]['count'] == 5
+    assert repeated[0]['path'] == 'columns__foo_a'
+    assert repeated[0]['suggestion'] == "select_related('foo')"
+    assert repeated[0]['fingerprint'].startswith('SELECT "tests_tfoo"."id"')
+
+
+@pytest.mark.django_db
+def test_suggest_related():
+    from iommi import Table
+    from tests.models import (
+        TBar,
+        TBaz,
+        TFoo,
+    )
+
+    bar_table = Table(auto__model=TBar).bind(request=req('get'))
+    assert suggest_related('SELECT "tests_tfoo"."id" FROM "tests_tfoo" WHERE "tests_tfoo"."id" = %s', bar_table.columns.foo) == "select_related('foo')"
+    assert suggest_related('SELECT "tests_tfoo"."id" FROM "tests_tfoo"', bar_table) == "select_related('foo')"
+    assert suggest_related('SELECT "auth_user"."id" FROM "auth_user"', bar_table) is None
+    assert suggest_related('SELECT "tests_tfoo"."id" FROM "tests_tfoo"', None) is None
+
+    foo_table = Table(auto__model=TFoo).bind(request=req('get'))
+    assert suggest_related('SELECT "tests_tbar"."id" FROM "tests_tbar" WHERE "tests_tbar"."foo_id" = %s', foo_table) == "prefetch_related('tbar_set')"
+
+    baz_table = Table(auto__model=TBaz).bind(request=req('get'))
+    assert suggest_related('SELECT "tests_tfoo"."id" FROM "tests_tfoo" INNER JOIN "tests_tbaz_foo"', baz_table.columns.foo) == "prefetch_related('foo')"
+
+
+@pytest.mark.django_db
+def test_middleware_shows_repeated_queries(settings, client):
+    settings.ROOT_URLCONF = __name__
+    settings.DEBUG = True
+    settings.SQL_DEBUG = SQL_DEBUG_LEVEL_WORST
+    settings.SQL_DEBUG_WORST_SUSPICIOUS_CUTOFF = 3
+
+    response = client.get('/?_iommi_sql_trace')
+    content = response.content.decode()
+    assert 'Repeated queries (possible N+1):' in content
+    assert '<b>4 times</b>' in content
+
+
+def test_capture_stack_is_formatted_lazily(monkeypatch):
+    frame = Struct(f_lineno=1, f_back=None, f_locals={}, f_code=Struct(co_name='f', co_filename='foo.py'))
+
+    calls = []
+
+    def format_clickable_filename_spy(*args):
+        calls.append(args)
+        return 'formatted'
+
+    monkeypatch.setattr('iommi.sql_trace.format_clickable_filename', format_clickable_filename_spy)
+
+    stack = capture_stack(frame)
+    assert isinstance(stack, LazyStack)
+    assert stack.entries == [('foo.py', 1, 'f', '')]
+    assert calls == []
+
+    assert str(stack) == 'formatted'
+    assert str(stack) == 'formatted'
+    assert calls == [('foo.py', 1, 'f', '')]
+
+    assert capture_stack(None) is None
+
+
+def test_get_line_cached_on_request_out_of_range():
+    set_current_request(req('get'))
+    assert get_line_cached_on_request(__file__, 100_000) == ''
+    set_current_request(None)
+
+
+@pytest.fixture
+def sampling(settings):
+    settings.ROOT_URLCONF = __name__
+    settings.DEBUG = False
+    settings.SQL_DEBUG = None
+    set_sql_debug(None)
+    clear_sampled_requests()
+    yield settings
+    clear_sampled_requests()
+
+
+@pytest.mark.django_db
+def test_sampling_off_by_default(sampling, client):
+    client.get('/')
+    assert get_sampled_requests() == []
+
+
+@pytest.mark.django_db
+def test_sampling_every_n(sampling, client, monkeypatch, caplog):
+    caplog.set_level(logging.DEBUG)
+    monkeypatch.setattr('iommi.sql_trace._sample_counter', itertools.count())
+    sampling.SQL_DEBUG_SAMPLE_EVERY = 2
+
+    for _ in range(4):
+        client.get('/')
+
+    samples = get_sampled_requests()
+    assert len(samples) == 2
+    sample = samples[0]
+    assert sample.path == '/'
+    assert sample.method == 'GET'
+    assert sample.status_code == 200
+    assert sample.sql_count == 4
+    assert isinstance(sample.log[0]['stack'], LazyStack)
+    assert 'sql_trace__tests.py' in str(sample.log[0]['stack'])
+    assert samples[0].id > samples[1].id
+
+    # Sampling must not log to the console or leave the debug cursor on
+    assert '------ 4 times: -------' not in caplog.text
+    from django.db import connection
+
+    assert not connection.force_debug_cursor
+    assert get_sql_debug() is None
+
+
+@pytest.mark.django_db
+def test_sampling_slow_threshold_and_keep(sampling, client):
+    sampling.SQL_DEBUG_SAMPLE_SLOW_THRESHOLD = 1000
+    client.get('/')
+    assert get_sampled_requests() == []
+
+    sampling.SQL_DEBUG_SAMPLE_SLOW_THRESHOLD = 0.0
+    sampling.SQL_DEBUG_SAMPLE_KEEP = 2
+    client.get('/')
+    client.get('/no_queries/')
+    client.get('/no_queries/?foo')
+    assert [x.path for x in get_sampled_requests()] == ['/no_queries/?foo', '/no_queries/']
+
+
+@pytest.mark.django_db
+def test_sampled_requests_view(sampling, client):
+    from django.core.exceptions import PermissionDenied
+
+    sampling.SQL_DEBUG_SAMPLE_EVERY = 1
+    client.get('/')
+    sample = get_sampled_requests()[0]
+
+    with pytest.raises(PermissionDenied):
+        sampled_requests_view(req('get'))
+
+    content = sampled_requests_view(staff_req('get')).content.decode()
+    assert f'href="?sample={sample.id}"' in content
+    assert '<td class="rj">4</td>' in content
+
+    content = sampled_requests_view(staff_req('get', sample=str(sample.id))).content.decode()
+    assert 'SELECT' in content
+    assert 'sql_trace__tests.py' in content
+
+    from django.http import Http404
+
+    with pytest.raises(Http404):
+        sampled_requests_view(staff_req('get', sample='0'))
+
+
+@pytest.mark.django_db
+def test_sampled_requests_view_executemany(sampling, client):
+    sampling.SQL_DEBUG_SAMPLE_EVERY = 1
+    client.get('/bulk/')
+    sample = get_sampled_requests()[0]
+    assert sample.log[-1]['params'] is None
+    assert sample.log[-1]['param_list'] == [('baz', 1), ('qux', 2)]
+
+    content = sampled_requests_view(staff_req('get', sample=str(sample.id))).content.decode()
+    assert 'INSERT' in content
+    assert 'UPDATE' in content
+
+
+@pytest.mark.django_db
+def test_sampling_slow_threshold_captures_stacks_after_the_threshold(sampling, client):
+    sampling.SQL_DEBUG_SAMPLE_SLOW_THRESHOLD = 0.05
+    client.get('/slow/')
+    before, after = get_sampled_requests()[0].log
+    assert 'before' in before['params']
+    assert before['stack'] is None
+    assert 'sql_trace__tests.py' in str(after['stack'])
@@ -0,0 +1,64 @@
+import re
+from uuid import uuid4
+
+from django.utils.safestring import mark_safe
+
+from iommi.concurrent_prefetch import in_atomic_block
+from iommi.part_timing import part_timings_for_request
+
+DEFERRED_MARKER = '<!--iommi-deferred-{}-->'
+DEFERRED_MARKER_RE = re.compile('(' + DEFERRED_MARKER.format('[0-9a-f]{32}') + ')')
+
+
+def can_defer_html(part):
+    """
+    True if the html of `part` can be left out of the rendering and streamed
+    later instead. This is only the case for the main rendering of
+    `render_to_response`, and not inside a part that is stored in the
+    fragment cache.
+
+    The deferred html is produced after the view has returned, so nothing is
+    deferred when the request is in a transaction (like with
+    `ATOMIC_REQUESTS`), or when the SQL trace or the part timing would miss
+    the queries.
+    """
+    root = part.iommi_root()
+    if root._iommi_deferred_html is None:
+        return False
+    if in_atomic_block() or is_traced(part.get_request()):
+        return False
+    for fragment_cache in root._iommi_fragment_cache_recorders or []:
+        if fragment_cache.part is part or fragment_cache.is_ancestor_of(part):
+            return False
+    return True
+
+
+def is_traced(request):
+    if request is None:
+        return False
+    if '_iommi_sql_trace' in request.GET or getattr(request, 'iommi_sql_trace_sampled', False):
+        return True
+    return part_timings_for_request(request) is not None
+
+
+def defer_html(part, chunks):
+    """
+    Put a marker in the rendered html of the page where the html from the
+    iterable `chunks` will be streamed. Check `can_defer_html` first.
+    """
+    marker = DEFERRED_MARKER.format(uuid4().hex)
+    part.iommi_root()._iommi_deferred_html[marker] = chunks
+    return mark_safe(marker)
+
+
+def streaming_content(html, deferred_html):
+    """
+    Yield the rendered page with the deferred html streamed in place of the
+    markers.
+    """
+    for piece in DEFERRED_MARKER_RE.split(html):
+        chunks = deferred_html.get(piece)
+        if chunks is None:
+            yield piece
+        else:
+            yield from chunks
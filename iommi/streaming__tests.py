@@ -0,0 +1,139 @@
+import json
+
+import pytest
+from django.core.cache import cache
+from django.db import transaction
+from django.http import StreamingHttpResponse
+
+from docs.models import (
+    Album,
+    Artist,
+)
+from iommi import (
+    Column,
+    Page,
+    Table,
+    html,
+)
+from iommi.part_timing import PartTimings
+from iommi.struct import Struct
+from tests.helpers import req
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    cache.clear()
+    yield
+    cache.clear()
+
+
+def rows_table(**kwargs):
+    return Table(
+        columns__a=Column(),
+        rows=[Struct(pk=i, a=i) for i in range(250)],
+        **{'page_size': None, **kwargs},
+    )
+
+
+def content_of(response):
+    if isinstance(response, StreamingHttpResponse):
+        return b''.join(response.streaming_content).decode()
+    return response.content.decode()
+
+
+def test_streamed_table():
+    expected = rows_table().bind(request=req('get')).render_to_response().content.decode()
+
+    response = rows_table(stream=True).bind(request=req('get')).render_to_response()
+    assert isinstance(response, StreamingHttpResponse)
+    chunks = [chunk.decode() for chunk in response.streaming_content]
+
+    # The page up to the rows is sent first, then the rows in chunks
+    assert '<table' in chunks[0]
+    assert 'data-pk="0"' not in chunks[0]
+    assert 'data-pk="0"' in chunks[1]
+    assert 'data-pk="100"' not in chunks[1]
+    assert 'data-pk="100"' in chunks[2]
+    assert ''.join(chunks) == expected
+
+
+def test_streamed_table_in_page():
+    page = Page(
+        parts__table=rows_table(stream=True),
+        parts__after=html.div('after the table'),
+    )
+    content = content_of(page.bind(request=req('get')).render_to_response())
+    assert content.index('data-pk="249"') < content.index('after the table')
+
+
+def test_streamed_table_paginated():
+    response = rows_table(stream=True, page_size=10).bind(request=req('get', page='2')).render_to_response()
+    content = content_of(response)
+    assert 'data-pk="10"' in content
+    assert 'data-pk="9"' not in content
+    assert 'data-pk="20"' not in content
+
+
+@pytest.mark.django_db(transaction=True)
+def test_streamed_table_queryset(django_assert_num_queries):
+    artist = Artist.objects.create(name='Black Sabbath')
+    for i in range(3):
+        Album.objects.create(name=f'Album {i}', artist=artist)
+
+    response = Table(auto__model=Album, page_size=None, stream=True).bind(request=req('get')).render_to_response()
+    # The rows are fetched while streaming: the albums and the prefetched genres
+    with django_assert_num_queries(2):
+        content = content_of(response)
+    assert 'Album 2' in content
+
+
+@pytest.mark.django_db(transaction=True)
+def test_stream_is_not_used_in_transaction():
+    with transaction.atomic():
+        response = rows_table(stream=True).bind(request=req('get')).render_to_response()
+    assert not isinstance(response, StreamingHttpResponse)
+    assert 'data-pk="249"' in response.content.decode()
+
+
+def test_stream_is_not_used_when_traced():
+    request = req('get', _iommi_sql_trace='')
+    assert not isinstance(rows_table(stream=True).bind(request=request).render_to_response(), StreamingHttpResponse)
+
+    request = req('get')
+    request.iommi_part_timings = PartTimings()
+    assert not isinstance(rows_table(stream=True).bind(request=request).render_to_response(), StreamingHttpResponse)
+
+
+def test_stream_is_not_used_for_endpoints():
+    response = rows_table(stream=True).bind(request=req('get', **{'/endpoints/tbody': ''})).render_to_response()
+    assert not isinstance(response, StreamingHttpResponse)
+    assert 'data-pk="249"' in json.loads(response.content)['html']
+
+
+def test_stream_is_not_used_inside_fragment_cache():
+    def page():
+        return Page(parts__table=rows_table(stream=True, cache=True))
+
+    first = page().bind(request=req('get')).render_to_response()
+    assert not isinstance(first, StreamingHttpResponse)
+    second = page().bind(request=req('get')).render_to_response()
+    assert second.content == first.content
+    assert 'data-pk="249"' in second.content.decode()
+
+
+def test_stream_with_row_cache():
+    def table(rows):
+        return Table(
+            columns__a=Column(),
+            rows=rows,
+            page_size=None,
+            stream=True,
+            row__cache__version='version',
+        )
+
+    rows = [Struct(pk=i, a=i, version=1) for i in range(150)]
+    first = content_of(table(rows).bind(request=req('get')).render_to_response())
+
+    rows = [Struct(pk=i, a='changed' if i == 120 else i, version=2 if i == 120 else 1) for i in range(150)]
+    second = content_of(table(rows).bind(request=req('get')).render_to_response())
+    assert second == first.replace('<td>120</td>', '<td>changed</td>')
@@ -1,4 +1,7 @@
+import copy
 import csv
+import json
+import tempfile
 from collections.abc import Callable, Iterable
 from datetime import (
     UTC,
@@ -12,7 +15,11 @@
 )
 from functools import total_ordering
 from io import StringIO
-from itertools import groupby
+from itertools import (
+    batched,
+    chain,
+    groupby,
+)
 from math import ceil
 from typing import (
     Any,
@@ -20,20 +27,28 @@
 from urllib.parse import quote_plus
 
 from django.core.exceptions import (
+    EmptyResultSet,
     FieldDoesNotExist,
     ImproperlyConfigured,
 )
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db.models import (
     AutoField,
     BooleanField,
+    Count,
     ManyToManyField,
+    Max,
     Model,
     QuerySet,
 )
+from django.db.models.manager import BaseManager
 from django.http import (
     FileResponse,
     HttpResponse,
+    HttpResponseBadRequest,
+    HttpResponseNotFound,
     HttpResponseRedirect,
+    StreamingHttpResponse,
 )
 from django.utils import timezone
 from django.utils.encoding import smart_str
@@ -55,8 +70,10 @@
     Actions,
     group_actions,
 )
+from iommi.async_render import afetch
 from iommi.attrs import (
     Attrs,
+    CompiledAttrs,
     evaluate_attrs,
     render_attrs,
 )
@@ -64,6 +81,7 @@
     MISSING,
     NOT_BOUND_MESSAGE,
     build_as_view_wrapper,
+    build_async_as_view_wrapper,
     capitalize,
     get_display_name,
     items,
@@ -71,6 +89,8 @@
     model_and_rows,
     values,
 )
+from iommi.concurrent_prefetch import fetch
+from iommi.conditional_get import get_conditional_get_config
 from iommi.declarative import declarative
 from iommi.declarative.dispatch import dispatch
 from iommi.declarative.namespace import (
@@ -86,9 +106,16 @@
 )
 from iommi.evaluate import (
     evaluate,
+    evaluate_as_needed,
     evaluate_member,
+    evaluate_members,
     evaluate_strict,
 )
+from iommi.export_jobs import (
+    get_job_state,
+    open_job_file,
+    start_export_job,
+)
 from iommi.form import (
     Field,
     Form,
@@ -101,6 +128,10 @@
     build_and_bind_h_tag,
     html,
 )
+from iommi.fragment_cache import (
+    is_fragment_cache_hit,
+    render_rows_with_cache,
+)
 from iommi.from_model import (
     AutoConfig,
     NoRegisteredSearchFieldException,
@@ -109,6 +140,7 @@
     member_from_model,
     related_choices_from_model_field,
 )
+from iommi.html_buffer import HtmlBuffer
 from iommi.member import (
     bind_member,
     bind_members,
@@ -119,7 +151,12 @@
     Part,
 )
 from iommi.panel import Panel
+from iommi.parallel_export import (
+    can_format_in_processes,
+    format_in_processes,
+)
 from iommi.part import render_root
+from iommi.part_timing import timed_generator
 from iommi.query import (
     Q_OPERATOR_BY_QUERY_OPERATOR,
     Query,
@@ -142,6 +179,10 @@
     LAST,
     sort_after,
 )
+from iommi.streaming import (
+    can_defer_html,
+    defer_html,
+)
 from iommi.struct import (
     Struct,
     merged,
@@ -149,6 +190,17 @@
 from iommi.traversable import (
     Traversable,
 )
+from iommi.typed_export import (
+    PARQUET_BATCH_SIZE,
+    PARQUET_CONTENT_TYPE,
+    XLSX_CONTENT_TYPE,
+    Workbook,
+    batched_columns,
+    pyarrow,
+    typed_value,
+    write_parquet,
+    write_xlsx,
+)
 
 from .declarative.util import strip_prefix
 from .from_model import base_defaults_factory
@@ -189,6 +241,9 @@ def register_related_multiple_column_factory(django_field_class, *, shortcut_nam
 
 DEFAULT_PAGE_SIZE = 16
 
+STREAM_CHUNK_SIZE = 2000
+STREAM_HTML_CHUNK_SIZE = 100
+
 
 def params_of_request(request):
     if request is None:
@@ -502,6 +557,7 @@ def on_refine_done(self):
         self.is_sorting: bool | None = None
         self.sort_direction: str | None = None
         self.table = None
+        self._iommi_compiled_cell_attrs = None
         super(Column, self).on_refine_done()
 
     def __html__(self, *, render=None):
@@ -1139,6 +1195,8 @@ def own_evaluate_parameters(self):
 
 
 class CellConfig(TransientFragment, Tag):
+    __slots__ = ('url', 'url_title', 'value', 'contents', 'format', 'link')
+
     def __init__(self, *,
             url: str,
             url_title: str,
@@ -1161,6 +1219,9 @@ def __init__(self, *,
 
 
 class Cell(CellConfig):
+    # A cell is made for each column of each row, so it's kept small
+    __slots__ = ('_name', '_parent', 'iommi_style', 'column', 'cells', 'table', 'row', '_evaluate_parameters')
+
     @dispatch
     def __init__(self, cells: 'Cells', column, **kwargs):
         kwargs = setdefaults_path(
@@ -1174,24 +1235,27 @@ def __init__(self, cells: 'Cells', column, **kwargs):
         self._parent = cells
         self._is_bound = True
         self.iommi_style = None
-        self._unapplied_config = {}
 
         self.column = column
         self.cells = cells
         self.table = cells.get_table()
         self.row = cells.row
-        self._evaluate_parameters = merged(
-            self.column.iommi_evaluate_parameters(),
-            cells=self.cells,
-            column=self.column,
-            row=self.row,
-            bound_cell=self,
-        )
+        self._evaluate_parameters = {
+            **column.iommi_evaluate_parameters(),
+            'cells': cells,
+            'column': column,
+            'row': self.row,
+            'bound_cell': self,
+        }
 
         self.value = evaluate_strict(self.value, **self._evaluate_parameters)
         self._evaluate_parameters['value'] = self.value
         self.url = evaluate_strict(self.url, **self._evaluate_parameters)
-        self.attrs = evaluate_attrs(self, **self._evaluate_parameters)
+        # The attrs are the same for all cells of a column, so they are compiled once per column
+        compiled_attrs = column._iommi_compiled_cell_attrs
+        if compiled_attrs is None or not compiled_attrs.matches(column.cell.attrs):
+            compiled_attrs = column._iommi_compiled_cell_attrs = CompiledAttrs(self.attrs, source=column.cell.attrs)
+        self.attrs = compiled_attrs.evaluate(self, self._evaluate_parameters)
         self.url_title = evaluate_strict(self.url_title, **self._evaluate_parameters)
         self.tag = evaluate_strict(self.tag, **self._evaluate_parameters)
 
@@ -1203,15 +1267,23 @@ def iommi_evaluate_parameters(self):
         return self._evaluate_parameters
 
     def __html__(self):
+        buffer = HtmlBuffer()
+        self.write_html(buffer)
+        return buffer.__html__()
+
+    def write_html(self, buffer):
         cell__template = self.column.cell.template
         if cell__template:
             context = self._evaluate_parameters
-            return render_template(self.table.get_request(), cell__template, context)
+            buffer.write_safe(render_template(self.table.get_request(), cell__template, context))
+            return
 
         if self.tag:
-            return format_html('<{}{}>{}</{}>', self.tag, self.attrs, self.render_cell_contents(), self.tag)
+            buffer.write_open_tag(self.tag, self.attrs)
+            buffer.write(self.render_cell_contents())
+            buffer.write_close_tag(self.tag)
         else:
-            return format_html('{}', self.render_cell_contents())
+            buffer.write(self.render_cell_contents())
 
     def render_cell_contents(self):
         cell_contents = self.render_formatted()
@@ -1261,6 +1333,8 @@ class Cells(Traversable, Tag):
     extra_evaluated: dict[str, Any] = Refinable()
     cell_class: type[Cell] = Refinable()
     layout: Panel | None = EvaluatedRefinable()
+    # Used by the table when rendering the rows, see RowConfig
+    cache: Namespace | bool | None = Refinable()
 
     class Meta:
         cell_class = Cell
@@ -1271,6 +1345,37 @@ def __init__(self, row, row_index, **kwargs):
         self.row: Any = row
         self.row_index = row_index
 
+    def bind_row(self, *, parent, row, row_index):
+        """
+        Bind a copy of these refine done `Cells` for one row. This is a
+        cheaper `bind` for the rows of a table: the `Cells` is refine done
+        once for all rows, and only the members that are callables are
+        evaluated.
+        """
+        assert self.is_refine_done
+        result = copy.copy(self)
+        result.row = row
+        result.row_index = row_index
+        if parent._iommi_part_timings is not None:
+            return result.bind(parent=parent)
+
+        result._declared = self
+        result._parent = parent
+        result._bound_members = Struct()
+        result._is_bound = True
+        evaluate_parameters = {
+            **parent.iommi_evaluate_parameters(),
+            **result.own_evaluate_parameters(),
+            'traversable': result,
+        }
+        result._evaluate_parameters = evaluate_parameters
+
+        result.on_bind()
+        evaluate_members(result, **evaluate_parameters)
+        result.attrs = evaluate_attrs(result, **evaluate_parameters)
+        result.extra_evaluated = Struct(evaluate_as_needed(result.extra_evaluated or {}, evaluate_parameters))
+        return result
+
     def on_bind(self) -> None:
         super(Cells, self).on_bind()
         if self.layout is not None:
@@ -1305,12 +1410,20 @@ def __html__(self):
         return self.render()
 
     def render(self):
-        return TransientFragment(
-            tag=self.tag,
-            attrs=self.attrs,
-            children=dict(text=mark_safe('\n'.join(bound_cell.__html__() for bound_cell in self))),
-            parent=self,
-        ).__html__()
+        # All the cells of the row are written to one buffer
+        buffer = HtmlBuffer()
+        if self.tag:
+            buffer.write_open_tag(self.tag, render_attrs(self.attrs))
+        for i, bound_cell in enumerate(self):
+            if i:
+                buffer.write_safe('\n')
+            if type(bound_cell).__html__ is Cell.__html__:
+                bound_cell.write_html(buffer)
+            else:
+                buffer.write(bound_cell.__html__())
+        if self.tag:
+            buffer.write_close_tag(self.tag)
+        return buffer.__html__()
 
     def __str__(self):
         return self.__html__()
@@ -1399,6 +1512,7 @@ class RowConfig(RefinableObject, Tag):
     extra: dict[str, Any] = Refinable()
     extra_evaluated: dict[str, Any] = Refinable()
     layout: Panel | None = SpecialEvaluatedRefinable()
+    cache: Namespace | bool | None = Refinable()
 
     def refine_done(self, parent=None):
         result = super(RowConfig, self).refine_done(parent=parent)
@@ -1419,6 +1533,18 @@ class ColumnHeader:
     read the docs for :doc:`HeaderConfig`.
     """
 
+    __slots__ = (
+        'table',
+        'display_name',
+        'template',
+        'url',
+        'column',
+        'number_of_columns_in_group',
+        'index_in_group',
+        'attrs',
+        '_name',
+    )
+
     class Meta:
         attrs = EMPTY
 
@@ -1562,7 +1688,9 @@ class ConfirmPage(Page):
     return HttpResponse(render_root(part=p))
 
 
-def paginator__count(rows, **_):
+def paginator__count(rows, table=None, **_):
+    if table is not None and table._iommi_prefetched_count is not None:
+        return table._iommi_prefetched_count
     if isinstance(rows, QuerySet):
         return rows.count()
     try:
@@ -1773,17 +1901,28 @@ def endpoint__tbody(table, **_):
     }
 
 
-def endpoint__csv(table, **_):
+def report_name_for(table, column):
+    if table.extra.get('report_columns_all', False):
+        return column.extra_evaluated.get('report_name', column.iommi_name())
+    return column.extra_evaluated.get('report_name')
 
-    report_columns_all = table.extra.get('report_columns_all', False)
 
-    def report_name_for(c):
-        if report_columns_all:
-            return c.extra_evaluated.get('report_name', c.iommi_name())
-        return c.extra_evaluated.get('report_name')
+def has_report(table):
+    """
+    If a bound table has a report name and at least one report column. The
+    typed export endpoints are on for every table, so they answer 404 for a
+    table without a report.
+    """
+    return 'report_name' in table.extra_evaluated and any(report_name_for(table, c) for c in values(table.columns))
 
-    columns = [c for c in values(table.columns) if report_name_for(c)]
-    csv_safe_column_indexes = {i for i, c in enumerate(values(table.columns)) if 'csv_whitelist' in c.extra}
+
+def report_columns(table):
+    """
+    The columns in the reports of a bound table, and the header for each
+    column. These are the columns with `extra_evaluated__report_name`, or all
+    columns with `extra__report_columns_all=True` on the table.
+    """
+    columns = [c for c in values(table.columns) if report_name_for(table, c)]
     assert columns, (
         'To get CSV output you must specify at least one column with extra_evaluated__report_name, '
         'or set extra__report_columns_all=True on the table'
@@ -1791,9 +1930,33 @@ def report_name_for(c):
     assert (
         'report_name' in table.extra_evaluated
     ), 'To get CSV output you must specify extra_evaluated__report_name on the table'
-    filename = table.extra_evaluated.report_name + '.csv'
+    return columns, [report_name_for(table, c) for c in columns]
+
+
+def report_cell_value(cells, column):
+    value = Cell(cells, column, parent=cells).value
+    return column.extra_evaluated.get('report_value', value)
 
-    header = [report_name_for(c) for c in columns]
+
+def report_rows(columns, cells_iterable):
+    """
+    Yield a list with the report value of each of `columns` for each `Cells`
+    of an iterable of cells.
+    """
+    for cells in cells_iterable:
+        if isinstance(cells, Cells):
+            yield [report_cell_value(cells, column) for column in columns]
+
+
+def csv_report(table):
+    """
+    What is needed to write the CSV report of a bound table: the `filename`,
+    the `header` line, and `format_rows`, that yields a line for each `Cells`
+    of an iterable of cells.
+    """
+    columns, header = report_columns(table)
+    csv_safe_column_indexes = {i for i, c in enumerate(values(table.columns)) if 'csv_whitelist' in c.extra}
+    filename = table.extra_evaluated.report_name + '.csv'
 
     def smart_text2(s):
         if s is None:
@@ -1814,44 +1977,299 @@ def safe_csv_value(value):
         else:
             return value
 
-    def cell_value(cells, bound_column):
-        value = Cell(cells, bound_column, parent=cells).value
-        return bound_column.extra_evaluated.get('report_value', value)
-
-    def rows():
-        for cells in table.cells_for_rows(paginate=False):
-            if isinstance(cells, Cells):
-                yield [cell_value(cells, bound_column) for bound_column in columns]
-
-    def write_csv_row(writer, row):
-        row_strings = [smart_text2(value) for value in row]
-        safe_row = [v if i in csv_safe_column_indexes else safe_csv_value(v) for i, v in enumerate(row_strings)]
-        writer.writerow(safe_row)
-
     csv_writer_kwargs = table.extra_evaluated.get('csv_writer_kwargs', {})
 
+    def format_rows(cells_iterable):
+        f = StringIO()
+        writer = csv.writer(f, **csv_writer_kwargs)
+        for row in report_rows(columns, cells_iterable):
+            row_strings = [smart_text2(value) for value in row]
+            writer.writerow(
+                [v if i in csv_safe_column_indexes else safe_csv_value(v) for i, v in enumerate(row_strings)]
+            )
+            yield f.getvalue()
+            f.seek(0)
+            f.truncate()
+
     f = StringIO()
-    writer = csv.writer(f, **csv_writer_kwargs)
-    writer.writerow(header)
-    for row in rows():
-        write_csv_row(writer, row)
+    csv.writer(f, **csv_writer_kwargs).writerow(header)
+
+    return Struct(
+        filename=filename,
+        header=f.getvalue(),
+        format_rows=format_rows,
+    )
 
-    response = FileResponse(f.getvalue(), 'text/csv')
 
+def set_attachment_headers(response, filename):
     # RFC 2183, RFC 2184
     response['Content-Disposition'] = smart_str(
         "attachment; filename*=UTF-8''{value}".format(value=quote_plus(filename))
     )
     response['Last-Modified'] = datetime.now(UTC).strftime('%a, %d %b %Y %H:%M:%S GMT')
+
+
+def endpoint__csv(table, **_):
+    report = csv_report(table)
+
+    report_processes = table.extra.get('report_processes')
+    if report_processes and can_format_in_processes(table.sorted_and_filtered_rows):
+
+        def format_rows(queryset, start_index):
+            return ''.join(report.format_rows(table.stream_cells_for_rows(rows=queryset, start_index=start_index)))
+
+        content = chain(
+            [report.header],
+            format_in_processes(table.sorted_and_filtered_rows, format_rows, processes=report_processes),
+        )
+    else:
+        content = report.header + ''.join(report.format_rows(table.cells_for_rows(paginate=False)))
+
+    response = FileResponse(content, 'text/csv')
+    set_attachment_headers(response, report.filename)
+    return response
+
+
+def endpoint__csv_job(table, **_):
+    report = csv_report(table)
+    return start_export_job(
+        table,
+        filename=report.filename,
+        content_type='text/csv',
+        header=report.header,
+        rows=report.format_rows(table.stream_cells_for_rows()),
+    )
+
+
+def endpoint__xlsx(table, **_):
+    if Workbook is None:
+        return HttpResponse('You must `pip install openpyxl` to get XLSX output', status=501)
+    if not has_report(table):
+        return HttpResponseNotFound('This table has no XLSX output')
+
+    columns, header = report_columns(table)
+    f = tempfile.TemporaryFile()
+    write_xlsx(
+        f,
+        title=table.extra_evaluated.report_name,
+        header=header,
+        rows=report_rows(columns, table.stream_cells_for_rows()),
+        formula_column_indexes={i for i, c in enumerate(columns) if 'csv_whitelist' in c.extra},
+    )
+    f.seek(0)
+    response = FileResponse(f, content_type=XLSX_CONTENT_TYPE)
+    set_attachment_headers(response, table.extra_evaluated.report_name + '.xlsx')
     return response
 
 
+def values_list_attrs(table, columns):
+    """
+    The `values_list` field paths that give the report values of `columns`, or
+    None if some column needs the row objects. That is the case unless the
+    column has the default `cell__value` and no `report_value`, and its
+    `attr` is a path to a field that isn't a relation.
+    """
+    rows = table.sorted_and_filtered_rows
+    if not isinstance(rows, QuerySet) or table.preprocess_rows is not Table.preprocess_rows:
+        return None
+    attrs = []
+    for column in columns:
+        if (
+            column.cell.value is not default_cell__value
+            or 'report_value' in column.extra_evaluated
+            or not isinstance(column.attr, str)
+        ):
+            return None
+        model = rows.model
+        *relations, field_name = column.attr.split('__')
+        try:
+            for name in relations:
+                field = model._meta.get_field(name)
+                if not field.many_to_one and not field.one_to_one:
+                    return None
+                model = field.related_model
+            if model._meta.get_field(field_name).is_relation:
+                return None
+        except FieldDoesNotExist:
+            return None
+        attrs.append(column.attr)
+    return attrs
+
+
+def endpoint__parquet(table, **_):
+    if pyarrow is None:
+        return HttpResponse('You must `pip install pyarrow` to get Parquet output', status=501)
+    if not has_report(table):
+        return HttpResponseNotFound('This table has no Parquet output')
+
+    columns, header = report_columns(table)
+    attrs = values_list_attrs(table, columns)
+    if attrs is not None:
+        # Straight from the database into the columns, without rows or cells
+        rows = table.sorted_and_filtered_rows.values_list(*attrs).iterator(chunk_size=PARQUET_BATCH_SIZE)
+    else:
+        rows = (
+            [typed_value(value) for value in row] for row in report_rows(columns, table.stream_cells_for_rows())
+        )
+
+    f = tempfile.TemporaryFile()
+    write_parquet(f, names=header, column_batches=batched_columns(rows, PARQUET_BATCH_SIZE))
+    f.seek(0)
+    response = FileResponse(f, content_type=PARQUET_CONTENT_TYPE)
+    set_attachment_headers(response, table.extra_evaluated.report_name + '.parquet')
+    return response
+
+
+def endpoint__job_progress(table, value, **_):
+    state = get_job_state(table, value)
+    if state is None:
+        return HttpResponseNotFound('Unknown export job')
+    return {
+        'rows_written': state['rows_written'],
+        'total': state['total'],
+        'done': state['done'],
+        'error': state['error'],
+    }
+
+
+def endpoint__job_download(table, value, **_):
+    state = get_job_state(table, value)
+    if state is None or not state['done']:
+        return HttpResponseNotFound('Unknown export job')
+    response = FileResponse(open_job_file(table, state), content_type=state['content_type'])
+    set_attachment_headers(response, state['filename'])
+    return response
+
+
+def json_columns(table, value):
+    """
+    The columns for the json endpoints: the comma separated column names in
+    `value`, or all rendered columns with an `attr`. Names of other columns
+    give `None`, so columns that aren't rendered for the user are not shown.
+    """
+    available = {name: c for name, c in items(table.columns) if c.render_column and c.attr is not None}
+    if not value:
+        return list(values(available))
+    names = [name.strip() for name in value.split(',') if name.strip()]
+    return [available.get(name) for name in names]
+
+
+def default_json_value(value):
+    if isinstance(value, BaseManager):
+        value = value.all()
+    if isinstance(value, QuerySet):
+        return [x.pk for x in value]
+    if isinstance(value, Model):
+        return value.pk
+    return value
+
+
+def json_cell_value(cells, column):
+    # Only the value, without the attrs, url and formatting of a Cell
+    evaluate_parameters = merged(
+        column.iommi_evaluate_parameters(),
+        cells=cells,
+        column=column,
+        row=cells.row,
+    )
+    value = evaluate_strict(column.cell.value, **evaluate_parameters)
+    json_value = column.extra.get('json_value')
+    if json_value is not None:
+        return evaluate_strict(json_value, value=value, **evaluate_parameters)
+    return default_json_value(value)
+
+
+def json_rows(columns, cells_iterator):
+    for cells in cells_iterator:
+        if isinstance(cells, Cells):
+            yield {c._name: json_cell_value(cells, c) for c in columns}
+
+
+def ndjson_lines(columns, cells_iterator):
+    for row in json_rows(columns, cells_iterator):
+        yield json.dumps(row, cls=DjangoJSONEncoder) + '\n'
+
+
+def unknown_columns_response(value):
+    return HttpResponseBadRequest(f'Unknown columns: {value}')
+
+
+def endpoint__json(table, value, **_):
+    columns = json_columns(table, value)
+    if None in columns:
+        return unknown_columns_response(value)
+
+    paginator = table.parts.page
+    return {
+        'columns': [c._name for c in columns],
+        'rows': list(json_rows(columns, table.cells_for_rows())),
+        'page': paginator.page,
+        'number_of_pages': paginator.number_of_pages,
+        'count': paginator.count,
+    }
+
+
+def ndjson_rows(table):
+    """
+    The rows for the ndjson endpoint: the first `extra__ndjson_max_rows` of
+    the sorted and filtered rows if that is set, otherwise the rows of the
+    current page, which is all of them for an unpaginated table.
+    """
+    max_rows = table.extra.get('ndjson_max_rows')
+    if max_rows is not None:
+        return table.sorted_and_filtered_rows[:max_rows]
+    return table.get_visible_rows()
+
+
+def endpoint__ndjson(table, value, **_):
+    columns = json_columns(table, value)
+    if None in columns:
+        return unknown_columns_response(value)
+
+    rows = ndjson_rows(table)
+    report_processes = table.extra.get('report_processes')
+    if report_processes and can_format_in_processes(rows):
+
+        def format_rows(queryset, start_index):
+            return ''.join(ndjson_lines(columns, table.stream_cells_for_rows(rows=queryset, start_index=start_index)))
+
+        content = format_in_processes(rows, format_rows, processes=report_processes)
+    else:
+        content = ndjson_lines(columns, table.stream_cells_for_rows(rows=rows))
+    return StreamingHttpResponse(content, content_type='application/x-ndjson')
+
+
 class _Lazy_tbody:
     def __init__(self, table):
         self.table = table
 
     def __html__(self):
-        return mark_safe('\n'.join([cells.__html__() for cells in self.table.cells_for_rows()]))
+        if self.table.stream and can_defer_html(self.table):
+            return defer_html(self.table, self.streamed_chunks())
+        return self.render_rows(self.table.cells_for_rows())
+
+    def render_rows(self, cells_iterable):
+        if self.table.row.cache and should_use_row_cache(self.table):
+            return render_rows_with_cache(self.table, cells_iterable)
+        return mark_safe('\n'.join([cells.__html__() for cells in cells_iterable]))
+
+    def streamed_chunks(self):
+        table = self.table
+        if table.parts.page.page_size is None:
+            # Unpaginated, so don't keep all the rows in memory
+            cells_iterable = table.stream_cells_for_rows()
+        else:
+            cells_iterable = table.cells_for_rows()
+        for i, chunk in enumerate(batched(cells_iterable, STREAM_HTML_CHUNK_SIZE)):
+            yield ('\n' if i else '') + self.render_rows(chunk)
+
+
+def should_use_row_cache(table):
+    request = table.get_request()
+    if request is None or request.method != 'GET':
+        return False
+    # The rowspans depend on the neighbouring rows
+    return not any(column.auto_rowspan for column in values(table.columns))
 
 
 def get_queryset_ordering(queryset):
@@ -1919,6 +2337,7 @@ class Meta:
     superheader: Namespace = Refinable()
     paginator: Paginator = Refinable()
     page_size: int = EvaluatedRefinable()
+    stream: bool = EvaluatedRefinable()
     actions_template: str | Template = EvaluatedRefinable()
     actions_below: bool = EvaluatedRefinable()
     tbody: Fragment = EvaluatedRefinable()
@@ -2008,6 +2427,7 @@ def post_bulk_edit(table, queryset, updates, **_):
         bulk__title=gettext_lazy('Bulk change'),
         bulk_container__call_target=Fragment,
         page_size=DEFAULT_PAGE_SIZE,
+        stream=False,
         superheader__attrs__class__superheader=True,
         superheader__template='iommi/table/header.html',
         tag='table',
@@ -2019,6 +2439,16 @@ def post_bulk_edit(table, queryset, updates, **_):
         title=MISSING,
         endpoints__tbody__func=endpoint__tbody,
         endpoints__csv__func=endpoint__csv,
+        endpoints__xlsx__func=endpoint__xlsx,
+        endpoints__parquet__func=endpoint__parquet,
+        endpoints__csv_job__func=endpoint__csv_job,
+        endpoints__csv_job__http_methods={'POST'},
+        endpoints__job_progress__func=endpoint__job_progress,
+        endpoints__job_download__func=endpoint__job_download,
+        endpoints__json__func=endpoint__json,
+        endpoints__json__include=False,
+        endpoints__ndjson__func=endpoint__ndjson,
+        endpoints__ndjson__include=False,
         query__advanced__assets__query_form_toggle_script__template = "iommi/query/form_toggle_script.html",
         query__form__attrs = {
             'data-iommi-id-of-table': lambda table, **_: table.iommi_path,
@@ -2093,6 +2523,7 @@ def on_refine_done(self):
         self.header = HeaderConfig(_name='header', **self.header).refine_done(parent=self)
         self.row = RowConfig(**self.row).refine_done(parent=self)
         self._preprocessed_rows = None
+        self._iommi_prefetched_count = None
 
         # In bind initial_rows will be used to set these 3 (in that order)
         self.sorted_rows = None
@@ -2505,6 +2936,7 @@ def auto_rowspan_style(row, rowspan_by_row=rowspan_by_row, **_):
                 if 'style' not in column.cell.attrs:
                     column.cell.attrs['style'] = {}
                 column.cell.attrs['style']['display'] = auto_rowspan_style
+                column._iommi_compiled_cell_attrs = None
 
     def _prepare_sorting(self):
         """Sort all the rows.
@@ -2617,6 +3049,80 @@ def _bind_headers(self):
     def own_evaluate_parameters(self):
         return dict(table=self)
 
+    def _prefetch_forms(self):
+        return [form for form in [self.query.form if self.query is not None else None, self.bulk] if form is not None]
+
+    def _should_prefetch_count(self):
+        # If the paginator is already bound the count is done
+        return self.page_size is not None and self._iommi_prefetched_count is None and self.visible_rows is None
+
+    def iommi_prefetches(self):
+        # The bind was skipped on a cache hit, and nothing is rendered
+        if is_fragment_cache_hit(self):
+            return []
+        result = [*super(Table, self).iommi_prefetches(), self._prefetch_rows]
+        for form in self._prefetch_forms():
+            result.extend(form.iommi_prefetches())
+        return result
+
+    def _prefetch_rows(self):
+        rows = self.sorted_and_filtered_rows
+        if not isinstance(rows, QuerySet):
+            return
+        # The page depends on the count, since the page number is clamped to the number of pages
+        if self._should_prefetch_count():
+            self._iommi_prefetched_count = rows.count()
+        visible_rows = self.get_visible_rows()
+        if isinstance(visible_rows, QuerySet):
+            fetch(visible_rows)
+
+    def iommi_async_prefetches(self):
+        if is_fragment_cache_hit(self):
+            return []
+        result = [*super(Table, self).iommi_async_prefetches(), self._aprefetch_rows]
+        for form in self._prefetch_forms():
+            result.extend(form.iommi_async_prefetches())
+        return result
+
+    async def _aprefetch_rows(self):
+        rows = self.sorted_and_filtered_rows
+        if not isinstance(rows, QuerySet):
+            return
+        if self._should_prefetch_count():
+            self._iommi_prefetched_count = await rows.acount()
+        visible_rows = self.get_visible_rows()
+        if isinstance(visible_rows, QuerySet):
+            await afetch(visible_rows)
+
+    def add_conditional_get_validators(self, validators):
+        super(Table, self).add_conditional_get_validators(validators)
+
+        config = get_conditional_get_config(self)
+        last_modified_field = config.get('last_modified_field')
+        rows = self.sorted_and_filtered_rows
+        # Without a field or an etag for when rows change, an edited row looks the same
+        if not isinstance(rows, QuerySet) or not (last_modified_field or config.get('etag') is not None):
+            return
+
+        # The SQL covers filtering and sorting, the request path covers the page
+        try:
+            sql, params = rows.query.sql_with_params()
+        except EmptyResultSet:
+            sql, params = '', ()
+        validators.add_etag(sql)
+        validators.add_etag(repr(params))
+
+        aggregates = dict(count=Count('pk'))
+        if last_modified_field:
+            aggregates['last_modified'] = Max(last_modified_field)
+        result = rows.order_by().aggregate(**aggregates)
+
+        validators.add_etag(result['count'])
+        if last_modified_field:
+            validators.add_etag(result['last_modified'])
+            validators.add_last_modified(result['last_modified'])
+
+    @timed_generator('rows')
     def cells_for_rows(self, paginate=True):
         """Yield a Cells instance for each visible row on the screen."""
         assert self._is_bound, NOT_BOUND_MESSAGE
@@ -2627,10 +3133,34 @@ def cells_for_rows(self, paginate=True):
         if not self._preprocessed_rows:
             self._preprocessed_rows = list(self.invoke_callback(self.preprocess_rows, rows=rows))
 
+        yield from self._cells_for_preprocessed_rows(self._preprocessed_rows)
+
+    @timed_generator('rows')
+    def stream_cells_for_rows(self, rows=None, start_index=0):
+        """
+        Yield a Cells instance for each row, without pagination. Unlike
+        `cells_for_rows(paginate=False)` the rows are not all kept in memory.
+        Pass `rows` to use some other rows than the sorted and filtered rows
+        of the table, and `start_index` for the `row_index` of the first of
+        them.
+        """
+        assert self._is_bound, NOT_BOUND_MESSAGE
+        if rows is None:
+            rows = self.sorted_and_filtered_rows
+        if isinstance(rows, QuerySet):
+            rows = rows.iterator(chunk_size=STREAM_CHUNK_SIZE)
+        yield from self._cells_for_preprocessed_rows(
+            self.invoke_callback(self.preprocess_rows, rows=rows),
+            start_index=start_index,
+        )
+
+    def _cells_for_preprocessed_rows(self, preprocessed_rows, start_index=0):
         row_groups = [c for c in values(self.columns) if c.row_group.include]
         row_group_values = {c._name: None for c in row_groups}
+        # noinspection PyCallingNonCallable
+        cells_prototype = self.cells_class(row=None, row_index=None, **self.row.as_dict()).refine_done(parent=self)
 
-        for i, row in enumerate(self._preprocessed_rows):
+        for i, row in enumerate(preprocessed_rows, start=start_index):
             row = self.invoke_callback(self.preprocess_row, row=row)
             assert row is not None, 'preprocess_row must return the row'
 
@@ -2642,8 +3172,7 @@ def cells_for_rows(self, paginate=True):
                     yield self.row_group_class(**column.row_group, value=v).bind(parent=self).__html__()
                 row_group_values[column._name] = v
 
-            # noinspection PyCallingNonCallable
-            yield self.cells_class(row=row, row_index=i, **self.row.as_dict()).bind(parent=self)
+            yield cells_prototype.bind_row(parent=self, row=row, row_index=i)
 
     @classmethod
     @dispatch()
@@ -2724,3 +3253,6 @@ def __html__(self, *, template=None, render=None):
 
     def as_view(self):
         return build_as_view_wrapper(self)
+
+    def as_async_view(self):
+        return build_async_as_view_wrapper(self)
@@ -66,6 +66,7 @@
     set_sql_debug,
 )
 from iommi.table import (
+    Cells,
     Column,
     DataRetrievalMethods,
     Struct,
@@ -685,6 +686,66 @@ def row__attrs__foo(table, **_):
     )
 
 
+def test_cell_attrs_are_compiled_once_per_column():
+    table = Table(
+        columns__a=Column(cell__attrs__class__static=True, cell__attrs__foo=lambda row, **_: row.a),
+        rows=[Struct(a=1), Struct(a=2)],
+    ).bind(request=req('get'))
+    column = table.columns.a
+
+    cells = list(table.cells_for_rows())
+    assert [str(cells['a'].attrs) for cells in cells] == [
+        ' class="static" foo="1"',
+        ' class="static" foo="2"',
+    ]
+    compiled = column._iommi_compiled_cell_attrs
+    assert [path for path, _ in compiled.dynamic] == [('foo',)]
+    assert compiled.matches(column.cell.attrs)
+
+    assert str(cells[0]['a'].attrs) == ' class="static" foo="1"'
+    assert column._iommi_compiled_cell_attrs is compiled
+
+
+def test_render_time_objects_have_no_instance_dict():
+    table = Table(columns__a=Column(), rows=[Struct(a=1)]).bind(request=req('get'))
+    cell = next(iter(table.cells_for_rows()))['a']
+    header = table.header_levels[0][0]
+
+    for obj in [cell, header]:
+        assert not hasattr(obj, '__dict__')
+        with pytest.raises(AttributeError):
+            obj.foo = 1
+
+    assert cell.iommi_evaluate_parameters()['bound_cell'] is cell
+    assert cell.iommi_evaluate_parameters()['value'] == 1
+
+
+def test_cells_are_refine_done_once_per_table(monkeypatch):
+    refine_done_calls = []
+    original_refine_done = Cells.refine_done
+
+    def refine_done(self, parent=None):
+        refine_done_calls.append(self)
+        return original_refine_done(self, parent=parent)
+
+    monkeypatch.setattr(Cells, 'refine_done', refine_done)
+
+    table = Table(
+        columns__a=Column(),
+        row__attrs__class__odd=lambda cells, **_: cells.row_index % 2 == 1,
+        row__attrs__foo='bar',
+        row__tag=lambda row, **_: 'tr' if row.a else 'div',
+        rows=[Struct(a=1), Struct(a=2), Struct(a=0)],
+    ).bind(request=req('get'))
+
+    cells_list = list(table.cells_for_rows())
+    assert len(refine_done_calls) == 1
+    assert [str(cells.attrs) for cells in cells_list] == [' foo="bar"', ' class="odd" foo="bar"', ' foo="bar"']
+    assert [cells.tag for cells in cells_list] == ['tr', 'tr', 'div']
+    assert [cells.iommi_evaluate_parameters()['row'].a for cells in cells_list] == [1, 2, 0]
+    assert all(cells._is_bound and cells.iommi_parent() is table for cells in cells_list)
+
+
 def test_column_presets(NoSortTable):  # noqa: N803
     class TestTable(NoSortTable):
         icon = Column.icon('some-icon')
@@ -3093,6 +3154,126 @@ def test_csv_writer_kwargs():
     )
 
 
+def json_endpoint(table, **data):
+    table = table.refine(endpoints__json__include=True, endpoints__ndjson__include=True)
+    return table.bind(request=req('get', **data)).render_to_response()
+
+
+@pytest.mark.django_db
+def test_json_endpoints_are_off_by_default():
+    TFoo.objects.create(a=1, b='foo')
+    for endpoint in ['/json', '/ndjson']:
+        response = Table(auto__model=TFoo).bind(request=req('get', **{endpoint: ''})).render_to_response()
+        assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_json_endpoint():
+    artist = Artist.objects.create(name='Black Sabbath')
+    for i in range(3):
+        Album.objects.create(name=f'Album {i}', artist=artist, year=1980 + i)
+
+    def table():
+        return Table(
+            auto__model=Album,
+            page_size=2,
+            columns__name__cell__format=lambda **_: assert_not_called(),
+            columns__year__filter__include=True,
+            columns__year__extra__json_value=lambda value, **_: f'year {value}',
+        )
+
+    def assert_not_called():
+        assert False
+
+    response = json_endpoint(table(), **{'/json': ''})
+    assert response['Content-Type'] == 'application/json'
+    assert json.loads(response.content) == {
+        'columns': ['name', 'artist', 'year', 'published_date', 'genres'],
+        'rows': [
+            {'name': 'Album 0', 'artist': artist.pk, 'year': 'year 1980', 'published_date': None, 'genres': []},
+            {'name': 'Album 1', 'artist': artist.pk, 'year': 'year 1981', 'published_date': None, 'genres': []},
+        ],
+        'page': 1,
+        'number_of_pages': 2,
+        'count': 3,
+    }
+
+    response = json_endpoint(table(), page='2', **{'/json': 'name'})
+    assert json.loads(response.content)['rows'] == [{'name': 'Album 2'}]
+
+    response = json_endpoint(table(), order='-name', year='1980', **{'/json': 'name'})
+    assert json.loads(response.content)['rows'] == [{'name': 'Album 0'}]
+
+
+@pytest.mark.django_db
+def test_json_endpoint_unknown_column():
+    response = json_endpoint(Table(auto__model=TFoo), **{'/json': 'a,nope'})
+    assert response.status_code == 400
+
+    response = json_endpoint(Table(auto__model=TFoo), **{'/ndjson': 'nope'})
+    assert response.status_code == 400
+
+
+@pytest.mark.django_db
+def test_json_endpoint_hidden_column():
+    TFoo.objects.create(a=1, b='secret')
+
+    def table():
+        return Table(
+            auto__model=TFoo,
+            columns__b__render_column=lambda user, **_: user.is_staff,
+            columns__computed=Column(cell__value=lambda row, **_: row.a * 2),
+            columns__select=Column.select(),
+        )
+
+    assert json.loads(json_endpoint(table(), **{'/json': ''}).content)['columns'] == ['a', 'computed']
+    assert json_endpoint(table(), **{'/json': 'a,b'}).status_code == 400
+    assert json_endpoint(table(), **{'/ndjson': 'b'}).status_code == 400
+    assert json_endpoint(table(), **{'/json': 'computed,select'}).status_code == 400
+    assert json.loads(json_endpoint(table(), **{'/json': 'a,computed'}).content)['rows'] == [{'a': 1, 'computed': 2}]
+
+
+@pytest.mark.django_db
+def test_ndjson_endpoint(django_assert_num_queries):
+    artist = Artist.objects.create(name='Black Sabbath')
+    for i in range(3):
+        Album.objects.create(name=f'Album {i}', artist=artist, year=1980 + i)
+
+    response = json_endpoint(Table(auto__model=Album, page_size=None), **{'/ndjson': 'name,genres'})
+    assert response['Content-Type'] == 'application/x-ndjson'
+    # genres is prefetched
+    with django_assert_num_queries(2):
+        content = b''.join(response.streaming_content).decode()
+    assert [json.loads(line) for line in content.splitlines()] == [
+        {'name': 'Album 0', 'genres': []},
+        {'name': 'Album 1', 'genres': []},
+        {'name': 'Album 2', 'genres': []},
+    ]
+
+
+@pytest.mark.django_db
+def test_ndjson_endpoint_rows_are_limited():
+    TFoo.objects.bulk_create([TFoo(a=i, b='foo') for i in range(5)])
+
+    def names(**kwargs):
+        response = json_endpoint(Table(auto__model=TFoo, **kwargs), page='2', **{'/ndjson': 'a'})
+        return [json.loads(line)['a'] for line in b''.join(response.streaming_content).decode().splitlines()]
+
+    # The current page of a paginated table
+    assert names(page_size=2) == [2, 3]
+    assert names(page_size=2, extra__ndjson_max_rows=4) == [0, 1, 2, 3]
+
+
+def test_ndjson_endpoint_with_row_groups():
+    table = Table(
+        columns__a=Column(),
+        columns__b=Column(row_group__include=True),
+        rows=[Struct(a=1, b='x'), Struct(a=2, b='y')],
+    )
+    content = b''.join(json_endpoint(table, **{'/ndjson': ''}).streaming_content).decode()
+    assert content == '{"a": 1, "b": "x"}\n{"a": 2, "b": "y"}\n'
+
+
 @pytest.mark.django_db
 def test_query_from_indexes():
     t = Table(
@@ -3,6 +3,7 @@
 import inspect
 
 from iommi.attrs import (
+    compile_attrs,
     evaluate_attrs,
 )
 from iommi.base import (
@@ -23,6 +24,10 @@
     matches,
     signature_from_kwargs,
 )
+from iommi.part_timing import (
+    part_timings_for_request,
+    timed,
+)
 from iommi.refinable import (
     EvaluatedRefinable,
     Prio,
@@ -87,6 +92,7 @@ class Traversable(RefinableObject):
     _parent = None
     _is_bound = False
     _request = None
+    _iommi_part_timings = None
     context = None
 
     iommi_style: str | Style | None = Refinable()
@@ -183,12 +189,30 @@ def on_refine_done(self, parent=None):
         attrs = getattr(self, 'attrs', None)
         if attrs:
             find_static_items_recursively(attrs)
+            compile_attrs(attrs)
 
         extra_evaluated = getattr(self, 'extra_evaluated', None)
         if extra_evaluated:
             find_static_items(extra_evaluated)
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        html = cls.__dict__.get('__html__')
+        if html is not None and not getattr(html, '_iommi_timed', False):
+            cls.__html__ = timed('render')(html)
+
     def bind(self, *, parent=None, request=None):
+        timings = parent._iommi_part_timings if parent is not None else part_timings_for_request(request)
+        if timings is None:
+            return self._bind(parent=parent, request=request, timings=None)
+
+        start = timings.start()
+        result = self._bind(parent=parent, request=request, timings=timings)
+        if result is not None:
+            timings.stop(result, 'bind', start)
+        return result
+
+    def _bind(self, *, parent, request, timings):
         assert parent is None or parent._is_bound
         assert not self._is_bound
 
@@ -212,6 +236,8 @@ def bind(self, *, parent=None, request=None):
         result._parent = parent
         result._bound_members = Struct()
         result._is_bound = True
+        if timings is not None:
+            result._iommi_part_timings = timings
 
         evaluate_parameters = {
             **(parent.iommi_evaluate_parameters() if parent is not None else {}),
@@ -242,6 +268,10 @@ def bind(self, *, parent=None, request=None):
 
         result.include = True
 
+        # A part with a cached rendering skips the rest of the bind
+        if result._bind_from_cache():
+            return result
+
         result.on_bind()
 
         # on_bind has a chance to hide itself
@@ -281,6 +311,9 @@ def bind(self, *, parent=None, request=None):
     def on_bind(self) -> None:
         pass
 
+    def _bind_from_cache(self) -> bool:
+        return False
+
     def own_evaluate_parameters(self):
         return dict(root=self.iommi_root())
 
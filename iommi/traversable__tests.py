@@ -130,6 +130,7 @@ class MyPage(Page):
         'columns/validate': 'parts/a_table/query/form/fields/columns/endpoints/validate',
         'config': 'parts/some_form/fields/fisk/endpoints/config',
         'csv': 'parts/a_table/endpoints/csv',
+        'csv_job': 'parts/a_table/endpoints/csv_job',
         'container': 'parts/a_table/container',
         'errors': 'parts/a_table/query/endpoints/errors',
         'fisk': 'parts/some_form/fields/fisk',
@@ -165,10 +166,15 @@ class MyPage(Page):
         'h_tag': 'parts/a_table/outer/children/h_tag',
         'help': 'parts/some_form/fields/fisk/help',
         'input': 'parts/some_form/fields/fisk/input',
+        'job_download': 'parts/a_table/endpoints/job_download',
+        'job_progress': 'parts/a_table/endpoints/job_progress',
+        'json': 'parts/a_table/endpoints/json',
         'label': 'parts/some_form/fields/fisk/label',
         'header': 'parts/a_table/header',
+        'ndjson': 'parts/a_table/endpoints/ndjson',
         'non_editable_input': 'parts/some_form/fields/fisk/non_editable_input',
         'outer': 'parts/a_table/outer',
+        'parquet': 'parts/a_table/endpoints/parquet',
         'outer/container': 'parts/a_table/outer/children/container',
         'outer/query': 'parts/a_table/outer/children/query',
         'page': 'parts/a_table/parts/page',
@@ -188,6 +194,7 @@ class MyPage(Page):
         'text': 'parts/a_table/container/children/text',
         'toggle': 'parts/a_table/query/advanced/toggle',
         'validate': 'parts/some_form/fields/fisk/endpoints/validate',
+        'xlsx': 'parts/a_table/endpoints/xlsx',
         'iommi_css': 'parts/a_table/query/assets/iommi_css',
     }
     assert len(actual.values()) == len(set(actual.values()))
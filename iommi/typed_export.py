@@ -0,0 +1,115 @@
+from datetime import (
+    date,
+    datetime,
+    time,
+    timedelta,
+)
+from decimal import Decimal
+from itertools import batched
+
+from django.utils import timezone
+
+try:
+    from openpyxl import Workbook
+    from openpyxl.cell import WriteOnlyCell
+except ImportError:
+    Workbook = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:
+    pyarrow = None
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+PARQUET_CONTENT_TYPE = 'application/vnd.apache.parquet'
+
+# The number of rows in each record batch of a parquet export
+PARQUET_BATCH_SIZE = 10000
+
+TYPED_VALUE_TYPES = (
+    bool,
+    int,
+    float,
+    Decimal,
+    str,
+    date,
+    time,
+    timedelta,
+)
+
+
+def typed_value(value):
+    """
+    A value as itself if both formats have a type for it, otherwise as the
+    string CSV would have.
+    """
+    if value is None or isinstance(value, TYPED_VALUE_TYPES):
+        return value
+    return str(value)
+
+
+def xlsx_value(value):
+    # Excel has no time zones, so aware datetimes are written in local time
+    if isinstance(value, datetime) and value.tzinfo is not None:
+        return timezone.localtime(value).replace(tzinfo=None)
+    return typed_value(value)
+
+
+def write_xlsx(f, *, title, header, rows, formula_column_indexes=()):
+    """
+    Write `header` and the lists in `rows` to a sheet called `title` in `f`,
+    with a write-only workbook, that only keeps the current row in memory.
+    Strings that start with `=` are written as strings, not formulas, except
+    for the columns in `formula_column_indexes`.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(title=title[:31])
+    sheet.append(header)
+    for row in rows:
+        values = []
+        for i, value in enumerate(row):
+            value = xlsx_value(value)
+            if isinstance(value, str) and value.startswith('=') and i not in formula_column_indexes:
+                value = WriteOnlyCell(sheet, value=value)
+                value.data_type = 's'
+            values.append(value)
+        sheet.append(values)
+    workbook.save(f)
+
+
+def batched_columns(rows, size):
+    """
+    Yield the `rows` in batches of at most `size` rows, each batch as a list
+    of columns.
+    """
+    for batch in batched(rows, size):
+        yield [list(column) for column in zip(*batch)]
+
+
+def write_parquet(f, *, names, column_batches):
+    """
+    Write the columns in `column_batches` to `f` as parquet, one batch at a
+    time, so only one batch is in memory. The schema is inferred by arrow from
+    the first batch, and the later batches are cast to it. A column that is
+    all `None` in the first batch is written as strings.
+    """
+    writer = None
+    try:
+        for batch in column_batches:
+            table = pyarrow.Table.from_arrays([pyarrow.array(column) for column in batch], names=names)
+            if writer is None:
+                schema = pyarrow.schema(
+                    [
+                        field.with_type(pyarrow.string()) if pyarrow.types.is_null(field.type) else field
+                        for field in table.schema
+                    ]
+                )
+                writer = pyarrow.parquet.ParquetWriter(f, schema)
+            writer.write_table(table.cast(schema))
+    finally:
+        if writer is not None:
+            writer.close()
+
+    if writer is None:
+        pyarrow.parquet.write_table(pyarrow.Table.from_arrays([pyarrow.array([]) for _ in names], names=names), f)
@@ -0,0 +1,157 @@
+from io import BytesIO
+
+import pytest
+
+from iommi import (
+    Column,
+    Table,
+)
+from iommi.struct import Struct
+from iommi.table import values_list_attrs
+from iommi.typed_export import (
+    batched_columns,
+    write_parquet,
+)
+from tests.helpers import req
+from tests.models import (
+    CSVExportTestModel,
+    TBar,
+    TFoo,
+)
+
+
+def download(table, endpoint):
+    response = table.bind(request=req('get', **{endpoint: ''})).render_to_response()
+    return response, BytesIO(b''.join(response.streaming_content))
+
+
+def test_batched_columns():
+    assert list(batched_columns([(1, 'a'), (2, 'b'), (3, 'c')], 2)) == [[[1, 2], ['a', 'b']], [[3], ['c']]]
+    assert list(batched_columns([], 2)) == []
+
+
+@pytest.mark.django_db
+def test_xlsx():
+    openpyxl = pytest.importorskip('openpyxl')
+    CSVExportTestModel.objects.create(a=1, b='a', c=2.5, d=None)
+    CSVExportTestModel.objects.create(a=2, b='b', c=3, d=7, danger='=1+1')
+
+    response, f = download(
+        Table(
+            auto__model=CSVExportTestModel,
+            columns__b__extra_evaluated__report_name='B',
+            extra__report_columns_all=True,
+            extra_evaluated__report_name='foo',
+        ),
+        '/xlsx',
+    )
+    assert response['Content-Disposition'] == "attachment; filename*=UTF-8''foo.xlsx"
+
+    sheet = openpyxl.load_workbook(f)['foo']
+    rows = list(sheet.iter_rows(values_only=True))
+    assert rows == [
+        ('a', 'B', 'c', 'd', 'danger'),
+        (1, 'a', 2.5, None, "=2+5+cmd|' /C calc'!A0"),
+        (2, 'b', 3, 7, '=1+1'),
+    ]
+    # Formulas are written as strings
+    assert sheet['E3'].data_type == 's'
+
+
+@pytest.mark.django_db
+def test_parquet_from_values_list(monkeypatch):
+    pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+    foo = TFoo.objects.create(a=3, b='foo')
+    TBar.objects.create(foo=foo, c=True)
+    TBar.objects.create(foo=foo, c=False)
+
+    def no_cells(*_, **__):
+        raise AssertionError('The report values should come from values_list')
+
+    monkeypatch.setattr('iommi.table.report_cell_value', no_cells)
+    table = Table(
+        auto__model=TBar,
+        columns__a=Column(attr='foo__a', extra_evaluated__report_name='a'),
+        columns__c__extra_evaluated__report_name='c',
+        extra_evaluated__report_name='bars',
+    )
+    response, f = download(table, '/parquet')
+    assert response['Content-Disposition'] == "attachment; filename*=UTF-8''bars.parquet"
+
+    result = pyarrow_parquet.read_table(f)
+    assert result.to_pydict() == {'c': [True, False], 'a': [3, 3]}
+    assert [str(t) for t in result.schema.types] == ['bool', 'int64']
+
+
+@pytest.mark.django_db
+def test_parquet_from_cells():
+    pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+    foo = TFoo.objects.create(a=3, b='foo')
+    TBar.objects.create(foo=foo, c=True)
+
+    table = Table(
+        auto__model=TBar,
+        columns__foo__extra_evaluated__report_name='foo',
+        columns__double=Column(
+            cell__value=lambda row, **_: row.foo.a * 2,
+            extra_evaluated__report_name='double',
+        ),
+        extra_evaluated__report_name='bars',
+    )
+    bound = table.bind(request=req('get'))
+    assert values_list_attrs(bound, [bound.columns.foo, bound.columns.double]) is None
+
+    _, f = download(table, '/parquet')
+    assert pyarrow_parquet.read_table(f).to_pydict() == {'foo': ['Foo(3, foo)'], 'double': [6]}
+
+
+def test_write_parquet_in_batches():
+    pyarrow_parquet = pytest.importorskip('pyarrow.parquet')
+    f = BytesIO()
+    write_parquet(f, names=['a', 'b'], column_batches=iter([[[None, None], [1, 2]], [['x'], [3.0]]]))
+    f.seek(0)
+    parquet_file = pyarrow_parquet.ParquetFile(f)
+    assert parquet_file.metadata.num_row_groups == 2
+    result = parquet_file.read()
+    assert result.to_pydict() == {'a': [None, None, 'x'], 'b': [1, 2, 3]}
+    assert [str(t) for t in result.schema.types] == ['string', 'int64']
+
+    f = BytesIO()
+    write_parquet(f, names=['a'], column_batches=iter([]))
+    f.seek(0)
+    assert pyarrow_parquet.read_table(f).to_pydict() == {'a': []}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize('endpoint', ['/xlsx', '/parquet'])
+def test_typed_export_without_report_is_404(endpoint):
+    pytest.importorskip('openpyxl')
+    pytest.importorskip('pyarrow')
+    response = Table(auto__model=TFoo).bind(request=req('get', **{endpoint: ''})).render_to_response()
+    assert response.status_code == 404
+
+    response = (
+        Table(auto__model=TFoo, columns__a__extra_evaluated__report_name='a')
+        .bind(request=req('get', **{endpoint: ''}))
+        .render_to_response()
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.django_db
+def test_values_list_attrs():
+    def attrs(**kwargs):
+        table = Table(auto__model=TBar, **kwargs).bind(request=req('get'))
+        return values_list_attrs(table, [table.columns.c])
+
+    assert attrs() == ['c']
+    assert attrs(columns__c__extra_evaluated__report_value=1) is None
+    assert attrs(columns__c__cell__value=lambda row, **_: row.c) is None
+    assert attrs(columns__c__attr='foo__b') == ['foo__b']
+    assert attrs(columns__c__attr='foo') is None
+    assert attrs(columns__c__attr='tbar2__pk') is None
+    assert attrs(columns__c__attr='nope') is None
+    assert attrs(preprocess_rows=lambda rows, **_: rows) is None
+
+    table = Table(columns__c=Column(), rows=[Struct(c=1)]).bind(request=req('get'))
+    assert values_list_attrs(table, [table.columns.c]) is None
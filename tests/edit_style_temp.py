@@ -0,0 +1,7 @@
+
+from iommi.style import Style
+from iommi.style_base import base
+test_edit_style = Style(
+    base,
+    Form=dict(),
+)